@@ -0,0 +1 @@
+# Paquete Benchmarks - Mediciones de rendimiento (ejecutar desde la raiz con python -m)
@@ -0,0 +1,56 @@
+# Promocion de semestre de todos los estudiantes: actualizar_muchos (una
+# pasada, indices en bloque) frente a actualizar_estudiante ID por ID.
+#
+# Uso (desde la raiz del proyecto):
+#   python -m Benchmarks.bench_actualizacion [cantidad]
+
+import sys
+import time
+from Logica.Gestor import GestorEstudiantes
+from Benchmarks.sinteticos import generar_estudiantes
+
+
+def preparar(cantidad):
+    gestor = GestorEstudiantes("Archivos/bench_actualizacion.json", cargar_automatico=False)
+    gestor.reconstruir(generar_estudiantes(cantidad))
+    # Con los índices de edad y semestre ya construidos, como tras usar las consultas
+    gestor.obtener_indice("edad")
+    gestor.obtener_indice("semestre")
+    return gestor
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    por_id = preparar(cantidad)
+    inicio = time.perf_counter()
+    ids = [est.id_estudiante for est in por_id.iterar_estudiantes() if est.semestre < 12]
+    for id_estudiante in ids:
+        por_id.actualizar_estudiante(id_estudiante, semestre=por_id.buscar_estudiante(id_estudiante).semestre + 1)
+    por_id.percentil("semestre", 50)
+    tiempo_por_id = time.perf_counter() - inicio
+
+    masivo = preparar(cantidad)
+    inicio = time.perf_counter()
+    simulados = len(masivo.actualizar_muchos(lambda est: est.semestre < 12,
+                                             {"semestre": lambda est: est.semestre + 1}, simular=True))
+    tiempo_simulacion = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    modificados = masivo.actualizar_muchos(lambda est: est.semestre < 12, {"semestre": lambda est: est.semestre + 1})
+    tiempo_masivo = time.perf_counter() - inicio
+    # El índice de semestre se descartó: se reconstruye al primer uso
+    inicio = time.perf_counter()
+    masivo.percentil("semestre", 50)
+    tiempo_indice = time.perf_counter() - inicio
+
+    total_masivo = tiempo_masivo + tiempo_indice
+    print(f"Estudiantes: {cantidad}  promovidos: {modificados} (simulación: {simulados})")
+    print(f"{'método':<34} {'segundos':>9}")
+    print(f"{'actualizar_estudiante':<34} {tiempo_por_id:>9.2f}")
+    print(f"{'actualizar_muchos':<34} {tiempo_masivo:>9.2f}")
+    print(f"{'  + reconstruir índice de semestre':<34} {total_masivo:>9.2f}   ({tiempo_por_id / total_masivo:.1f}x)")
+    print(f"{'simulación':<34} {tiempo_simulacion:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
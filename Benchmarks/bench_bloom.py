@@ -0,0 +1,58 @@
+# Busquedas de IDs que no existen con y sin el filtro de Bloom, con el
+# arbol en memoria y en modo perezoso (disco). Es la misma verificacion
+# que hace agregar_estudiante antes de dar de alta un ID nuevo.
+#
+# Uso (desde la raiz del proyecto):
+#   python -m Benchmarks.bench_bloom [cantidad] [consultas] [tasa_falsos]
+
+import os
+import random
+import sys
+import time
+from Logica.Gestor import GestorEstudiantes
+from Benchmarks.sinteticos import generar_estudiantes
+
+ARCHIVO = "Archivos/bench_bloom.json"
+
+
+def medir(funcion, valores):
+    inicio = time.perf_counter()
+    for valor in valores:
+        funcion(valor)
+    return (time.perf_counter() - inicio) / len(valores) * 1e6
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    consultas = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    tasa = float(sys.argv[3]) if len(sys.argv) > 3 else 0.01
+
+    base = GestorEstudiantes(ARCHIVO, cargar_automatico=False)
+    base.reconstruir(generar_estudiantes(cantidad))
+    base.guardar_en_json()
+    id_maximo = base.listar_estudiantes()[-1].id_estudiante
+
+    aleatorio = random.Random(11)
+    ausentes = [aleatorio.randint(id_maximo + 1, id_maximo * 10) for _ in range(consultas)]
+
+    print(f"Estudiantes: {cantidad}  consultas: {consultas}  tasa buscada: {tasa}")
+    print(f"{'modo':<10} {'filtro':<7} {'apertura s':>11} {'fallo us':>9} {'falsos pos.':>12}")
+    for perezoso in (False, True):
+        for con_filtro in (False, True):
+            # La primera apertura con filtro lo construye y lo guarda junto al JSON
+            if con_filtro and os.path.exists(ARCHIVO + ".bloom"):
+                os.remove(ARCHIVO + ".bloom")
+            GestorEstudiantes(ARCHIVO, perezoso=perezoso, filtro_bloom=con_filtro, tasa_falsos=tasa)
+
+            inicio = time.perf_counter()
+            gestor = GestorEstudiantes(ARCHIVO, perezoso=perezoso, filtro_bloom=con_filtro, tasa_falsos=tasa)
+            apertura = time.perf_counter() - inicio
+
+            fallo = medir(gestor.buscar_estudiante, ausentes)
+            falsos = sum(1 for id_estudiante in ausentes if id_estudiante in gestor._filtro) if con_filtro else 0
+            print(f"{'perezoso' if perezoso else 'memoria':<10} {'si' if con_filtro else 'no':<7} "
+                  f"{apertura:>11.2f} {fallo:>9.2f} {falsos / consultas * 100:>11.2f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# Medicion de memoria ahorrada al internar carreras (y opcionalmente nombres)
+# sobre una lista sintetica realista cargada desde JSON.
+#
+# Uso (desde la raiz del proyecto):
+#   python -m Benchmarks.bench_cadenas [cantidad]
+
+import json
+import sys
+import tracemalloc
+from Logica.Cadenas import PoolCadenas
+from Logica.Estudiante import Estudiante
+from Benchmarks.sinteticos import generar_datos
+
+
+def cargar(lineas, pool=None, internar_nombres=False):
+    """Simula la carga: cada registro se decodifica por separado, como desde el archivo."""
+    estudiantes = []
+    for linea in lineas:
+        datos = json.loads(linea)
+        est = Estudiante(datos["nombre"], datos["edad"], datos["carrera"], datos["semestre"], datos["id_estudiante"])
+        if pool is not None:
+            est.carrera, est.codigo_carrera = pool.codificar(est.carrera)
+            if internar_nombres:
+                est.nombre = pool.internar(est.nombre)
+        estudiantes.append(est)
+    return estudiantes
+
+
+def medir(lineas, **opciones):
+    tracemalloc.start()
+    estudiantes = cargar(lineas, **opciones)
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del estudiantes
+    return memoria
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    lineas = [json.dumps(d, ensure_ascii=False) for d in generar_datos(cantidad)]
+
+    sin_pool = medir(lineas)
+    con_carreras = medir(lineas, pool=PoolCadenas())
+    con_nombres = medir(lineas, pool=PoolCadenas(), internar_nombres=True)
+
+    print(f"Estudiantes: {cantidad}")
+    print(f"{'modo':<26} {'MB':>8} {'bytes/est':>10} {'ahorro':>8}")
+    for nombre, memoria in (("sin internar", sin_pool),
+                            ("carreras internadas", con_carreras),
+                            ("carreras + nombres", con_nombres)):
+        ahorro = 100 * (sin_pool - memoria) / sin_pool
+        print(f"{nombre:<26} {memoria / 1e6:>8.2f} {memoria / cantidad:>10.1f} {ahorro:>7.1f}%")
+
+
+if __name__ == "__main__":
+    main()
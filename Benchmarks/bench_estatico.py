@@ -0,0 +1,62 @@
+# Busquedas por ID en el arbol AVL frente al modo congelado (arreglos
+# ordenados): busquedas sueltas, un lote de IDs y recorridos por rango.
+#
+# Uso (desde la raiz del proyecto):
+#   python -m Benchmarks.bench_estatico [cantidad] [lote]
+
+import random
+import sys
+import time
+from Logica.Estatico import np
+from Logica.Estudiante import Estudiante
+from Logica.Gestor import GestorEstudiantes
+from Benchmarks.sinteticos import generar_estudiantes
+
+
+def medir(funcion):
+    inicio = time.perf_counter()
+    funcion()
+    return time.perf_counter() - inicio
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    lote = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+
+    gestor = GestorEstudiantes("Archivos/bench_estatico.json", cargar_automatico=False)
+    gestor.reconstruir(generar_estudiantes(cantidad))
+    id_maximo = gestor.listar_estudiantes()[-1].id_estudiante
+
+    aleatorio = random.Random(7)
+    ids = [aleatorio.randint(1, id_maximo) for _ in range(lote)]
+    rangos = [(inicio, inicio + 1000) for inicio in (aleatorio.randint(1, id_maximo) for _ in range(200))]
+
+    def consultas():
+        return {
+            "busquedas sueltas": lambda: [gestor.buscar_estudiante(i) for i in ids],
+            "buscar_muchos": lambda: gestor.buscar_muchos(ids),
+            "rangos de 1000 IDs": lambda: [gestor.buscar_rango_ids(a, b) for a, b in rangos],
+        }
+
+    arbol = {nombre: medir(funcion) for nombre, funcion in consultas().items()}
+    gestor.congelar()
+    compilacion = medir(gestor.compilar_estatico)
+    congelado = {nombre: medir(funcion) for nombre, funcion in consultas().items()}
+
+    # Agregar y quitar un estudiante corrige la copia sin recompilarla
+    def escribir():
+        for id_estudiante in range(id_maximo + 1, id_maximo + 101):
+            gestor.agregar_estudiante(Estudiante("Ana Perez", 20, "Arte", 1, id_estudiante))
+            gestor.eliminar_estudiante(id_estudiante)
+    escritura = medir(escribir) / 200
+
+    print(f"Estudiantes: {cantidad}  lote: {lote}  backend: {'numpy' if np is not None else 'array + bisect'}")
+    print(f"Compilacion: {compilacion:.2f} s  escritura con la copia compilada: {escritura * 1e3:.3f} ms")
+    print(f"{'consulta':<20} {'arbol s':>9} {'congelado s':>12} {'aceleracion':>12}")
+    for nombre in arbol:
+        print(f"{nombre:<20} {arbol[nombre]:>9.3f} {congelado[nombre]:>12.3f} "
+              f"{arbol[nombre] / congelado[nombre]:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
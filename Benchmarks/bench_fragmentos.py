@@ -0,0 +1,57 @@
+# Benchmark del gestor fragmentado: rendimiento de busquedas por nombre y
+# estadisticas segun el numero de fragmentos y de procesos trabajadores.
+#
+# Uso (desde la raiz del proyecto):
+#   python -m Benchmarks.bench_fragmentos [cantidad] [repeticiones]
+
+import shutil
+import sys
+import tempfile
+import time
+from Logica.Fragmentos import GestorFragmentado
+from Benchmarks.sinteticos import generar_estudiantes
+
+FRAGMENTOS = [1, 2, 4, 8]
+PROCESOS = [0, 2, 4]
+
+
+def medir(gestor, operacion, repeticiones):
+    """Retorna operaciones por segundo de la operacion dada."""
+    operacion()  # Calentamiento: los trabajadores cargan sus fragmentos
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        operacion()
+    return repeticiones / (time.perf_counter() - inicio)
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    estudiantes = generar_estudiantes(cantidad)
+    id_maximo = estudiantes[-1].id_estudiante + 1
+
+    print(f"Estudiantes: {cantidad}, repeticiones: {repeticiones}")
+    print(f"{'fragmentos':>10} {'procesos':>8} {'nombre/s':>10} {'stats/s':>10}")
+
+    for num_fragmentos in FRAGMENTOS:
+        directorio = tempfile.mkdtemp(prefix="fragmentos_")
+        try:
+            gestor = GestorFragmentado(directorio, num_fragmentos=num_fragmentos,
+                                       id_maximo=id_maximo, minimo_para_dividir=cantidad)
+            for est in estudiantes:
+                gestor.agregar_estudiante(est)
+            gestor.guardar_en_json()
+
+            for procesos in PROCESOS:
+                gestor.cerrar()
+                gestor.procesos = procesos
+                por_nombre = medir(gestor, lambda: gestor.buscar_por_nombre("ramírez"), repeticiones)
+                por_stats = medir(gestor, gestor.obtener_estadisticas, repeticiones)
+                print(f"{num_fragmentos:>10} {procesos:>8} {por_nombre:>10.2f} {por_stats:>10.2f}")
+            gestor.cerrar()
+        finally:
+            shutil.rmtree(directorio)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# Fusion de dos listas de estudiantes: union de arboles AVL (fusionar)
+# frente a insertar registro por registro con agregar_estudiante.
+#
+# Uso (desde la raiz del proyecto):
+#   python -m Benchmarks.bench_fusion [cantidad_base]
+
+import sys
+import time
+from Logica.Gestor import GestorEstudiantes
+from Benchmarks.sinteticos import generar_estudiantes
+
+
+def gestor_con(estudiantes):
+    gestor = GestorEstudiantes("Archivos/bench_fusion.json", cargar_automatico=False)
+    gestor.reconstruir(estudiantes)
+    return gestor
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    # IDs de la base: 1..~2n; los traslados se intercalan con otra semilla
+    base = list(generar_estudiantes(cantidad))
+
+    print(f"Estudiantes en la base: {cantidad}")
+    print(f"{'traslados':>10} {'fusionar s':>11} {'uno a uno s':>12} {'aceleracion':>12} {'conflictos':>11}")
+    for divisor in (1000, 100, 10, 2, 1):
+        m = max(1, cantidad // divisor)
+        traslados = generar_estudiantes(m, semilla=7, salto_maximo=3 * divisor)
+
+        gestor = gestor_con(base)
+        otro = gestor_con(traslados)
+        inicio = time.perf_counter()
+        reporte = gestor.fusionar(otro)
+        union = time.perf_counter() - inicio
+
+        gestor = gestor_con(base)
+        traslados = generar_estudiantes(m, semilla=7, salto_maximo=3 * divisor)
+        inicio = time.perf_counter()
+        for estudiante in traslados:
+            gestor.agregar_estudiante(estudiante)
+        uno_a_uno = time.perf_counter() - inicio
+
+        print(f"{m:>10} {union:>11.3f} {uno_a_uno:>12.3f} {uno_a_uno / union:>11.1f}x "
+              f"{len(reporte['conflictos']):>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# Recuperarse de una operacion equivocada: deshacer (inversas en O(log n))
+# frente a recargar el archivo guardado, y el costo de anotar las inversas
+# en las operaciones normales.
+#
+# Uso (desde la raiz del proyecto):
+#   python -m Benchmarks.bench_historial [cantidad] [operaciones]
+
+import gc
+import random
+import sys
+import time
+from Logica.Gestor import GestorEstudiantes
+from Logica.Estudiante import Estudiante
+from Logica.Historial import LIMITE_HISTORIAL
+from Benchmarks.sinteticos import generar_estudiantes
+
+ARCHIVO = "Archivos/bench_historial.json"
+
+
+def preparar(cantidad, limite_historial=LIMITE_HISTORIAL):
+    gestor = GestorEstudiantes(ARCHIVO, cargar_automatico=False, limite_historial=limite_historial)
+    gestor.reconstruir(generar_estudiantes(cantidad))
+    gestor.historial.vaciar()
+    # Los árboles de mediciones anteriores tienen ciclos (padre <-> hijo)
+    gc.collect()
+    return gestor
+
+
+def medir(funcion):
+    inicio = time.perf_counter()
+    funcion()
+    return time.perf_counter() - inicio
+
+
+def mutar(gestor, ids, operaciones):
+    """Mezcla de bajas, altas y actualizaciones sobre IDs existentes."""
+    aleatorio = random.Random(7)
+    for i in range(operaciones):
+        id_estudiante = aleatorio.choice(ids)
+        if i % 3 == 0:
+            gestor.eliminar_estudiante(id_estudiante)
+        elif i % 3 == 1:
+            gestor.agregar_estudiante(Estudiante("Nuevo Alumno", 20, "Medicina", 1, id_estudiante + 1))
+        else:
+            gestor.actualizar_estudiante(id_estudiante, semestre=aleatorio.randint(1, 12))
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    operaciones = int(sys.argv[2]) if len(sys.argv) > 2 else 30000
+
+    gestor = preparar(cantidad)
+    gestor.guardar_en_json()
+    ids = [est.id_estudiante for est in gestor.iterar_estudiantes()]
+
+    filas = []
+    gestor.eliminar_estudiante(ids[len(ids) // 2])
+    filas.append(("eliminar_estudiante: recargar archivo", medir(gestor.cargar_desde_json)))
+    gestor.eliminar_estudiante(ids[len(ids) // 2])
+    filas.append(("eliminar_estudiante: deshacer", medir(gestor.deshacer)))
+
+    gestor.limpiar_datos()
+    filas.append(("limpiar_datos: recargar archivo", medir(gestor.cargar_desde_json)))
+    gestor.limpiar_datos()
+    filas.append(("limpiar_datos: deshacer", medir(gestor.deshacer)))
+
+    # Importación que falla a mitad: revertir la transacción
+    lote = [Estudiante("Importado", 21, "Derecho", 2, ids[-1] + 1 + i) for i in range(operaciones)]
+    gestor.iniciar_transaccion()
+    for inicio in range(0, len(lote), 1000):
+        gestor.agregar_lote(lote[inicio:inicio + 1000])
+    filas.append((f"importación de {operaciones}: revertir", medir(gestor.revertir_transaccion)))
+
+    # Costo de anotar: las mismas operaciones sin historial, con el límite
+    # por defecto y conservando todas (más objetos vivos para el recolector)
+    tiempos = {}
+    for limite in (0, LIMITE_HISTORIAL, operaciones):
+        mutado = preparar(cantidad, limite_historial=limite)
+        tiempos[limite] = medir(lambda: mutar(mutado, ids, operaciones))
+    tiempo_deshacer = medir(lambda: [mutado.deshacer() for _ in range(operaciones)])
+
+    print(f"Estudiantes: {cantidad}  operaciones: {operaciones}")
+    print(f"{'recuperación':<40} {'ms':>10}")
+    for nombre, segundos in filas:
+        print(f"{nombre:<40} {segundos * 1e3:>10.3f}")
+    print()
+    print(f"{'operaciones mezcladas':<40} {'µs/op':>10}")
+    for limite, segundos in tiempos.items():
+        print(f"{f'limite_historial={limite}':<40} {segundos / operaciones * 1e6:>10.2f}")
+    print(f"{'deshacer cada una':<40} {tiempo_deshacer / operaciones * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Benchmark de persistencia: tamaño del archivo, tiempo de guardado y
+# tiempo de carga para cada formato (con sangria, compacto, gzip, lzma).
+#
+# Uso (desde la raiz del proyecto):
+#   python -m Benchmarks.bench_persistencia [cantidad]
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from Logica.Gestor import GestorEstudiantes
+from Benchmarks.sinteticos import generar_estudiantes
+
+FORMATOS = [
+    ("json (indent=4)", "estudiantes.json", False),
+    ("json compacto", "estudiantes.json", True),
+    ("gzip", "estudiantes.json.gz", True),
+    ("lzma", "estudiantes.json.xz", True),
+]
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    origen = GestorEstudiantes(cargar_automatico=False)
+    origen.reconstruir(generar_estudiantes(cantidad))
+
+    print(f"Estudiantes: {cantidad}")
+    print(f"{'formato':<16} {'tamaño (KB)':>12} {'guardar (s)':>12} {'cargar (s)':>11}")
+
+    directorio = tempfile.mkdtemp(prefix="persistencia_")
+    try:
+        for nombre, archivo, compacto in FORMATOS:
+            ruta = os.path.join(directorio, archivo)
+            origen.archivo_json = ruta
+
+            inicio = time.perf_counter()
+            origen.guardar_en_json(compacto=compacto)
+            tiempo_guardar = time.perf_counter() - inicio
+
+            destino = GestorEstudiantes(ruta, cargar_automatico=False)
+            inicio = time.perf_counter()
+            destino.cargar_desde_json()
+            tiempo_cargar = time.perf_counter() - inicio
+            assert destino.total_estudiantes == cantidad
+
+            tamano = os.path.getsize(ruta) / 1024
+            print(f"{nombre:<16} {tamano:>12.1f} {tiempo_guardar:>12.3f} {tiempo_cargar:>11.3f}")
+    finally:
+        shutil.rmtree(directorio)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# Latencia de autocompletar nombres con el arbol radix frente a la
+# busqueda lineal buscar_por_nombre, sobre una lista sintetica grande.
+#
+# Uso (desde la raiz del proyecto):
+#   python -m Benchmarks.bench_prefijos [cantidad] [k]
+
+import statistics
+import sys
+import time
+from Logica.Gestor import GestorEstudiantes
+from Benchmarks.sinteticos import generar_estudiantes
+
+PREFIJOS = ["j", "ma", "rod", "gar", "valen", "sofia ra", "x"]
+
+
+def latencias(funcion, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos), max(tiempos)
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    gestor = GestorEstudiantes("Archivos/bench_prefijos.json", cargar_automatico=False)
+    gestor.reconstruir(generar_estudiantes(cantidad))
+
+    inicio = time.perf_counter()
+    gestor.autocompletar("a", k)
+    construccion = time.perf_counter() - inicio
+
+    print(f"Estudiantes: {cantidad}  k={k}  construccion del indice: {construccion:.2f} s")
+    print(f"{'prefijo':<12} {'radix med ms':>13} {'radix max ms':>13} {'lineal ms':>11} {'aceleracion':>12}")
+    for prefijo in PREFIJOS:
+        mediana, maximo = latencias(lambda: gestor.autocompletar(prefijo, k), 200)
+        lineal, _ = latencias(lambda: gestor.buscar_por_nombre(prefijo), 3)
+        print(f"{prefijo!r:<12} {mediana * 1e3:>13.3f} {maximo * 1e3:>13.3f} "
+              f"{lineal * 1e3:>11.1f} {lineal / mediana:>11.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Registro de varias sedes con un presupuesto de memoria menor al total:
+# accesos con sesgo (unas pocas sedes concentran la mayoria de los pedidos),
+# tasa de aciertos del LRU y latencia de las cargas.
+#
+# Uso (desde la raiz del proyecto):
+#   python -m Benchmarks.bench_registro [sedes] [estudiantes_por_sede] [sedes_en_memoria] [pedidos]
+
+import os
+import random
+import sys
+from Logica.Estudiante import Estudiante
+from Logica.Gestor import GestorEstudiantes
+from Logica.Registro import RegistroConjuntos, BYTES_POR_ESTUDIANTE
+from Benchmarks.sinteticos import generar_estudiantes
+
+DIRECTORIO = "Archivos/registro"
+
+
+def main():
+    sedes = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    cantidad = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    en_memoria = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+    pedidos = int(sys.argv[4]) if len(sys.argv) > 4 else 300
+
+    os.makedirs(DIRECTORIO, exist_ok=True)
+    archivos = []
+    for sede in range(sedes):
+        archivo = os.path.join(DIRECTORIO, f"sede_{sede:02d}.json")
+        gestor = GestorEstudiantes(archivo, cargar_automatico=False)
+        gestor.reconstruir(generar_estudiantes(cantidad))
+        gestor.guardar_en_json(compacto=True)
+        archivos.append(archivo)
+
+    # Presupuesto para en_memoria sedes (con margen para las altas del recorrido)
+    registro = RegistroConjuntos(presupuesto_bytes=int(en_memoria * cantidad * 1.01) * BYTES_POR_ESTUDIANTE)
+    for sede, archivo in enumerate(archivos):
+        registro.registrar(f"sede_{sede:02d}", archivo)
+
+    aleatorio = random.Random(5)
+    # Pesos tipo Zipf: la sede k recibe pedidos en proporcion a 1/k
+    pesos = [1 / (k + 1) for k in range(sedes)]
+    for numero in range(pedidos):
+        sede = aleatorio.choices(range(sedes), pesos)[0]
+        gestor = registro.obtener(f"sede_{sede:02d}")
+        if aleatorio.random() < 0.05:
+            gestor.agregar_estudiante(Estudiante("Alumno Traslado", 20, "Derecho", 1, 10**9 + numero))
+        else:
+            gestor.buscar_estudiante(aleatorio.randint(1, cantidad))
+    registro.cerrar()
+
+    estadisticas = registro.estadisticas()
+    print(f"Sedes: {sedes} x {cantidad} estudiantes  en memoria: {en_memoria}  pedidos: {pedidos}")
+    print(f"Aciertos: {estadisticas['aciertos']}  fallos: {estadisticas['fallos']}  "
+          f"tasa: {estadisticas['tasa_aciertos'] * 100:.1f}%")
+    print(f"Cargas: {estadisticas['carga_ms']['cargas']}  mediana {estadisticas['carga_ms']['mediana']:.1f} ms  "
+          f"máximo {estadisticas['carga_ms']['maximo']:.1f} ms")
+    print(f"Desalojos: {estadisticas['desalojos']}  guardados antes de desalojar: {estadisticas['guardados']}")
+    print(f"Cadenas en el pool compartido: {len(registro.pool)}")
+
+
+if __name__ == "__main__":
+    main()
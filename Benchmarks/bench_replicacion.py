@@ -0,0 +1,113 @@
+# Prueba local con dos procesos: un gestor principal que publica sus
+# mutaciones y una replica que las sigue desde otro proceso. Mide el
+# retraso de la replica y verifica que al final ambas copias coinciden.
+#
+# Uso (desde la raiz del proyecto):
+#   python -m Benchmarks.bench_replicacion [cantidad_base] [mutaciones]
+
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import time
+from Logica.Comparacion import diferencias
+from Logica.Estudiante import Estudiante
+from Logica.Gestor import GestorEstudiantes
+from Logica.Replicacion import Replica, publicar_mutaciones, ruta_registro_de, ruta_rotada_de
+from Benchmarks.sinteticos import generar_estudiantes, NOMBRES, APELLIDOS, CARRERAS
+
+DIRECTORIO = "Archivos/replicacion"
+ARCHIVO = os.path.join(DIRECTORIO, "principal.json")
+ARCHIVO_REPLICA = os.path.join(DIRECTORIO, "replica.json")
+
+
+def seguir_replica(listo, detener, resultados):
+    """Proceso seguidor: arranca desde el archivo y aplica el registro."""
+    replica = Replica(ARCHIVO)
+    listo.set()
+    muestras = []
+    while not detener.is_set():
+        retraso = replica.retraso()
+        if retraso["operaciones"]:
+            muestras.append(retraso["segundos"])
+            replica.aplicar_pendientes()
+        else:
+            time.sleep(0.005)
+    replica.aplicar_pendientes()
+
+    replica.gestor.archivo_json = ARCHIVO_REPLICA
+    replica.gestor.guardar_en_json()
+    resultados.put({"muestras": muestras, "secuencia": replica.secuencia,
+                    "total": replica.gestor.total_estudiantes})
+
+
+def mutar(gestor, aleatorio, id_maximo):
+    operacion = aleatorio.random()
+    if operacion < 0.4:
+        id_estudiante = aleatorio.randint(1, id_maximo)
+        gestor.agregar_estudiante(Estudiante(
+            f"{aleatorio.choice(NOMBRES)} {aleatorio.choice(APELLIDOS)}",
+            aleatorio.randint(15, 40), aleatorio.choice(CARRERAS),
+            aleatorio.randint(1, 12), id_estudiante))
+    elif operacion < 0.75:
+        gestor.actualizar_estudiante(aleatorio.randint(1, id_maximo),
+                                     edad=aleatorio.randint(15, 40), carrera=aleatorio.choice(CARRERAS))
+    elif operacion < 0.999:
+        gestor.eliminar_estudiante(aleatorio.randint(1, id_maximo))
+    else:
+        inicio = aleatorio.randint(1, id_maximo)
+        gestor.eliminar_rango(inicio, inicio + 50)
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    mutaciones = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+
+    os.makedirs(DIRECTORIO, exist_ok=True)
+    registro = ruta_registro_de(ARCHIVO)
+    for ruta in (ARCHIVO, ARCHIVO_REPLICA, registro, ruta_rotada_de(registro)):
+        if os.path.exists(ruta):
+            os.remove(ruta)
+
+    principal = GestorEstudiantes(ARCHIVO, cargar_automatico=False)
+    principal.reconstruir(generar_estudiantes(cantidad))
+    publicar_mutaciones(principal)
+    principal.guardar_en_json()
+
+    listo = multiprocessing.Event()
+    detener = multiprocessing.Event()
+    resultados = multiprocessing.Queue()
+    seguidor = multiprocessing.Process(target=seguir_replica, args=(listo, detener, resultados))
+    seguidor.start()
+    listo.wait()
+
+    aleatorio = random.Random(3)
+    id_maximo = cantidad * 2
+    inicio = time.perf_counter()
+    for _ in range(mutaciones):
+        mutar(principal, aleatorio, id_maximo)
+    duracion = time.perf_counter() - inicio
+
+    # Dejar que la replica alcance al principal antes de detenerla
+    time.sleep(0.5)
+    detener.set()
+    resultado = resultados.get()
+    seguidor.join()
+
+    principal.guardar_en_json()
+    distintos = sum(1 for _ in diferencias(ARCHIVO, ARCHIVO_REPLICA))
+    muestras = resultado["muestras"] or [0.0]
+
+    print(f"Estudiantes iniciales: {cantidad}  mutaciones: {mutaciones}")
+    print(f"Principal: {mutaciones / duracion:,.0f} mutaciones/s, secuencia {principal.publicador.secuencia}")
+    print(f"Réplica: secuencia {resultado['secuencia']}, {resultado['total']} estudiantes "
+          f"(principal {principal.total_estudiantes})")
+    print(f"Retraso: mediana {statistics.median(muestras) * 1e3:.1f} ms, "
+          f"máximo {max(muestras) * 1e3:.1f} ms")
+    print(f"Diferencias entre principal y réplica: {distintos}")
+    principal.publicador.cerrar()
+
+
+if __name__ == "__main__":
+    main()
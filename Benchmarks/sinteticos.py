@@ -0,0 +1,37 @@
+# Generador de listas sinteticas de estudiantes para los benchmarks
+
+import random
+from Logica.Estudiante import Estudiante
+
+NOMBRES = ["Juan", "María", "Luis", "Sofía", "Carlos", "Ana", "Pedro", "Laura",
+           "Diego", "Valentina", "Andrés", "Camila", "Jorge", "Daniela", "Felipe"]
+APELLIDOS = ["Pérez", "Gómez", "Ramírez", "Rodríguez", "Hernández", "Torres",
+             "Díaz", "Martínez", "López", "García", "Sánchez", "Castro", "Rojas"]
+CARRERAS = ["Ingenieria en Sistemas", "Administracion", "Diseño Grafico", "Medicina",
+            "Derecho", "Matemáticas", "Ciencias de la Computación", "Ingeniería de Software"]
+
+
+def generar_datos(cantidad, semilla=42, id_inicial=1, salto_maximo=3):
+    """
+    Genera diccionarios de estudiantes con IDs crecientes y nombres,
+    carreras, edades y semestres realistas.
+    """
+    aleatorio = random.Random(semilla)
+    id_actual = id_inicial
+    for _ in range(cantidad):
+        yield {
+            "id_estudiante": id_actual,
+            "nombre": f"{aleatorio.choice(NOMBRES)} {aleatorio.choice(APELLIDOS)}",
+            "edad": aleatorio.randint(15, 40),
+            "carrera": aleatorio.choice(CARRERAS),
+            "semestre": aleatorio.randint(1, 12)
+        }
+        id_actual += aleatorio.randint(1, salto_maximo)
+
+
+def generar_estudiantes(cantidad, semilla=42, id_inicial=1, salto_maximo=3):
+    """Igual que generar_datos pero retorna objetos Estudiante."""
+    return [
+        Estudiante(d["nombre"], d["edad"], d["carrera"], d["semestre"], d["id_estudiante"])
+        for d in generar_datos(cantidad, semilla, id_inicial, salto_maximo)
+    ]
@@ -298,4 +298,366 @@ class NodoAVL(NodoBinario):
 
         # Se hace rebalanceo tras la eliminacion, para mantener asegurar el equilibrio AVL
         nueva_raiz = self.balancear()
-        return (nueva_raiz, True)
\ No newline at end of file
+        return (nueva_raiz, True)
+
+# --------------Clase para arboles AVL con conteo de nodos -----------------
+# Cada nodo guarda el tamaño de su subarbol, lo que permite consultas por
+# posicion (k-esimo, rango de un valor) en O(log n)
+class NodoAVLConteo(NodoAVL):
+    def __init__(self, valor):
+        super().__init__(valor)
+        self.tamano = 1  # Nodos en el subarbol con raiz en este nodo
+
+    # Las rotaciones y el balanceo llaman a este metodo, asi que el tamaño
+    # se mantiene correcto sin tocar el resto de la logica AVL
+    def actualizar_altura_balanceo(self):
+        super().actualizar_altura_balanceo()
+        tamano_izquierdo = self.hijos[0].tamano if self.hijos[0] is not None else 0
+        tamano_derecho = self.hijos[1].tamano if self.hijos[1] is not None else 0
+        self.tamano = 1 + tamano_izquierdo + tamano_derecho
+
+    # Retorna el valor en la posicion k (empezando en 0) del recorrido in-order
+    def k_esimo(self, k):
+        nodo = self
+        while nodo is not None:
+            tamano_izquierdo = nodo.hijos[0].tamano if nodo.hijos[0] is not None else 0
+            if k < tamano_izquierdo:
+                nodo = nodo.hijos[0]
+            elif k == tamano_izquierdo:
+                return nodo.valor
+            else:
+                k -= tamano_izquierdo + 1
+                nodo = nodo.hijos[1]
+        return None
+
+    # Cuenta cuantos valores del subarbol son estrictamente menores que valor
+    def contar_menores(self, valor):
+        nodo = self
+        cantidad = 0
+        while nodo is not None:
+            if nodo.valor < valor:
+                cantidad += 1 + (nodo.hijos[0].tamano if nodo.hijos[0] is not None else 0)
+                nodo = nodo.hijos[1]
+            else:
+                nodo = nodo.hijos[0]
+        return cantidad
+
+
+# --------------Construccion de arboles balanceados -----------------
+# Construye un arbol AVL perfectamente balanceado a partir de valores ya
+# ordenados, en O(n) y sin rotaciones. Retorna la raiz (o None si no hay valores)
+def construir_desde_ordenados(valores, clase_nodo=NodoAVL):
+    valores = list(valores)
+
+    def construir(inicio, fin, padre):
+        if inicio > fin:
+            return None
+        medio = (inicio + fin) // 2
+        nodo = clase_nodo(valores[medio])
+        nodo.padre = padre
+        nodo.hijos[0] = construir(inicio, medio - 1, nodo)
+        nodo.hijos[1] = construir(medio + 1, fin, nodo)
+        nodo.actualizar_altura_balanceo()
+        return nodo
+
+    return construir(0, len(valores) - 1, None)
+
+
+# --------------Union y division de arboles AVL -----------------
+# Operaciones sobre arboles completos: unir dos arboles separados por un
+# nodo y dividir un arbol por una clave, ambas en O(log n). Con ellas se
+# quitan o se extraen rangos enteros sin eliminar nodo por nodo
+def _clave(valor):
+    return valor.id_estudiante if hasattr(valor, 'id_estudiante') else valor
+
+
+def _como_raiz(nodo):
+    if nodo is not None:
+        nodo.padre = None
+    return nodo
+
+
+# Une los arboles izquierdo y derecho usando nodo como separador; todas las
+# claves de izquierdo deben ser menores que la de nodo y las de derecho mayores.
+# Baja por el borde del arbol mas alto hasta una altura parecida a la del
+# otro, cuelga ahi al nodo y rebalancea al volver: O(|diferencia de alturas|)
+def unir(izquierdo, nodo, derecho):
+    altura_izquierda = izquierdo.altura if izquierdo is not None else 0
+    altura_derecha = derecho.altura if derecho is not None else 0
+
+    if altura_izquierda > altura_derecha + 1:
+        subarbol = unir(izquierdo.hijos[1], nodo, derecho)
+        izquierdo.hijos[1] = subarbol
+        subarbol.padre = izquierdo
+        return _como_raiz(izquierdo.balancear())
+
+    if altura_derecha > altura_izquierda + 1:
+        subarbol = unir(izquierdo, nodo, derecho.hijos[0])
+        derecho.hijos[0] = subarbol
+        subarbol.padre = derecho
+        return _como_raiz(derecho.balancear())
+
+    nodo.hijos[0] = izquierdo
+    nodo.hijos[1] = derecho
+    if izquierdo is not None:
+        izquierdo.padre = nodo
+    if derecho is not None:
+        derecho.padre = nodo
+    nodo.padre = None
+    nodo.actualizar_altura_balanceo()
+    return nodo
+
+
+# Quita el nodo de menor clave; retorna (nueva raiz, nodo quitado)
+def _extraer_minimo(raiz):
+    if raiz.hijos[0] is None:
+        derecho = raiz.hijos[1]
+        raiz.hijos[1] = None
+        raiz.actualizar_altura_balanceo()
+        return _como_raiz(derecho), raiz
+
+    subarbol, minimo = _extraer_minimo(raiz.hijos[0])
+    raiz.hijos[0] = subarbol
+    if subarbol is not None:
+        subarbol.padre = raiz
+    return _como_raiz(raiz.balancear()), minimo
+
+
+# Une dos arboles sin separador (todas las claves de izquierdo menores)
+def concatenar(izquierdo, derecho):
+    if izquierdo is None:
+        return _como_raiz(derecho)
+    if derecho is None:
+        return _como_raiz(izquierdo)
+    derecho, minimo = _extraer_minimo(derecho)
+    return unir(izquierdo, minimo, derecho)
+
+
+# Divide el arbol por una clave en O(log n).
+# Retorna (arbol con claves menores, nodo con la clave o None, arbol con claves mayores)
+def dividir(raiz, clave):
+    if raiz is None:
+        return None, None, None
+
+    izquierdo, derecho = raiz.hijos
+    raiz.hijos[0] = raiz.hijos[1] = None
+    # unir() vuelve a asignar los padres; aqui solo importan los que se retornan tal cual
+    valor = raiz.valor
+    clave_raiz = valor.id_estudiante if hasattr(valor, 'id_estudiante') else valor
+    if clave == clave_raiz:
+        raiz.actualizar_altura_balanceo()
+        return _como_raiz(izquierdo), _como_raiz(raiz), _como_raiz(derecho)
+
+    if clave < clave_raiz:
+        menores, encontrado, mayores = dividir(izquierdo, clave)
+        return _como_raiz(menores), encontrado, unir(mayores, raiz, derecho)
+
+    menores, encontrado, mayores = dividir(derecho, clave)
+    return unir(izquierdo, raiz, menores), encontrado, _como_raiz(mayores)
+
+
+# Separa del arbol las claves en [minimo, maximo] en O(log n).
+# Retorna (arbol sin el rango, arbol con el rango)
+def separar_rango(raiz, minimo, maximo):
+    if raiz is None or minimo > maximo:
+        return raiz, None
+
+    menores, nodo_minimo, resto = dividir(raiz, minimo)
+    if nodo_minimo is not None:
+        resto = unir(None, nodo_minimo, resto)
+
+    rango, nodo_maximo, mayores = dividir(resto, maximo)
+    if nodo_maximo is not None:
+        rango = unir(rango, nodo_maximo, None)
+
+    return concatenar(menores, mayores), rango
+
+
+# Union de dos arboles (claves que pueden solaparse). Divide al arbol a por la
+# raiz de b y une recursivamente las mitades: O(m log(n/m + 1)) con m el
+# tamaño de b, asi que conviene que b sea el mas pequeño. En claves repetidas
+# elegir(nodo de a, nodo de b) decide cual nodo queda; por defecto el de a
+def union_arboles(a, b, elegir=None):
+    if a is None:
+        return _como_raiz(b)
+    if b is None:
+        return _como_raiz(a)
+
+    izquierdo_b, derecho_b = b.hijos
+    b.hijos[0] = b.hijos[1] = None
+    _como_raiz(izquierdo_b)
+    _como_raiz(derecho_b)
+
+    menores, repetido, mayores = dividir(a, _clave(b.valor))
+    izquierdo = union_arboles(menores, izquierdo_b, elegir)
+    derecho = union_arboles(mayores, derecho_b, elegir)
+
+    nodo = b
+    if repetido is not None:
+        nodo = elegir(repetido, b) if elegir is not None else repetido
+    return unir(izquierdo, nodo, derecho)
+
+
+# --------------Clase para arboles BK -----------------
+# Arbol metrico para busquedas aproximadas de palabras: cada hijo cuelga
+# de su padre segun la distancia de edicion entre ambos, asi una busqueda
+# con tolerancia k solo visita las ramas con distancia en [d-k, d+k]
+def distancia_edicion(a, b):
+    # Distancia de Levenshtein con dos filas de la tabla de programacion dinamica
+    if len(a) < len(b):
+        a, b = b, a
+    anterior = list(range(len(b) + 1))
+    for i, caracter_a in enumerate(a, 1):
+        actual = [i]
+        for j, caracter_b in enumerate(b, 1):
+            actual.append(min(
+                anterior[j] + 1,                               # borrar
+                actual[j - 1] + 1,                             # insertar
+                anterior[j - 1] + (caracter_a != caracter_b)   # sustituir
+            ))
+        anterior = actual
+    return anterior[-1]
+
+
+class NodoBK(Nodo):
+    def __init__(self, valor):
+        super().__init__(valor)
+        self.hijos = {}  # distancia -> NodoBK
+
+    # Inserta una palabra (iterativo); retorna False si ya estaba
+    def agregar_hijo(self, valor):
+        nodo = self
+        while True:
+            distancia = distancia_edicion(valor, nodo.valor)
+            if distancia == 0:
+                return False
+            siguiente = nodo.hijos.get(distancia)
+            if siguiente is None:
+                nuevo = NodoBK(valor)
+                nuevo.padre = nodo
+                nodo.hijos[distancia] = nuevo
+                return True
+            nodo = siguiente
+
+    # Retorna [(palabra, distancia)] de las palabras a distancia <= k,
+    # y la cantidad de distancias calculadas
+    def buscar_nodo(self, valor, k):
+        encontrados = []
+        comparaciones = 0
+        pila = [self]
+        while pila:
+            nodo = pila.pop()
+            distancia = distancia_edicion(valor, nodo.valor)
+            comparaciones += 1
+            if distancia <= k:
+                encontrados.append((nodo.valor, distancia))
+            for d in range(max(0, distancia - k), distancia + k + 1):
+                hijo = nodo.hijos.get(d)
+                if hijo is not None:
+                    pila.append(hijo)
+        return encontrados, comparaciones
+
+
+# --------------Clase para arboles radix (trie comprimido) -----------------
+# Cada arista guarda una cadena (no un solo caracter) y los nodos con un
+# unico hijo se fusionan; el valor del nodo es la etiqueta de su arista
+class NodoRadix(Nodo):
+    def __init__(self, valor=""):
+        super().__init__(valor)
+        self.hijos = {}    # primer caracter de la etiqueta -> NodoRadix
+        self.ids = None    # IDs ordenados de la palabra que termina en este nodo
+
+    # Inserta una palabra y retorna el nodo donde termina
+    def agregar_hijo(self, palabra):
+        nodo = self
+        resto = palabra
+        while resto:
+            hijo = nodo.hijos.get(resto[0])
+            if hijo is None:
+                nuevo = NodoRadix(resto)
+                nuevo.padre = nodo
+                nodo.hijos[resto[0]] = nuevo
+                return nuevo
+
+            etiqueta = hijo.valor
+            comun = 0
+            while comun < len(etiqueta) and comun < len(resto) and etiqueta[comun] == resto[comun]:
+                comun += 1
+
+            if comun < len(etiqueta):
+                # Dividir la arista: nodo -> intermedio -> hijo
+                intermedio = NodoRadix(etiqueta[:comun])
+                intermedio.padre = nodo
+                nodo.hijos[resto[0]] = intermedio
+                hijo.valor = etiqueta[comun:]
+                hijo.padre = intermedio
+                intermedio.hijos[hijo.valor[0]] = hijo
+                hijo = intermedio
+
+            nodo = hijo
+            resto = resto[comun:]
+        return nodo
+
+    # Nodo donde termina exactamente la palabra, o None
+    def buscar_nodo(self, palabra):
+        nodo = self.buscar_prefijo(palabra)
+        if nodo is None or nodo.ids is None:
+            return None
+        # El prefijo puede terminar a mitad de una arista
+        largo = 0
+        actual = nodo
+        while actual is not self:
+            largo += len(actual.valor)
+            actual = actual.padre
+        return nodo if largo == len(palabra) else None
+
+    # Nodo cuyo subarbol contiene todas las palabras que empiezan con el prefijo
+    def buscar_prefijo(self, prefijo):
+        nodo = self
+        resto = prefijo
+        while resto:
+            hijo = nodo.hijos.get(resto[0])
+            if hijo is None:
+                return None
+            etiqueta = hijo.valor
+            if len(resto) <= len(etiqueta):
+                return hijo if etiqueta.startswith(resto) else None
+            if not resto.startswith(etiqueta):
+                return None
+            resto = resto[len(etiqueta):]
+            nodo = hijo
+        return nodo
+
+    # Recorre en orden alfabetico las listas de IDs del subarbol
+    def iterar_ids(self):
+        pila = [self]
+        while pila:
+            nodo = pila.pop()
+            if nodo.ids:
+                yield nodo.ids
+            for clave in sorted(nodo.hijos, reverse=True):
+                pila.append(nodo.hijos[clave])
+
+    # Quita una palabra sin IDs y compacta el camino (poda y fusion de aristas)
+    def eliminar_nodo(self, palabra):
+        nodo = self.buscar_nodo(palabra)
+        if nodo is None:
+            return False
+        nodo.ids = None
+
+        while nodo is not self and nodo.ids is None:
+            padre = nodo.padre
+            if not nodo.hijos:
+                del padre.hijos[nodo.valor[0]]
+                nodo.padre = None
+                nodo = padre
+                continue
+            if len(nodo.hijos) == 1:
+                # Fusionar con su unico hijo
+                (hijo,) = nodo.hijos.values()
+                hijo.valor = nodo.valor + hijo.valor
+                hijo.padre = padre
+                padre.hijos[hijo.valor[0]] = hijo
+                nodo.padre = None
+            break
+        return True
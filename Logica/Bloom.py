@@ -0,0 +1,154 @@
+# Modulo del filtro de Bloom sobre los IDs de estudiantes
+# Responde "seguro que no existe" o "puede existir" sin tocar el arbol ni el
+# disco. Los IDs que no existen (altas nuevas, busquedas fallidas) se
+# descartan casi siempre con unas pocas operaciones de bits.
+#
+# El filtro se guarda junto al archivo de estudiantes (.bloom) con el tamaño
+# y la fecha del JSON del que salio, igual que el indice de la carga
+# perezosa; si el JSON cambio por fuera, el filtro se vuelve a construir.
+
+import math
+import os
+import struct
+
+MAGICO = b"AVLBLM01"
+# magico, tamaño y mtime del JSON, bits, funciones, claves, capacidad,
+# tasa de falsos positivos y bits por clave configurados (0 = segun la tasa)
+ENCABEZADO = struct.Struct("<8sqqqqqqdd")
+
+TASA_FALSOS = 0.01
+CAPACIDAD_MINIMA = 1024
+# Margen para altas antes de tener que reconstruir el filtro
+MARGEN_CAPACIDAD = 1.25
+
+_MASCARA64 = (1 << 64) - 1
+_MASCARA32 = (1 << 32) - 1
+
+
+def ruta_filtro(archivo_json):
+    """Ruta del archivo auxiliar con el filtro de Bloom."""
+    return archivo_json + ".bloom"
+
+
+def _mezclar(clave):
+    """Hash de 64 bits de un entero (splitmix64)."""
+    x = (clave + 0x9E3779B97F4A7C15) & _MASCARA64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASCARA64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASCARA64
+    return x ^ (x >> 31)
+
+
+class FiltroBloom:
+    """
+    Conjunto aproximado de enteros: sin falsos negativos y con una tasa
+    de falsos positivos acotada mientras no se supere la capacidad.
+    Las k posiciones de cada clave salen de dos mitades de un mismo hash
+    (doble hashing), asi se calcula un solo hash por consulta.
+    """
+
+    def __init__(self, capacidad, tasa_falsos=TASA_FALSOS, bits_por_clave=None):
+        """
+        Args:
+            capacidad: Claves previstas; con mas claves la tasa empeora
+            tasa_falsos: Tasa de falsos positivos buscada (p. ej. 0.01)
+            bits_por_clave: Si se indica, fija la memoria (bits por clave)
+                            en lugar de calcularla desde tasa_falsos
+        """
+        self.capacidad = max(CAPACIDAD_MINIMA, int(capacidad))
+        self.tasa_falsos = tasa_falsos
+        self.bits_por_clave = bits_por_clave
+        if bits_por_clave is not None:
+            num_bits = self.capacidad * bits_por_clave
+        else:
+            num_bits = -self.capacidad * math.log(tasa_falsos) / math.log(2) ** 2
+        # Multiplo de 8 para ocupar bytes completos
+        self.num_bits = max(8, int(math.ceil(num_bits / 8)) * 8)
+        self.funciones = max(1, round(self.num_bits / self.capacidad * math.log(2)))
+        self.bits = bytearray(self.num_bits // 8)
+        self.claves = 0
+
+    @classmethod
+    def construir(cls, claves, cantidad, tasa_falsos=TASA_FALSOS, bits_por_clave=None):
+        """Filtro con todas las claves dadas y margen para cantidad * MARGEN_CAPACIDAD."""
+        filtro = cls(cantidad * MARGEN_CAPACIDAD, tasa_falsos, bits_por_clave)
+        for clave in claves:
+            filtro.agregar(clave)
+        return filtro
+
+    def agregar(self, clave):
+        h = _mezclar(clave)
+        h1, h2 = h & _MASCARA32, (h >> 32) | 1
+        bits, num_bits = self.bits, self.num_bits
+        for i in range(self.funciones):
+            posicion = (h1 + i * h2) % num_bits
+            bits[posicion >> 3] |= 1 << (posicion & 7)
+        self.claves += 1
+
+    def __contains__(self, clave):
+        h = _mezclar(clave)
+        h1, h2 = h & _MASCARA32, (h >> 32) | 1
+        bits, num_bits = self.bits, self.num_bits
+        for i in range(self.funciones):
+            posicion = (h1 + i * h2) % num_bits
+            if not bits[posicion >> 3] & (1 << (posicion & 7)):
+                return False
+        return True
+
+    def lleno(self):
+        """True si ya tiene mas claves que su capacidad (la tasa se degrada)."""
+        return self.claves > self.capacidad
+
+    def tasa_estimada(self):
+        """Tasa de falsos positivos esperada con las claves actuales."""
+        return (1 - math.exp(-self.funciones * self.claves / self.num_bits)) ** self.funciones
+
+    def misma_configuracion(self, tasa_falsos, bits_por_clave):
+        return self.tasa_falsos == tasa_falsos and self.bits_por_clave == bits_por_clave
+
+    def guardar(self, archivo_json):
+        """Escribe el filtro junto al JSON, marcado con su tamaño y fecha actuales."""
+        info = os.stat(archivo_json)
+        temporal = ruta_filtro(archivo_json) + ".tmp"
+        with open(temporal, "wb") as archivo:
+            archivo.write(ENCABEZADO.pack(MAGICO, info.st_size, info.st_mtime_ns, self.num_bits,
+                                          self.funciones, self.claves, self.capacidad,
+                                          self.tasa_falsos, self.bits_por_clave or 0.0))
+            archivo.write(self.bits)
+        os.replace(temporal, ruta_filtro(archivo_json))
+
+    @classmethod
+    def cargar(cls, archivo_json):
+        """
+        Lee el filtro guardado junto al JSON.
+
+        Returns:
+            El FiltroBloom, o None si no existe o no corresponde al JSON actual
+        """
+        try:
+            info = os.stat(archivo_json)
+            with open(ruta_filtro(archivo_json), "rb") as archivo:
+                (magico, tamano, mtime, num_bits, funciones, claves, capacidad,
+                 tasa_falsos, bits_por_clave) = ENCABEZADO.unpack(archivo.read(ENCABEZADO.size))
+                bits = archivo.read()
+        except (OSError, struct.error):
+            return None
+        if (magico != MAGICO or tamano != info.st_size or mtime != info.st_mtime_ns
+                or len(bits) != num_bits // 8):
+            return None
+
+        filtro = cls.__new__(cls)
+        filtro.capacidad = capacidad
+        filtro.tasa_falsos = tasa_falsos
+        filtro.bits_por_clave = bits_por_clave or None
+        filtro.num_bits = num_bits
+        filtro.funciones = funciones
+        filtro.bits = bytearray(bits)
+        filtro.claves = claves
+        return filtro
+
+    def __len__(self):
+        return self.claves
+
+    def __repr__(self):
+        return (f"FiltroBloom(claves={self.claves}, capacidad={self.capacidad}, "
+                f"bytes={len(self.bits)}, funciones={self.funciones})")
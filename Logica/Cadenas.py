@@ -0,0 +1,90 @@
+# Modulo de cadenas compartidas (interning) para los datos de estudiantes
+# Muchos estudiantes comparten la misma carrera (y a veces el mismo nombre):
+# el pool guarda una sola copia de cada texto y asigna codigos enteros
+# a las carreras para agrupar y comparar sin tocar los strings.
+
+import unicodedata
+
+
+def normalizar(texto):
+    """
+    Normaliza un texto para comparaciones: descompone los caracteres (NFKD),
+    quita las marcas combinantes (tildes, diéresis) y pasa a minúsculas.
+    Así "Ramírez" y "RAMIREZ" quedan iguales.
+    """
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in descompuesto if not unicodedata.combining(c)).casefold()
+
+
+def tokens(texto):
+    """Palabras normalizadas de un texto."""
+    return normalizar(texto).split()
+
+
+class PoolCadenas:
+    """
+    Pool de strings internados con codificación categórica.
+    Un mismo pool puede compartirse entre varios gestores.
+    """
+
+    def __init__(self):
+        self._cadenas = {}      # texto -> copia canonica
+        self._codigos = {}      # categoria -> codigo entero
+        self._categorias = []   # codigo -> categoria
+
+    def internar(self, texto):
+        """Retorna la copia canónica del texto (la misma instancia para textos iguales)."""
+        canonico = self._cadenas.get(texto)
+        if canonico is None:
+            self._cadenas[texto] = texto
+            canonico = texto
+        return canonico
+
+    def codificar(self, categoria):
+        """
+        Interna la categoría y retorna su código entero.
+
+        Returns:
+            Tupla (texto_canonico, codigo)
+        """
+        codigo = self._codigos.get(categoria)
+        if codigo is None:
+            categoria = self.internar(categoria)
+            codigo = len(self._categorias)
+            self._codigos[categoria] = codigo
+            self._categorias.append(categoria)
+            return categoria, codigo
+        return self._categorias[codigo], codigo
+
+    def categoria(self, codigo):
+        """Texto de la categoría con el código dado."""
+        return self._categorias[codigo]
+
+    def codigo(self, categoria):
+        """Código de una categoría ya registrada, o None."""
+        return self._codigos.get(categoria)
+
+    def descartar(self, textos):
+        """
+        Quita textos del pool, salvo las categorías: sus códigos pueden
+        seguir en uso. Los estudiantes que ya tienen esos textos no cambian;
+        solo dejan de compartirse con los que se internen después.
+
+        Returns:
+            Cantidad de textos quitados
+        """
+        quitados = 0
+        for texto in textos:
+            if texto not in self._codigos and self._cadenas.pop(texto, None) is not None:
+                quitados += 1
+        return quitados
+
+    @property
+    def num_categorias(self):
+        return len(self._categorias)
+
+    def __len__(self):
+        return len(self._cadenas)
+
+    def __repr__(self):
+        return f"PoolCadenas(cadenas={len(self._cadenas)}, categorias={len(self._categorias)})"
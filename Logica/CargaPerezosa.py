@@ -0,0 +1,173 @@
+# Modulo de carga perezosa del archivo de estudiantes
+# En lugar de construir el arbol completo al abrir, se usa un indice
+# compacto ID -> posicion en bytes del registro dentro del JSON. Los
+# estudiantes se leen del disco solo cuando se consultan.
+
+import json
+import mmap
+import os
+import struct
+from collections import OrderedDict
+from Logica.Persistencia import codec_de, iterar_registros
+from Logica.Validacion import validar_registro
+
+# Archivo auxiliar: encabezado + registros de tamaño fijo ordenados por ID
+# (version 02: solo registros validos, con las reglas de la carga normal)
+MAGICO = b"AVLIDX02"
+ENCABEZADO = struct.Struct("<8sqqq")   # magico, tamaño y mtime del JSON, cantidad
+REGISTRO = struct.Struct("<qqI")       # id, posicion, longitud
+
+CAPACIDAD_CACHE = 10000
+
+
+def ruta_indice(archivo_json):
+    """Ruta del archivo auxiliar con el indice de posiciones."""
+    return archivo_json + ".idx"
+
+
+class IndicePosiciones:
+    """
+    Indice de solo lectura ID -> (posicion, longitud) sobre un archivo JSON
+    sin comprimir. El indice se guarda en un archivo auxiliar (.idx) y se
+    consulta con mmap y busqueda binaria, sin cargarlo en memoria; asi el
+    tiempo de apertura no depende de la cantidad de estudiantes.
+    """
+
+    def __init__(self, archivo_json, capacidad_cache=CAPACIDAD_CACHE, al_leer=None):
+        """
+        Args:
+            archivo_json: Archivo de estudiantes (.json sin compresion)
+            capacidad_cache: Maximo de estudiantes deserializados en memoria
+            al_leer: Funcion opcional que recibe cada estudiante recien leido
+                     (el gestor la usa para internar sus textos)
+        """
+        if codec_de(archivo_json) != "ninguno":
+            raise ValueError("La carga perezosa requiere un archivo .json sin compresión")
+
+        self.archivo_json = archivo_json
+        self.capacidad_cache = capacidad_cache
+        self.al_leer = al_leer
+        self.cache = OrderedDict()
+        self.aciertos = 0
+        self.lecturas = 0
+
+        info = os.stat(archivo_json)
+        if not self._indice_vigente(info):
+            self._construir_indice(info)
+
+        self._archivo_indice = open(ruta_indice(archivo_json), "rb")
+        self._mapa = mmap.mmap(self._archivo_indice.fileno(), 0, access=mmap.ACCESS_READ)
+        self.cantidad = ENCABEZADO.unpack_from(self._mapa, 0)[3]
+        self._datos = open(archivo_json, "rb")
+
+    def _indice_vigente(self, info):
+        """El indice auxiliar sirve si corresponde al tamaño y fecha actuales del JSON."""
+        ruta = ruta_indice(self.archivo_json)
+        try:
+            with open(ruta, "rb") as archivo:
+                magico, tamano, mtime, cantidad = ENCABEZADO.unpack(archivo.read(ENCABEZADO.size))
+            return (magico == MAGICO and tamano == info.st_size and mtime == info.st_mtime_ns
+                    and os.path.getsize(ruta) == ENCABEZADO.size + cantidad * REGISTRO.size)
+        except (OSError, struct.error):
+            return False
+
+    def _construir_indice(self, info):
+        """
+        Recorre el JSON una vez y escribe el indice auxiliar ordenado por ID.
+        Igual que la carga normal (validar_registros): los registros invalidos
+        se omiten y ante IDs repetidos se conserva la primera aparicion valida.
+        """
+        posiciones = {}
+        for registro, inicio, longitud in iterar_registros(self.archivo_json, con_posiciones=True):
+            estudiante, error = validar_registro(registro)
+            if error is None and estudiante.id_estudiante not in posiciones:
+                posiciones[estudiante.id_estudiante] = (inicio, longitud)
+
+        temporal = ruta_indice(self.archivo_json) + ".tmp"
+        with open(temporal, "wb") as archivo:
+            archivo.write(ENCABEZADO.pack(MAGICO, info.st_size, info.st_mtime_ns, len(posiciones)))
+            for id_estudiante in sorted(posiciones):
+                inicio, longitud = posiciones[id_estudiante]
+                archivo.write(REGISTRO.pack(id_estudiante, inicio, longitud))
+        os.replace(temporal, ruta_indice(self.archivo_json))
+
+    def __len__(self):
+        return self.cantidad
+
+    def _registro(self, posicion):
+        return REGISTRO.unpack_from(self._mapa, ENCABEZADO.size + posicion * REGISTRO.size)
+
+    def _leer(self, id_estudiante, inicio, longitud):
+        """Deserializa un estudiante (o lo toma de la cache LRU)."""
+        estudiante = self.cache.get(id_estudiante)
+        if estudiante is not None:
+            self.cache.move_to_end(id_estudiante)
+            self.aciertos += 1
+            return estudiante
+
+        self._datos.seek(inicio)
+        # El registro ya se valido al construir el indice; se vuelve a pasar
+        # por el validador para normalizarlo igual que la carga normal
+        estudiante, error = validar_registro(json.loads(self._datos.read(longitud)))
+        self.lecturas += 1
+        if error is not None:
+            raise ValueError(f"El registro {id_estudiante} cambió desde que se construyó el índice: {error}")
+        if self.al_leer is not None:
+            self.al_leer(estudiante)
+
+        self.cache[id_estudiante] = estudiante
+        if len(self.cache) > self.capacidad_cache:
+            self.cache.popitem(last=False)
+        return estudiante
+
+    def buscar(self, id_estudiante):
+        """
+        Busqueda binaria en el indice auxiliar.
+
+        Returns:
+            Tupla (estudiante o None, pasos)
+        """
+        inicio, fin = 0, self.cantidad - 1
+        pasos = 0
+        while inicio <= fin:
+            medio = (inicio + fin) // 2
+            pasos += 1
+            id_medio, posicion, longitud = self._registro(medio)
+            if id_medio == id_estudiante:
+                return self._leer(id_medio, posicion, longitud), pasos
+            if id_estudiante < id_medio:
+                fin = medio - 1
+            else:
+                inicio = medio + 1
+        return None, pasos
+
+    def ids(self):
+        """IDs en orden, leidos del indice auxiliar sin deserializar estudiantes."""
+        for posicion in range(self.cantidad):
+            yield self._registro(posicion)[0]
+
+    def iterar(self, despues_de=None):
+        """
+        Recorre los estudiantes en orden de ID.
+
+        Args:
+            despues_de: Si se indica, empieza en el primer ID mayor a este
+                        (busqueda binaria, sin recorrer los anteriores)
+        """
+        inicio = 0
+        if despues_de is not None:
+            fin = self.cantidad
+            while inicio < fin:
+                medio = (inicio + fin) // 2
+                if self._registro(medio)[0] <= despues_de:
+                    inicio = medio + 1
+                else:
+                    fin = medio
+        for posicion in range(inicio, self.cantidad):
+            yield self._leer(*self._registro(posicion))
+
+    def cerrar(self):
+        self._mapa.close()
+        self._archivo_indice.close()
+        self._datos.close()
+        self.cache.clear()
@@ -0,0 +1,142 @@
+# Modulo de comparacion de instantaneas de estudiantes
+# Compara dos listas ordenadas por ID con un recorrido de mezcla (merge-join):
+# solo se mantiene en memoria un registro de cada lado, sin importar el tamaño.
+#
+# Uso (desde la raiz del proyecto):
+#   python -m Logica.Comparacion antes.json despues.json [salida.ndjson]
+
+import json
+import sys
+from Logica.Persistencia import iterar_registros
+from Logica.Validacion import CAMPOS
+
+AGREGADO = "agregado"
+ELIMINADO = "eliminado"
+MODIFICADO = "modificado"
+
+
+def iterar_instantanea(fuente):
+    """
+    Recorre una instantanea como diccionarios en orden de ID.
+
+    Args:
+        fuente: Ruta de un archivo de estudiantes (.json, .json.gz, .json.xz),
+                un GestorEstudiantes (se usa su recorrido in-order) o cualquier
+                iterable de diccionarios o de objetos Estudiante
+    """
+    if isinstance(fuente, str):
+        registros = iterar_registros(fuente)
+    elif hasattr(fuente, "iterar_estudiantes"):
+        registros = fuente.iterar_estudiantes()
+    else:
+        registros = fuente
+
+    anterior = None
+    for registro in registros:
+        if not isinstance(registro, dict):
+            registro = registro.to_dict()
+        id_estudiante = registro["id_estudiante"]
+        if anterior is not None and id_estudiante <= anterior:
+            raise ValueError(f"La instantánea no está ordenada por ID (ID {id_estudiante} después de {anterior})")
+        anterior = id_estudiante
+        yield registro
+
+
+def cambios_de_campos(antes, despues):
+    """Campos que cambiaron entre dos registros: {campo: [antes, despues]}."""
+    cambios = {}
+    campos = list(CAMPOS) + sorted((antes.keys() | despues.keys()) - set(CAMPOS))
+    for campo in campos:
+        if campo == "id_estudiante":
+            continue
+        valor_antes = antes.get(campo)
+        valor_despues = despues.get(campo)
+        if valor_antes != valor_despues:
+            cambios[campo] = [valor_antes, valor_despues]
+    return cambios
+
+
+def diferencias(antes, despues, resumen=None):
+    """
+    Recorre las dos instantaneas a la vez y produce sus diferencias.
+
+    Args:
+        antes: Instantanea anterior (ver iterar_instantanea)
+        despues: Instantanea nueva
+        resumen: Diccionario opcional que se llena con la cantidad de
+                 agregados, eliminados, modificados e iguales
+
+    Yields:
+        Diccionarios con "tipo" (agregado, eliminado o modificado),
+        "id_estudiante" y el estudiante o los campos que cambiaron
+    """
+    conteo = {AGREGADO: 0, ELIMINADO: 0, MODIFICADO: 0, "igual": 0}
+    izquierda = iterar_instantanea(antes)
+    derecha = iterar_instantanea(despues)
+    registro_antes = next(izquierda, None)
+    registro_despues = next(derecha, None)
+
+    while registro_antes is not None or registro_despues is not None:
+        if registro_despues is None or (registro_antes is not None and
+                                        registro_antes["id_estudiante"] < registro_despues["id_estudiante"]):
+            conteo[ELIMINADO] += 1
+            yield {"tipo": ELIMINADO, "id_estudiante": registro_antes["id_estudiante"], "estudiante": registro_antes}
+            registro_antes = next(izquierda, None)
+
+        elif registro_antes is None or registro_despues["id_estudiante"] < registro_antes["id_estudiante"]:
+            conteo[AGREGADO] += 1
+            yield {"tipo": AGREGADO, "id_estudiante": registro_despues["id_estudiante"], "estudiante": registro_despues}
+            registro_despues = next(derecha, None)
+
+        else:
+            cambios = cambios_de_campos(registro_antes, registro_despues)
+            if cambios:
+                conteo[MODIFICADO] += 1
+                yield {"tipo": MODIFICADO, "id_estudiante": registro_antes["id_estudiante"], "cambios": cambios}
+            else:
+                conteo["igual"] += 1
+            registro_antes = next(izquierda, None)
+            registro_despues = next(derecha, None)
+
+    if resumen is not None:
+        resumen.update(conteo)
+
+
+def escribir_diferencias(antes, despues, salida):
+    """
+    Escribe las diferencias como NDJSON (un cambio por linea).
+
+    Args:
+        antes: Instantanea anterior
+        despues: Instantanea nueva
+        salida: Ruta del archivo destino o un archivo de texto abierto
+
+    Returns:
+        Resumen con la cantidad de agregados, eliminados, modificados e iguales
+    """
+    resumen = {}
+    if isinstance(salida, str):
+        with open(salida, "w", encoding="utf-8") as archivo:
+            return escribir_diferencias(antes, despues, archivo)
+
+    for diferencia in diferencias(antes, despues, resumen):
+        salida.write(json.dumps(diferencia, ensure_ascii=False))
+        salida.write("\n")
+    return resumen
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("Uso: python -m Logica.Comparacion antes.json despues.json [salida.ndjson]")
+        sys.exit(2)
+
+    if len(sys.argv) > 3:
+        resumen = escribir_diferencias(sys.argv[1], sys.argv[2], sys.argv[3])
+    else:
+        resumen = escribir_diferencias(sys.argv[1], sys.argv[2], sys.stdout)
+
+    print(" ".join(f"{clave}={valor}" for clave, valor in resumen.items()), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
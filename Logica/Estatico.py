@@ -0,0 +1,155 @@
+# Modulo del indice estatico (modo congelado)
+# Compila el arbol en arreglos ordenados por ID: las busquedas son busquedas
+# binarias sobre memoria contigua, sin recorrer nodos. Si NumPy esta
+# instalado se usa np.searchsorted (tambien para lotes de IDs en una sola
+# llamada); si no, arreglos del modulo array con bisect.
+#
+# Las escrituras de un estudiante se aplican sobre los arreglos en lugar de
+# recompilarlos: insertar o eliminar desplaza memoria contigua (O(n), pero
+# sin recorrer nodos ni crear objetos) y actualizar solo cambia una posicion.
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+# Columnas numericas que se compilan junto a los IDs
+COLUMNAS = ("edad", "semestre", "codigo_carrera")
+
+
+class IndiceEstatico:
+    """
+    Copia de solo lectura del arbol: IDs ordenados, columnas numericas
+    alineadas con ellos y la lista de estudiantes en el mismo orden.
+    """
+
+    def __init__(self, estudiantes):
+        """
+        Args:
+            estudiantes: Estudiantes ordenados por ID (p. ej. el recorrido in-order)
+        """
+        self.estudiantes = list(estudiantes)
+        self.usa_numpy = np is not None
+        ids = [est.id_estudiante for est in self.estudiantes]
+        columnas = {campo: [getattr(est, campo) or 0 for est in self.estudiantes] for campo in COLUMNAS}
+
+        if self.usa_numpy:
+            self.ids = np.array(ids, dtype=np.int64)
+            self.columnas = {campo: np.array(valores, dtype=np.int32) for campo, valores in columnas.items()}
+        else:
+            self.ids = array("q", ids)
+            self.columnas = {campo: array("l", valores) for campo, valores in columnas.items()}
+
+    def __len__(self):
+        return len(self.estudiantes)
+
+    def posicion(self, id_estudiante):
+        """Posicion del ID en los arreglos, o None si no esta."""
+        if self.usa_numpy:
+            posicion = int(np.searchsorted(self.ids, id_estudiante))
+        else:
+            posicion = bisect_left(self.ids, id_estudiante)
+        if posicion < len(self.ids) and self.ids[posicion] == id_estudiante:
+            return posicion
+        return None
+
+    def insertar(self, estudiante):
+        """Agrega un estudiante nuevo en la posicion de su ID."""
+        id_estudiante = estudiante.id_estudiante
+        if self.usa_numpy:
+            posicion = int(np.searchsorted(self.ids, id_estudiante))
+            self.ids = np.insert(self.ids, posicion, id_estudiante)
+            for campo in COLUMNAS:
+                self.columnas[campo] = np.insert(self.columnas[campo], posicion, getattr(estudiante, campo) or 0)
+        else:
+            posicion = bisect_left(self.ids, id_estudiante)
+            self.ids.insert(posicion, id_estudiante)
+            for campo in COLUMNAS:
+                self.columnas[campo].insert(posicion, getattr(estudiante, campo) or 0)
+        self.estudiantes.insert(posicion, estudiante)
+
+    def eliminar(self, id_estudiante):
+        """
+        Quita un estudiante por su ID.
+
+        Returns:
+            True si estaba, False si no
+        """
+        posicion = self.posicion(id_estudiante)
+        if posicion is None:
+            return False
+        if self.usa_numpy:
+            self.ids = np.delete(self.ids, posicion)
+            for campo in COLUMNAS:
+                self.columnas[campo] = np.delete(self.columnas[campo], posicion)
+        else:
+            del self.ids[posicion]
+            for campo in COLUMNAS:
+                del self.columnas[campo][posicion]
+        del self.estudiantes[posicion]
+        return True
+
+    def actualizar(self, estudiante):
+        """
+        Copia a las columnas los valores actuales de un estudiante ya
+        compilado (el objeto de la lista es el mismo que se modifico).
+        """
+        posicion = self.posicion(estudiante.id_estudiante)
+        if posicion is not None:
+            for campo in COLUMNAS:
+                self.columnas[campo][posicion] = getattr(estudiante, campo) or 0
+
+    def buscar(self, id_estudiante):
+        posicion = self.posicion(id_estudiante)
+        return self.estudiantes[posicion] if posicion is not None else None
+
+    def buscar_muchos(self, ids):
+        """
+        Busca muchos IDs a la vez.
+
+        Returns:
+            Lista alineada con ids: el estudiante o None si no existe
+        """
+        if not self.usa_numpy:
+            return [self.buscar(id_estudiante) for id_estudiante in ids]
+
+        if not len(self.ids):
+            return [None] * len(ids)
+        buscados = np.asarray(ids, dtype=np.int64)
+        # Una sola busqueda binaria vectorizada para todo el lote
+        posiciones = np.searchsorted(self.ids, buscados)
+        np.minimum(posiciones, len(self.ids) - 1, out=posiciones)
+        encontrados = self.ids[posiciones] == buscados
+        estudiantes = self.estudiantes
+        return [estudiantes[posicion] if encontrado else None
+                for posicion, encontrado in zip(posiciones.tolist(), encontrados.tolist())]
+
+    def limites(self, id_min, id_max):
+        """Posiciones [inicio, fin) de los IDs en [id_min, id_max]."""
+        if self.usa_numpy:
+            inicio = int(np.searchsorted(self.ids, id_min, side="left"))
+            fin = int(np.searchsorted(self.ids, id_max, side="right"))
+        else:
+            inicio = bisect_left(self.ids, id_min)
+            fin = bisect_right(self.ids, id_max)
+        return inicio, max(inicio, fin)
+
+    def rango(self, id_min, id_max):
+        """Estudiantes con ID en [id_min, id_max]: una rebanada de la lista."""
+        inicio, fin = self.limites(id_min, id_max)
+        return self.estudiantes[inicio:fin]
+
+    def columna(self, campo, id_min=None, id_max=None):
+        """
+        Arreglo de una columna numerica, completo o para un rango de IDs
+        (una vista sin copiar con NumPy), util para calculos vectorizados.
+        """
+        datos = self.columnas[campo]
+        if id_min is None and id_max is None:
+            return datos
+        inicio, fin = self.limites(float("-inf") if id_min is None else id_min,
+                                   float("inf") if id_max is None else id_max)
+        return datos[inicio:fin]
@@ -1,12 +1,17 @@
 # Clase de la informacion del estudiante
 
 class Estudiante:
+    # Sin __dict__ por instancia: ahorra memoria con muchos estudiantes
+    __slots__ = ("nombre", "edad", "carrera", "semestre", "id_estudiante", "codigo_carrera")
+
     def __init__(self, nombre, edad, carrera, semestre, id_estudiante):
         self.nombre = nombre
         self.edad = edad
         self.carrera = carrera
         self.semestre = semestre
         self.id_estudiante = id_estudiante
+        # Código categórico de la carrera, asignado por el gestor (ver PoolCadenas)
+        self.codigo_carrera = None
 
     def __repr__(self):
         return f"Estudiante(ID: {self.id_estudiante}, Nombre: {self.nombre}, Edad: {self.edad}, Carrera: {self.carrera}, Semestre: {self.semestre})"
@@ -0,0 +1,395 @@
+# Modulo de fragmentacion (sharding) del gestor de estudiantes
+# Reparte a los estudiantes por rangos de ID entre varios GestorEstudiantes,
+# cada uno con su propio arbol AVL y su propio archivo JSON.
+
+import json
+import os
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from Logica.Gestor import GestorEstudiantes
+
+ARCHIVO_METADATOS = "fragmentos.json"
+
+# Cache de cada proceso trabajador: archivo -> (version, gestor)
+# Cada fragmento se asigna siempre al mismo trabajador, que lo carga la
+# primera vez que lo necesita y lo reutiliza mientras su version no cambie;
+# asi entre todos los trabajadores hay una sola copia de los datos. La
+# version es un contador que GestorFragmentado avanza cada vez que guarda
+# el fragmento (la fecha del archivo no alcanza: en algunos sistemas de
+# archivos tiene poca resolucion y una reescritura del mismo tamaño pasaria
+# desapercibida).
+_cache_trabajador = {}
+
+
+def _consultar_gestor(gestor, operacion, argumento):
+    """Ejecuta una operacion de lectura sobre un fragmento."""
+    if operacion == "nombre":
+        return gestor.buscar_por_nombre(argumento)
+    if operacion == "carrera":
+        return gestor.buscar_por_carrera(argumento)
+    if operacion == "estadisticas":
+        # Sumas en bruto para poder combinar los promedios sin perder precision
+        estudiantes = gestor.listar_estudiantes()
+        carreras = {}
+        for est in estudiantes:
+            carreras[est.carrera] = carreras.get(est.carrera, 0) + 1
+        return {
+            "total": len(estudiantes),
+            "suma_edades": sum(est.edad for est in estudiantes),
+            "carreras": carreras
+        }
+    raise ValueError(f"Operación desconocida: {operacion}")
+
+
+def _tarea_fragmento(archivo, version, operacion, argumento, asignados):
+    """
+    Punto de entrada de los procesos trabajadores.
+    Recarga el fragmento solo si su version cambio, y descarta
+    los que ya no estan asignados a este trabajador (tras dividir o
+    rebalancear).
+    """
+    for otro in [otro for otro in _cache_trabajador if otro not in asignados]:
+        del _cache_trabajador[otro]
+    en_cache = _cache_trabajador.get(archivo)
+    if en_cache is None or en_cache[0] != version:
+        en_cache = (version, GestorEstudiantes(archivo, cargar_automatico=True, limite_historial=0))
+        _cache_trabajador[archivo] = en_cache
+    return _consultar_gestor(en_cache[1], operacion, argumento)
+
+
+class GestorFragmentado:
+    def __init__(self, directorio="Archivos/fragmentos", num_fragmentos=4, id_maximo=1000000,
+                 procesos=0, factor_desbalance=2.0, minimo_para_dividir=1000):
+        """
+        Inicializa el gestor fragmentado. Si el directorio ya contiene
+        fragmentos, se cargan con sus límites; si no, se crean num_fragmentos
+        fragmentos vacíos con rangos de ID del mismo ancho.
+
+        Args:
+            directorio: Carpeta donde se guardan los fragmentos y sus metadatos
+            num_fragmentos: Número inicial de fragmentos
+            id_maximo: ID máximo esperado, usado para repartir los rangos iniciales
+            procesos: Procesos trabajadores para las consultas en paralelo
+                      (0 = se ejecutan en este mismo proceso); el fragmento i
+                      lo atiende siempre el trabajador i % procesos
+            factor_desbalance: Un fragmento se divide cuando supera este
+                               múltiplo del tamaño promedio, y se une con un
+                               vecino cuando queda por debajo del promedio
+                               dividido por este factor
+            minimo_para_dividir: Tamaño mínimo de un fragmento para dividirlo
+        """
+        if num_fragmentos < 1:
+            raise ValueError("Debe haber al menos un fragmento")
+
+        self.directorio = directorio
+        self.procesos = procesos
+        self.factor_desbalance = factor_desbalance
+        self.minimo_para_dividir = minimo_para_dividir
+        # Un ejecutor de un solo proceso por trabajador, para poder elegir
+        # a cual va cada fragmento
+        self._trabajadores = None
+        # archivo -> version del fragmento que ven los trabajadores
+        self._versiones = {}
+
+        if not os.path.exists(directorio):
+            os.makedirs(directorio)
+
+        ruta_metadatos = os.path.join(directorio, ARCHIVO_METADATOS)
+        if os.path.exists(ruta_metadatos):
+            with open(ruta_metadatos, 'r', encoding='utf-8') as archivo:
+                metadatos = json.load(archivo)
+            self.limites = metadatos["limites"]
+            self._siguiente_archivo = metadatos["siguiente_archivo"]
+            # Sin historial: al dividir un fragmento se reconstruye y el
+            # historial retendría el árbol anterior completo
+            self.fragmentos = [
+                GestorEstudiantes(os.path.join(directorio, nombre), cargar_automatico=True,
+                                  limite_historial=0)
+                for nombre in metadatos["archivos"]
+            ]
+        else:
+            # limites[i] es el primer ID del fragmento i+1
+            ancho = max(1, id_maximo // num_fragmentos)
+            self.limites = [ancho * (i + 1) for i in range(num_fragmentos - 1)]
+            self._siguiente_archivo = 0
+            self.fragmentos = [self._nuevo_fragmento() for _ in range(num_fragmentos)]
+            self._guardar_metadatos()
+
+        # Fragmentos con cambios que aun no se escriben a disco
+        self._modificados = set()
+
+    # ---------------- Administracion de fragmentos ----------------
+
+    def _nuevo_fragmento(self):
+        nombre = f"fragmento_{self._siguiente_archivo:03d}.json"
+        self._siguiente_archivo += 1
+        return GestorEstudiantes(os.path.join(self.directorio, nombre), cargar_automatico=False,
+                                 limite_historial=0)
+
+    def _guardar_metadatos(self):
+        metadatos = {
+            "limites": self.limites,
+            "siguiente_archivo": self._siguiente_archivo,
+            "archivos": [os.path.basename(f.archivo_json) for f in self.fragmentos]
+        }
+        with open(os.path.join(self.directorio, ARCHIVO_METADATOS), 'w', encoding='utf-8') as archivo:
+            json.dump(metadatos, archivo, indent=4)
+
+    def _indice_fragmento(self, id_estudiante):
+        return bisect_right(self.limites, id_estudiante)
+
+    def fragmento_de(self, id_estudiante):
+        """Retorna el GestorEstudiantes responsable del ID dado."""
+        return self.fragmentos[self._indice_fragmento(id_estudiante)]
+
+    @property
+    def total_estudiantes(self):
+        return sum(f.total_estudiantes for f in self.fragmentos)
+
+    def _dividir_si_es_necesario(self, indice):
+        """Divide el fragmento por su mediana si creció demasiado respecto al resto."""
+        fragmento = self.fragmentos[indice]
+        promedio = self.total_estudiantes / len(self.fragmentos)
+        if fragmento.total_estudiantes < max(self.minimo_para_dividir, self.factor_desbalance * promedio):
+            return False
+        self.dividir_fragmento(indice)
+        return True
+
+    def dividir_fragmento(self, indice):
+        """
+        Parte un fragmento en dos mitades con la misma cantidad de estudiantes.
+        La mitad superior pasa a un fragmento nuevo con su propio archivo.
+        """
+        fragmento = self.fragmentos[indice]
+        estudiantes = fragmento.listar_estudiantes()
+        if len(estudiantes) < 2:
+            return False
+
+        mitad = len(estudiantes) // 2
+        nuevo = self._nuevo_fragmento()
+        nuevo.reconstruir(estudiantes[mitad:])
+        fragmento.reconstruir(estudiantes[:mitad])
+
+        self.fragmentos.insert(indice + 1, nuevo)
+        self.limites.insert(indice, estudiantes[mitad].id_estudiante)
+        self._guardar_fragmento(fragmento)
+        self._guardar_fragmento(nuevo)
+        self._guardar_metadatos()
+        return True
+
+    def _unir_si_es_necesario(self, indice):
+        """Une el fragmento con su vecino más chico si quedó muy por debajo del promedio."""
+        if len(self.fragmentos) < 2:
+            return False
+        promedio = self.total_estudiantes / len(self.fragmentos)
+        if self.fragmentos[indice].total_estudiantes * self.factor_desbalance >= promedio:
+            return False
+        vecinos = [i for i in (indice - 1, indice + 1) if 0 <= i < len(self.fragmentos)]
+        vecino = min(vecinos, key=lambda i: self.fragmentos[i].total_estudiantes)
+        juntos = self.fragmentos[indice].total_estudiantes + self.fragmentos[vecino].total_estudiantes
+        # No se unen si el resultado se volveria a dividir enseguida
+        if juntos >= max(self.minimo_para_dividir, self.factor_desbalance * promedio):
+            return False
+        return self.unir_fragmentos(min(indice, vecino))
+
+    def unir_fragmentos(self, indice):
+        """
+        Une el fragmento indice con el siguiente. El de la izquierda se queda
+        con todos los estudiantes y el archivo del otro se borra.
+        """
+        if not 0 <= indice < len(self.fragmentos) - 1:
+            return False
+        fragmento = self.fragmentos[indice]
+        siguiente = self.fragmentos.pop(indice + 1)
+        del self.limites[indice]
+        # Los rangos son contiguos: la concatenacion ya queda ordenada por ID
+        fragmento.reconstruir(fragmento.listar_estudiantes() + siguiente.listar_estudiantes())
+        self._guardar_fragmento(fragmento)
+        self._modificados.discard(siguiente)
+        self._versiones.pop(siguiente.archivo_json, None)
+        self._guardar_metadatos()
+        if os.path.exists(siguiente.archivo_json):
+            os.remove(siguiente.archivo_json)
+        return True
+
+    def rebalancear(self, num_fragmentos=None):
+        """
+        Redistribuye a todos los estudiantes en fragmentos de igual tamaño.
+        Los límites se recalculan a partir de los IDs reales.
+
+        Args:
+            num_fragmentos: Nuevo número de fragmentos. Con None se mantiene el
+                            actual, salvo que los fragmentos queden chicos (por
+                            ejemplo tras muchas bajas): entonces se unen hasta
+                            que cada uno tenga al menos la mitad de
+                            minimo_para_dividir, lo mismo que deja una division
+        """
+        if num_fragmentos is None:
+            minimo = max(1, self.minimo_para_dividir // 2)
+            num_fragmentos = min(len(self.fragmentos), max(1, self.total_estudiantes // minimo))
+        if num_fragmentos < 1:
+            raise ValueError("Debe haber al menos un fragmento")
+
+        # Los fragmentos estan ordenados por rango, asi que la concatenacion
+        # ya queda ordenada por ID
+        estudiantes = self.listar_estudiantes()
+        anteriores = self.fragmentos
+
+        self.fragmentos = []
+        self.limites = []
+        por_fragmento = max(1, -(-len(estudiantes) // num_fragmentos))
+        for i in range(num_fragmentos):
+            parte = estudiantes[i * por_fragmento:(i + 1) * por_fragmento]
+            fragmento = self._nuevo_fragmento()
+            fragmento.reconstruir(parte)
+            self._guardar_fragmento(fragmento)
+            if i > 0:
+                # Los fragmentos vacios solo pueden quedar al final: su rango
+                # empieza despues del ultimo ID existente
+                if parte:
+                    self.limites.append(parte[0].id_estudiante)
+                else:
+                    self.limites.append(estudiantes[-1].id_estudiante + 1 if estudiantes else 0)
+            self.fragmentos.append(fragmento)
+
+        self._modificados = set()
+        self._guardar_metadatos()
+        for fragmento in anteriores:
+            self._versiones.pop(fragmento.archivo_json, None)
+            if os.path.exists(fragmento.archivo_json):
+                os.remove(fragmento.archivo_json)
+
+    # ---------------- Operaciones puntuales (un solo fragmento) ----------------
+
+    def agregar_estudiante(self, estudiante):
+        indice = self._indice_fragmento(estudiante.id_estudiante)
+        fragmento = self.fragmentos[indice]
+        if not fragmento.agregar_estudiante(estudiante):
+            return False
+        self._modificados.add(fragmento)
+        self._dividir_si_es_necesario(indice)
+        return True
+
+    def buscar_estudiante(self, id_estudiante, contar_pasos=False):
+        return self.fragmento_de(id_estudiante).buscar_estudiante(id_estudiante, contar_pasos)
+
+    def actualizar_estudiante(self, id_estudiante, **kwargs):
+        fragmento = self.fragmento_de(id_estudiante)
+        if not fragmento.actualizar_estudiante(id_estudiante, **kwargs):
+            return False
+        self._modificados.add(fragmento)
+        return True
+
+    def eliminar_estudiante(self, id_estudiante):
+        indice = self._indice_fragmento(id_estudiante)
+        fragmento = self.fragmentos[indice]
+        if not fragmento.eliminar_estudiante(id_estudiante):
+            return False
+        self._modificados.add(fragmento)
+        self._unir_si_es_necesario(indice)
+        return True
+
+    # ---------------- Consultas repartidas en todos los fragmentos ----------------
+
+    def _obtener_trabajadores(self):
+        if self._trabajadores is None:
+            self._trabajadores = [ProcessPoolExecutor(max_workers=1) for _ in range(self.procesos)]
+        return self._trabajadores
+
+    def _repartir(self, operacion, argumento=None):
+        """
+        Ejecuta una consulta de lectura en todos los fragmentos y retorna la
+        lista de resultados parciales, en el orden de los fragmentos.
+        """
+        if not self.procesos:
+            return [_consultar_gestor(f, operacion, argumento) for f in self.fragmentos]
+
+        # Los trabajadores leen los fragmentos desde disco: solo hace falta
+        # escribir los que cambiaron
+        self._guardar_modificados()
+        trabajadores = self._obtener_trabajadores()
+        archivos = [f.archivo_json for f in self.fragmentos]
+        asignados = [frozenset(archivos[i::len(trabajadores)]) for i in range(len(trabajadores))]
+        futuros = [
+            trabajadores[i % len(trabajadores)].submit(
+                _tarea_fragmento, archivo, self._versiones.get(archivo, 0), operacion, argumento,
+                asignados[i % len(trabajadores)])
+            for i, archivo in enumerate(archivos)
+        ]
+        return [futuro.result() for futuro in futuros]
+
+    def listar_estudiantes(self):
+        """Todos los estudiantes ordenados por ID (concatenando los rangos)."""
+        estudiantes = []
+        for fragmento in self.fragmentos:
+            estudiantes.extend(fragmento.listar_estudiantes())
+        return estudiantes
+
+    def buscar_por_nombre(self, nombre):
+        coincidencias = []
+        for parcial in self._repartir("nombre", nombre):
+            coincidencias.extend(parcial)
+        return coincidencias
+
+    def buscar_por_carrera(self, carrera):
+        coincidencias = []
+        for parcial in self._repartir("carrera", carrera):
+            coincidencias.extend(parcial)
+        return coincidencias
+
+    def obtener_estadisticas(self):
+        """Mismo formato que GestorEstudiantes.obtener_estadisticas."""
+        total = 0
+        suma_edades = 0
+        carreras = {}
+        for parcial in self._repartir("estadisticas"):
+            total += parcial["total"]
+            suma_edades += parcial["suma_edades"]
+            for carrera, cantidad in parcial["carreras"].items():
+                carreras[carrera] = carreras.get(carrera, 0) + cantidad
+
+        return {
+            "total": total,
+            "edad_promedio": round(suma_edades / total, 2) if total else 0,
+            "carreras": carreras
+        }
+
+    # ---------------- Persistencia y cierre ----------------
+
+    def guardar_en_json(self):
+        """Guarda los fragmentos con cambios pendientes y los metadatos."""
+        exito = self._guardar_modificados()
+        self._guardar_metadatos()
+        return exito
+
+    def _guardar_modificados(self):
+        exito = True
+        for fragmento in list(self._modificados):
+            if not self._guardar_fragmento(fragmento):
+                exito = False
+        return exito
+
+    def _guardar_fragmento(self, fragmento):
+        """Guarda un fragmento y avanza su version para los trabajadores."""
+        if not fragmento.guardar_en_json():
+            return False
+        archivo = fragmento.archivo_json
+        self._versiones[archivo] = self._versiones.get(archivo, 0) + 1
+        self._modificados.discard(fragmento)
+        return True
+
+    def cerrar(self):
+        """Libera los procesos trabajadores."""
+        if self._trabajadores is not None:
+            for trabajador in self._trabajadores:
+                trabajador.shutdown()
+            self._trabajadores = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.cerrar()
+
+    def __str__(self):
+        return f"GestorFragmentado(Total: {self.total_estudiantes}, Fragmentos: {len(self.fragmentos)}, Directorio: {self.directorio})"
@@ -1,14 +1,95 @@
 # Modulo Gestor de Sistema de Gestion de datos de estudiantes
 # con Arboles AVL usando de archivos JSON para persistencia
 
-import json
 import os
-from Logica.Arboles import NodoAVL
+from contextlib import contextmanager
+from Logica.Arboles import (NodoAVLConteo, concatenar, construir_desde_ordenados, dividir,
+                             separar_rango, union_arboles)
 from Logica.Estudiante import Estudiante
+from Logica.Indices import IndiceOrden, IndiceDifuso, IndicePrefijos, CAMPOS_INDEXABLES
+from Logica.Persistencia import escribir_estudiantes, iterar_registros
+from Logica.Validacion import validar_campo, validar_registros
+from Logica import Intercambio
+from Logica.CargaPerezosa import IndicePosiciones, CAPACIDAD_CACHE
+from Logica.Cadenas import PoolCadenas
+from Logica.Memoria import tamano, tamano_profundo
+from Logica.Estatico import IndiceEstatico
+from Logica.Bloom import FiltroBloom, TASA_FALSOS
+from Logica.Historial import Historial, LIMITE_HISTORIAL
+
+
+# Politicas de fusion ante IDs repetidos
+POLITICAS_FUSION = ("izquierda", "derecha", "error")
+
+# Cada cuantos registros se informa el progreso y se revisa la cancelacion
+INTERVALO_PROGRESO = 1000
+
+# Estudiantes por pagina en los listados de la consola
+TAMANO_PAGINA = 20
+
+# Campos que se pueden modificar (el ID es la clave del árbol)
+CAMPOS_ACTUALIZABLES = ("nombre", "edad", "carrera", "semestre")
+
+# El filtro de Bloom se reconstruye cuando los IDs eliminados (que siguen
+# marcados en sus bits) superan esta fraccion de sus claves
+FRACCION_ELIMINADOS_FILTRO = 0.25
+
+
+class OperacionCancelada(Exception):
+    """Se canceló una carga o un guardado en curso; los datos no cambiaron."""
+
+
+def _id_extremo(raiz, lado):
+    """ID menor (lado 0) o mayor (lado 1) de un árbol no vacío, en O(log n)."""
+    while raiz.hijos[lado] is not None:
+        raiz = raiz.hijos[lado]
+    return raiz.valor.id_estudiante
+
+
+def _iterar_nodos(raiz):
+    """Estudiantes de un subárbol en orden de ID, con una pila explícita."""
+    pila = []
+    nodo = raiz
+    while pila or nodo is not None:
+        while nodo is not None:
+            pila.append(nodo)
+            nodo = nodo.hijos[0]
+        nodo = pila.pop()
+        yield nodo.valor
+        nodo = nodo.hijos[1]
+
+
+def _con_progreso(registros, al_progresar, cancelar, total):
+    """
+    Recorre los registros informando el progreso y revisando la cancelación
+    cada INTERVALO_PROGRESO registros.
+    
+    Args:
+        registros: Iterable a recorrer
+        al_progresar: Función (procesados, total) o None
+        cancelar: Evento (threading.Event) o None; si se activa se lanza OperacionCancelada
+        total: Total esperado, o función sin argumentos que lo retorna (None = desconocido)
+    """
+    procesados = 0
+    for registro in registros:
+        yield registro
+        procesados += 1
+        if procesados % INTERVALO_PROGRESO == 0:
+            if cancelar is not None and cancelar.is_set():
+                raise OperacionCancelada()
+            if al_progresar is not None:
+                al_progresar(procesados, total() if callable(total) else total)
+    if cancelar is not None and cancelar.is_set():
+        raise OperacionCancelada()
+    if al_progresar is not None:
+        al_progresar(procesados, procesados)
 
 
 class GestorEstudiantes:
-    def __init__(self, archivo_json="Archivos/estudiantes.json", cargar_automatico=True):
+    def __init__(self, archivo_json="Archivos/estudiantes.json", cargar_automatico=True,
+                 perezoso=False, capacidad_cache=CAPACIDAD_CACHE, pool=None, internar_nombres=False,
+                 filtro_bloom=False, tasa_falsos=TASA_FALSOS, bits_por_clave=None,
+                 limite_historial=LIMITE_HISTORIAL):
         """
         Inicializa el gestor de estudiantes con un arbol AVL
         y configura el archivo JSON para persistencia.
@@ -16,10 +97,52 @@ class GestorEstudiantes:
         Args:
             archivo_json: Ruta del archivo JSON para persistencia
             cargar_automatico: Si es True, carga automáticamente los datos del JSON
+            perezoso: Si es True (y el archivo es .json sin compresión), al abrir
+                      solo se prepara un índice ID -> posición en el archivo; los
+                      estudiantes se leen al consultarlos y el árbol se construye
+                      recién cuando hace falta modificarlo
+            capacidad_cache: Estudiantes que se mantienen en memoria en modo perezoso
+            pool: PoolCadenas compartido (None = uno propio para este gestor)
+            internar_nombres: Si es True, los nombres repetidos también comparten
+                              una sola copia en memoria
+            filtro_bloom: Si es True, se mantiene un filtro de Bloom sobre los IDs
+                          (guardado junto al archivo) que responde sin tocar el
+                          árbol ni el disco cuando un ID seguro no existe
+            tasa_falsos: Tasa de falsos positivos buscada para el filtro
+            bits_por_clave: Si se indica, fija la memoria del filtro en bits por
+                            ID en lugar de calcularla desde tasa_falsos
+            limite_historial: Operaciones que se pueden deshacer (0 = ninguna)
         """
+        # Índice de posiciones del modo perezoso (None = árbol en memoria)
+        self._perezoso = None
         self.raiz = None
         self.archivo_json = archivo_json
         self.total_estudiantes = 0
+        # Las carreras se guardan una sola vez y con un código entero
+        self.pool = pool if pool is not None else PoolCadenas()
+        self.internar_nombres = internar_nombres
+        # Indices secundarios por campo; se construyen al primer uso
+        # y desde entonces se mantienen sincronizados con el arbol
+        self.indices = {}
+        # Destino opcional de las mutaciones (ver Replicacion.py): objeto con
+        # publicar(operacion, **datos) y vaciar()
+        self.publicador = None
+        # True si hay cambios que el archivo todavía no tiene: lo activa cada
+        # escritura y lo apagan guardar_en_json y las cargas desde el archivo
+        self.modificado = False
+        # Modo congelado (ver congelar): las lecturas por ID usan una copia
+        # compilada en arreglos ordenados, que cada escritura invalida
+        self.congelado = False
+        self._estatico = None
+        # Filtro de Bloom opcional sobre los IDs y eliminados desde que se construyó
+        self.filtro_bloom = filtro_bloom
+        self.tasa_falsos = tasa_falsos
+        self.bits_por_clave = bits_por_clave
+        self._filtro = None
+        self._eliminados_filtro = 0
+        # Inversas para deshacer y transacciones (ver Historial.py); se crea
+        # después de la carga inicial, que no se puede deshacer
+        self.historial = None
         
         # Crear directorio si no existe
         directorio = os.path.dirname(archivo_json)
@@ -28,18 +151,110 @@ class GestorEstudiantes:
         
         # Cargar datos existentes del archivo JSON si se solicita
         if cargar_automatico:
+            if perezoso and os.path.exists(archivo_json):
+                self.abrir_perezoso(capacidad_cache)
+            else:
+                self.cargar_desde_json()
+        self.historial = Historial(limite_historial)
+
+    @property
+    def raiz(self):
+        """
+        Raíz del árbol AVL. En modo perezoso, el primer acceso construye
+        el árbol completo desde el archivo.
+        """
+        if self._perezoso is not None:
+            self._materializar()
+        return self._raiz
+
+    @raiz.setter
+    def raiz(self, nodo):
+        self._raiz = nodo
+
+    def abrir_perezoso(self, capacidad_cache=CAPACIDAD_CACHE):
+        """
+        Abre el archivo en modo perezoso: se lee (o se crea) el índice
+        auxiliar de posiciones y no se construye el árbol.
+        Si el archivo está comprimido se hace una carga normal.
+        
+        Returns:
+            True si quedó en modo perezoso, False si se cargó normalmente
+        """
+        try:
+            indice = IndicePosiciones(self.archivo_json, capacidad_cache, self._internar)
+        except ValueError:
             self.cargar_desde_json()
+            return False
+        if self._perezoso is None:
+            self._anotar("restaurar", self._raiz, self.total_estudiantes)
+        self._cerrar_perezoso()
+        self._raiz = None
+        self.indices = {}
+        self._estatico = None
+        self._perezoso = indice
+        self.total_estudiantes = len(indice)
+        self.modificado = False
+        self._preparar_filtro(desde_archivo=True)
+        self._publicar("recargar")
+        return True
+
+    def _cerrar_perezoso(self):
+        if self._perezoso is not None:
+            self._perezoso.cerrar()
+            self._perezoso = None
+
+    def _materializar(self):
+        """
+        Sale del modo perezoso construyendo el árbol completo. El índice
+        perezoso se cierra recién cuando el árbol nuevo reemplaza al actual:
+        si la carga falla se lanza RuntimeError y el gestor sigue en modo
+        perezoso, sin perder los datos.
+        """
+        # Los datos no cambian: solo pasan del archivo a memoria, no se
+        # publica ni se anota en el historial
+        publicador, self.publicador = self.publicador, None
+        historial, self.historial = self.historial, None
+        try:
+            exito, reporte = self.cargar_desde_json(devolver_reporte=True)
+        finally:
+            self.publicador = publicador
+            self.historial = historial
+        if not exito:
+            raise RuntimeError(f"No se pudo construir el árbol: {reporte['error']}")
+
+    def _publicar(self, operacion, vaciar=True, **datos):
+        """Envía una mutación al publicador, si hay uno."""
+        if self.publicador is not None:
+            self.publicador.publicar(operacion, **datos)
+            if vaciar:
+                self.publicador.vaciar()
+
+    def _anotando(self):
+        """True si las inversas se usan (calcular algunas cuesta una búsqueda)."""
+        return self.historial is not None and self.historial.activo
+
+    def _anotar(self, *inversa):
+        """Anota en el historial la operación que deshace la recién hecha."""
+        if self._anotando():
+            self.historial.anotar(inversa)
+
+    def _internar(self, estudiante):
+        """Reemplaza los textos del estudiante por sus copias del pool."""
+        estudiante.carrera, estudiante.codigo_carrera = self.pool.codificar(estudiante.carrera)
+        if self.internar_nombres:
+            estudiante.nombre = self.pool.internar(estudiante.nombre)
 
     def agregar_estudiante(self, estudiante):
         """
         Agrega un estudiante al árbol AVL.
         """
         # No permitir IDs duplicados
-        estudiante_existente = self.buscar_estudiante(estudiante.id_estudiante)
-        if estudiante_existente is not None:
+        if self.buscar_nodo(estudiante.id_estudiante) is not None:
             return False
 
-        nuevo_nodo = NodoAVL(estudiante)
+        self._internar(estudiante)
+        # Los nodos guardan el tamaño de su subárbol (ver extraer_rango)
+        nuevo_nodo = NodoAVLConteo(estudiante)
 
         if self.raiz is None:
             self.raiz = nuevo_nodo
@@ -48,8 +263,65 @@ class GestorEstudiantes:
             self.raiz = self.raiz.agregar_hijo(nuevo_nodo)
 
         self.total_estudiantes += 1
+        for indice in self.indices.values():
+            indice.insertar(estudiante)
+        if self._estatico is not None:
+            self._estatico.insertar(estudiante)
+        self.modificado = True
+        self._filtro_agregar([estudiante.id_estudiante])
+        self._anotar("eliminar", estudiante.id_estudiante)
+        self._publicar("agregar", estudiante=estudiante.to_dict())
         return True
 
+    def agregar_lote(self, estudiantes):
+        """
+        Agrega muchos estudiantes de una vez, omitiendo los IDs repetidos.
+        
+        Si el lote es grande comparado con el árbol, se mezclan ambos en
+        orden de ID y el árbol se reconstruye balanceado en O(n + m);
+        si es pequeño conviene insertar uno por uno en O(m log n).
+        
+        Returns:
+            Número de estudiantes agregados
+        """
+        lote = sorted(estudiantes, key=lambda est: est.id_estudiante)
+        
+        if len(lote) * 8 < self.total_estudiantes:
+            # Una sola transacción: el lote se deshace junto
+            with self.transaccion():
+                return sum(1 for est in lote if self.agregar_estudiante(est))
+        
+        # Mezcla de dos secuencias ordenadas; en empates gana el existente
+        mezclados = []
+        nuevos = []
+        existentes = self.iterar_estudiantes()
+        actual = next(existentes, None)
+        ultimo_id = None
+        for est in lote:
+            while actual is not None and actual.id_estudiante < est.id_estudiante:
+                mezclados.append(actual)
+                actual = next(existentes, None)
+            if est.id_estudiante == ultimo_id:
+                continue
+            if actual is not None and actual.id_estudiante == est.id_estudiante:
+                continue
+            self._internar(est)
+            mezclados.append(est)
+            nuevos.append(est.id_estudiante)
+            ultimo_id = est.id_estudiante
+            self._publicar("agregar", vaciar=False, estudiante=est.to_dict())
+        while actual is not None:
+            mezclados.append(actual)
+            actual = next(existentes, None)
+        
+        self._reemplazar(*self._construir(mezclados))
+        # No se anota el árbol anterior: comparte los estudiantes con el nuevo
+        if nuevos:
+            self._anotar("eliminar_varios", nuevos)
+        if self.publicador is not None:
+            self.publicador.vaciar()
+        return len(nuevos)
+
     def buscar_estudiante(self, id_estudiante, contar_pasos=False):
         """
         Busca un estudiante por su ID en el árbol AVL.
@@ -62,6 +334,20 @@ class GestorEstudiantes:
             Si contar_pasos=False: estudiante o None
             Si contar_pasos=True: tupla (estudiante, pasos)
         """
+        if self._filtro is not None and id_estudiante not in self._filtro:
+            # Seguro que no existe: no se recorre el árbol ni se lee el disco
+            return (None, 0) if contar_pasos else None
+        
+        if self.congelado:
+            estatico = self.compilar_estatico()
+            resultado = estatico.buscar(id_estudiante)
+            # Pasos de la búsqueda binaria sobre el arreglo de IDs
+            return (resultado, len(estatico).bit_length()) if contar_pasos else resultado
+        
+        if self._perezoso is not None:
+            resultado, pasos = self._perezoso.buscar(id_estudiante)
+            return (resultado, pasos) if contar_pasos else resultado
+        
         if self.raiz is None:
             return (None, 0) if contar_pasos else None
         
@@ -99,14 +385,40 @@ class GestorEstudiantes:
             return self._buscar_recursivo(nodo.hijos[1], id_estudiante, pasos)
         return None, pasos
 
+    def buscar_nodo(self, id_estudiante):
+        """
+        Retorna el nodo del árbol AVL que contiene al estudiante con el ID dado,
+        o None si no existe. Útil para trabajar con el subárbol de ese nodo.
+        """
+        if self._filtro is not None and id_estudiante not in self._filtro:
+            return None
+        nodo = self.raiz
+        while nodo is not None:
+            if id_estudiante == nodo.valor.id_estudiante:
+                return nodo
+            nodo = nodo.hijos[0] if id_estudiante < nodo.valor.id_estudiante else nodo.hijos[1]
+        return None
+
     def eliminar_estudiante(self, id_estudiante):
         """
         Elimina un estudiante del arbol AVL por su ID.
         Retorna True si se elimino exitosamente, False si no se encontro.
         """
+        if self._filtro is not None and id_estudiante not in self._filtro:
+            return False
         if self.raiz is None:
             return False
         
+        # Los indices y el historial necesitan el estudiante real
+        estudiante = None
+        if self.indices or self._anotando():
+            nodo = self.buscar_nodo(id_estudiante)
+            if nodo is None:
+                return False
+            estudiante = nodo.valor
+            for indice in self.indices.values():
+                indice.eliminar(estudiante)
+        
         # Crear un estudiante temporal para la comparación
         estudiante_temp = Estudiante("", 0, "", 0, id_estudiante)
         
@@ -117,39 +429,310 @@ class GestorEstudiantes:
             if self.raiz is not None:
                 self.raiz.padre = None
             self.total_estudiantes -= 1
+            if self._estatico is not None:
+                self._estatico.eliminar(id_estudiante)
+            self.modificado = True
+            self._filtro_eliminados(1)
+            if estudiante is not None:
+                self._anotar("agregar", estudiante.to_dict())
+            self._publicar("eliminar", id_estudiante=id_estudiante)
             return True
         
         return False
 
+    def extraer_rango(self, id_min, id_max, archivo_json=None):
+        """
+        Separa del árbol a todos los estudiantes con ID en [id_min, id_max]
+        (por ejemplo, una cohorte que se gradúa) y los retorna en un gestor
+        propio, listo para guardarse como archivo histórico.
+        
+        El árbol se divide y se vuelve a unir en O(log n), sin eliminar
+        nodo por nodo; cada nodo guarda el tamaño de su subárbol, así la
+        cantidad de extraídos sale de la raíz del rango. El historial anota
+        el gestor extraído (no una copia de sus estudiantes): deshacer le
+        quita los nodos y los vuelve a unir a este árbol. Solo los índices
+        secundarios ya construidos recorren el rango para quitar a los
+        extraídos (o se descartan si son muchos).
+        
+        Args:
+            id_min: Primer ID del rango (incluido)
+            id_max: Último ID del rango (incluido)
+            archivo_json: Archivo del gestor extraído; por defecto
+                          historico_<id_min>_<id_max>.json junto al original
+        
+        Returns:
+            GestorEstudiantes con los estudiantes del rango
+        """
+        if archivo_json is None:
+            archivo_json = os.path.join(os.path.dirname(self.archivo_json),
+                                        f"historico_{id_min}_{id_max}.json")
+        
+        extraido = GestorEstudiantes(archivo_json, cargar_automatico=False, pool=self.pool,
+                                     internar_nombres=self.internar_nombres)
+        self._separar_en(extraido, id_min, id_max)
+        return extraido
+
+    def _separar_en(self, extraido, id_min, id_max):
+        """Pasa los nodos con ID en [id_min, id_max] al árbol del gestor extraido."""
+        self.raiz, rango = separar_rango(self.raiz, id_min, id_max)
+        if rango is None:
+            return
+        cantidad = rango.tamano
+        
+        if self.indices:
+            # Con muchos extraídos conviene reconstruir los índices al próximo uso
+            if cantidad * 8 >= self.total_estudiantes:
+                self.indices = {}
+            else:
+                for estudiante in _iterar_nodos(rango):
+                    for indice in self.indices.values():
+                        indice.eliminar(estudiante)
+        
+        # Si extraido ya tenía estudiantes (rehacer después de usarlo) se unen
+        raiz = union_arboles(extraido.raiz, rango)
+        extraido._reemplazar(raiz, raiz.tamano)
+        
+        self.total_estudiantes -= cantidad
+        self._estatico = None
+        self.modificado = True
+        self._filtro_eliminados(cantidad)
+        self._anotar("reincorporar", extraido, id_min, id_max)
+        self._publicar("eliminar_rango", id_min=id_min, id_max=id_max)
+
+    def _reincorporar(self, extraido, id_min, id_max):
+        """
+        Deshace extraer_rango: vuelve a unir a este árbol los nodos del
+        gestor extraído, que queda vacío. Lo normal es que el rango siga
+        libre aquí y que el extraído no tenga IDs fuera de él: entonces son
+        dos concatenaciones en O(log n). Si no, se fusiona.
+        """
+        rango = extraido.raiz
+        if rango is None:
+            return
+        siguiente = next(self.iterar_estudiantes(despues_de=id_min - 1), None)
+        if (siguiente is not None and siguiente.id_estudiante <= id_max
+                or _id_extremo(rango, 0) < id_min or _id_extremo(rango, 1) > id_max):
+            self.fusionar(extraido)
+            return
+        
+        cantidad = rango.tamano
+        if self.indices and cantidad * 8 >= self.total_estudiantes + cantidad:
+            self.indices = {}
+        # Los índices, el filtro y las réplicas necesitan a cada estudiante;
+        # se toman antes de unir, cuando rango todavía es solo el subárbol
+        estudiantes = None
+        if self.indices or self._filtro is not None or self.publicador is not None:
+            estudiantes = list(_iterar_nodos(rango))
+        
+        # Los nodos vuelven a este árbol: el historial del extraído ya no sirve
+        extraido._reemplazar(None, 0)
+        if extraido.historial is not None:
+            extraido.historial.vaciar()
+        
+        menores, _, mayores = dividir(self.raiz, id_min)
+        self.raiz = concatenar(concatenar(menores, rango), mayores)
+        self.total_estudiantes += cantidad
+        self._estatico = None
+        self.modificado = True
+        
+        # El filtro se actualiza con el árbol ya unido: si se llena, se
+        # reconstruye a partir de él
+        if estudiantes is not None:
+            for estudiante in estudiantes:
+                for indice in self.indices.values():
+                    indice.insertar(estudiante)
+            self._filtro_agregar(est.id_estudiante for est in estudiantes)
+            for estudiante in estudiantes:
+                self._publicar("agregar", vaciar=False, estudiante=estudiante.to_dict())
+            if self.publicador is not None:
+                self.publicador.vaciar()
+        self._anotar("extraer_en", extraido, id_min, id_max)
+
+    def eliminar_rango(self, id_min, id_max):
+        """
+        Elimina a todos los estudiantes con ID en [id_min, id_max] en O(log n).
+        
+        Returns:
+            Número de estudiantes eliminados
+        """
+        return self.extraer_rango(id_min, id_max).total_estudiantes
+
+    def fusionar(self, otro, politica="izquierda"):
+        """
+        Incorpora a todos los estudiantes de otro gestor (por ejemplo, un
+        archivo de traslados) uniendo ambos árboles en O(m log(n/m + 1)),
+        sin insertar registro por registro. Los nodos del otro gestor pasan
+        a este, así que el otro queda vacío.
+        
+        Args:
+            otro: GestorEstudiantes a incorporar
+            politica: Qué hacer con los IDs repetidos:
+                      "izquierda" conserva el estudiante de este gestor,
+                      "derecha" lo reemplaza por el del otro,
+                      "error" no fusiona nada si hay algún repetido
+        
+        Returns:
+            Reporte con agregados, reemplazados y la lista de IDs en
+            conflicto; si la fusión no se hizo incluye la clave "error"
+        """
+        if politica not in POLITICAS_FUSION:
+            raise ValueError(f"Política de fusión desconocida: {politica}")
+        
+        reporte = {"politica": politica, "agregados": 0, "reemplazados": 0, "conflictos": []}
+        if otro is self or otro.raiz is None:
+            return reporte
+        
+        entrantes = list(otro.iterar_estudiantes())
+        
+        if politica == "error":
+            reporte["conflictos"] = [est.id_estudiante for est in entrantes
+                                     if self.buscar_nodo(est.id_estudiante) is not None]
+            if reporte["conflictos"]:
+                reporte["error"] = f"{len(reporte['conflictos'])} IDs ya existen en el gestor"
+                return reporte
+        
+        for estudiante in entrantes:
+            self._internar(estudiante)
+        
+        # Estudiantes de este gestor reemplazados (solo con politica "derecha")
+        descartados = []
+        
+        def elegir(propio, entrante):
+            reporte["conflictos"].append(propio.valor.id_estudiante)
+            if politica == "derecha":
+                descartados.append(propio.valor)
+                return entrante
+            return propio
+        
+        # El árbol que se divide es el más grande; elegir recibe siempre (propio, entrante)
+        if otro.total_estudiantes <= self.total_estudiantes:
+            raiz = union_arboles(self.raiz, otro.raiz, elegir)
+        else:
+            raiz = union_arboles(otro.raiz, self.raiz, lambda entrante, propio: elegir(propio, entrante))
+        
+        reporte["conflictos"].sort()
+        conflictos = set(reporte["conflictos"])
+        reporte["agregados"] = len(entrantes) - len(conflictos)
+        reporte["reemplazados"] = len(descartados)
+        
+        if self.indices:
+            # Con un lote grande conviene reconstruir los índices al próximo uso
+            if len(entrantes) * 8 >= self.total_estudiantes:
+                self.indices = {}
+            else:
+                for estudiante in descartados:
+                    for indice in self.indices.values():
+                        indice.eliminar(estudiante)
+                for estudiante in entrantes:
+                    if politica == "derecha" or estudiante.id_estudiante not in conflictos:
+                        for indice in self.indices.values():
+                            indice.insertar(estudiante)
+        
+        self.raiz = raiz
+        self.total_estudiantes += reporte["agregados"]
+        self._estatico = None
+        self.modificado = True
+        self._filtro_agregar(est.id_estudiante for est in entrantes if est.id_estudiante not in conflictos)
+        if self.publicador is not None:
+            # En las replicas "agregar" reemplaza al estudiante si ya existe
+            for estudiante in entrantes:
+                if politica == "derecha" or estudiante.id_estudiante not in conflictos:
+                    self._publicar("agregar", vaciar=False, estudiante=estudiante.to_dict())
+            self.publicador.vaciar()
+        if self._anotando():
+            # Una sola unidad: se deshace junto
+            self.historial.anotar(
+                ("eliminar_varios", [est.id_estudiante for est in entrantes
+                                     if est.id_estudiante not in conflictos]),
+                ("actualizar_varios", [est.id_estudiante for est in descartados],
+                 {campo: [getattr(est, campo) for est in descartados] for campo in CAMPOS_ACTUALIZABLES}))
+        
+        # Los nodos del otro gestor ahora son de este árbol: su historial no
+        # puede volver a ellos
+        historial, otro.historial = otro.historial, None
+        otro.limpiar_datos()
+        otro.historial = historial
+        if historial is not None:
+            historial.vaciar()
+        return reporte
+
     def listar_estudiantes(self):
         """
         Retorna una lista de todos los estudiantes en orden (in-order traversal).
         """
-        estudiantes = []
-        self._inorden_recursivo(self.raiz, estudiantes)
-        return estudiantes
-    
-    def _inorden_recursivo(self, nodo, lista):
+        return list(self.iterar_estudiantes())
+
+    def iterar_estudiantes(self, despues_de=None):
         """
-        Recorrido in-order del arbol AVL para obtener estudiantes ordenados por ID.
+        Recorre los estudiantes en orden de ID sin construir una lista.
+        Usa una pila explícita en lugar de recursión.
+        En modo perezoso los estudiantes se leen del archivo en orden de ID.
+        
+        Args:
+            despues_de: Si se indica, el recorrido empieza en el primer ID
+                        mayor a este; llegar ahí cuesta O(log n)
         """
-        if nodo is None:
+        if self._perezoso is not None:
+            yield from self._perezoso.iterar(despues_de)
             return
         
-        self._inorden_recursivo(nodo.hijos[0], lista)
-        lista.append(nodo.valor)
-        self._inorden_recursivo(nodo.hijos[1], lista)
+        pila = []
+        nodo = self.raiz
+        if despues_de is not None:
+            # Descenso inicial: solo se apilan los nodos con ID mayor al cursor
+            while nodo is not None:
+                if nodo.valor.id_estudiante <= despues_de:
+                    nodo = nodo.hijos[1]
+                else:
+                    pila.append(nodo)
+                    nodo = nodo.hijos[0]
+        
+        while pila or nodo is not None:
+            while nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.hijos[0]
+            nodo = pila.pop()
+            yield nodo.valor
+            nodo = nodo.hijos[1]
 
     def actualizar_estudiante(self, id_estudiante, **kwargs):
         """
         Actualiza los datos de un estudiante existente.
         Los campos actualizables son: nombre, edad, carrera, semestre.
+        Los valores se validan con las mismas reglas que la carga; un campo
+        desconocido o un valor inválido lanza ValueError sin modificar nada.
+        
+        Returns:
+            True si se actualizó, False si el ID no existe
         """
-        estudiante = self.buscar_estudiante(id_estudiante)
+        desconocidos = set(kwargs) - set(CAMPOS_ACTUALIZABLES)
+        if desconocidos:
+            raise ValueError(f"Campos no actualizables: {', '.join(sorted(desconocidos))}")
+        for campo, valor in kwargs.items():
+            kwargs[campo], error = validar_campo(campo, valor)
+            if error:
+                raise ValueError(error)
         
-        if estudiante is None:
+        if self._filtro is not None and id_estudiante not in self._filtro:
             return False
         
+        # Los estudiantes del modo perezoso son copias leídas del archivo:
+        # para modificarlos hay que tener el árbol en memoria
+        if self._perezoso is not None:
+            self._materializar()
+        
+        nodo = self.buscar_nodo(id_estudiante)
+        
+        if nodo is None:
+            return False
+        estudiante = nodo.valor
+        anteriores = {campo: getattr(estudiante, campo) for campo in CAMPOS_ACTUALIZABLES if campo in kwargs}
+        
+        # Sacar de los indices afectados antes de cambiar sus claves
+        afectados = [indice for indice in self.indices.values() if indice.campo in kwargs]
+        for indice in afectados:
+            indice.eliminar(estudiante)
+        
         # Actualizar los campos proporcionados
         if "nombre" in kwargs:
             estudiante.nombre = kwargs["nombre"]
@@ -159,110 +742,294 @@ class GestorEstudiantes:
             estudiante.carrera = kwargs["carrera"]
         if "semestre" in kwargs:
             estudiante.semestre = kwargs["semestre"]
+        if "nombre" in kwargs or "carrera" in kwargs:
+            self._internar(estudiante)
+        
+        for indice in afectados:
+            indice.insertar(estudiante)
+        if self._estatico is not None:
+            self._estatico.actualizar(estudiante)
+        self.modificado = True
         
+        cambios = {campo: getattr(estudiante, campo) for campo in ("nombre", "edad", "carrera", "semestre")
+                   if campo in kwargs}
+        self._anotar("actualizar", id_estudiante, anteriores)
+        self._publicar("actualizar", id_estudiante=id_estudiante, cambios=cambios)
         return True
 
-    def guardar_en_json(self):
+    def actualizar_muchos(self, predicado, cambios, simular=False):
+        """
+        Actualiza de una vez a todos los estudiantes que cumplen el predicado,
+        en una sola pasada in-order y sin buscar cada ID. Por ejemplo, la
+        promoción de semestre al inicio del período:
+        
+            gestor.actualizar_muchos(lambda est: est.semestre < 12,
+                                     {"semestre": lambda est: est.semestre + 1})
+        
+        Los nuevos valores se validan con las mismas reglas de la consola;
+        si algún estudiante quedaría inválido no se modifica ninguno. Los
+        índices afectados se actualizan por registro si los cambios son
+        pocos, o se descartan para reconstruirse al próximo uso si son muchos.
+        
+        Args:
+            predicado: Función estudiante -> bool (None = todos)
+            cambios: Diccionario campo -> nuevo valor, o función estudiante -> nuevo valor
+            simular: Si es True, no modifica nada y retorna lo que cambiaría
+        
+        Returns:
+            Si simular=False: número de estudiantes modificados
+            Si simular=True: lista en orden de ID con {"id_estudiante", "cambios"}
+            (cambios = {campo: [antes, despues]}) o {"id_estudiante", "error"}
+            para los que quedarían inválidos
+        """
+        desconocidos = set(cambios) - set(CAMPOS_ACTUALIZABLES)
+        if desconocidos:
+            raise ValueError(f"Campos no actualizables: {', '.join(sorted(desconocidos))}")
+        
+        if self._perezoso is not None and not simular:
+            self._materializar()
+        
+        return self._actualizar_muchos(predicado, cambios, simular)
+
+    def _actualizar_muchos(self, predicado, cambios, simular):
+        # Los cambios pendientes se guardan por columnas (una lista de valores
+        # por campo, alineada con pendientes) y no en un diccionario por
+        # estudiante: enteros y strings no los sigue el recolector de ciclos,
+        # que si no recorrería el árbol entero varias veces durante la pasada
+        campos = list(cambios)
+        valores = [None] * len(campos)
+        pendientes = []
+        anteriores = {campo: [] for campo in campos}
+        nuevos = {campo: [] for campo in campos}
+        resultados = []
+        errores = 0
+        primer_error = None
+        for estudiante in self.iterar_estudiantes():
+            if predicado is not None and not predicado(estudiante):
+                continue
+            distinto = False
+            error = None
+            for posicion, campo in enumerate(campos):
+                valor = cambios[campo]
+                valor, error = validar_campo(campo, valor(estudiante) if callable(valor) else valor)
+                if error:
+                    break
+                valores[posicion] = valor
+                if getattr(estudiante, campo) != valor:
+                    distinto = True
+            
+            if error:
+                errores += 1
+                if primer_error is None:
+                    primer_error = f"ID {estudiante.id_estudiante}: {error}"
+                if simular:
+                    resultados.append({"id_estudiante": estudiante.id_estudiante, "error": error})
+            elif distinto:
+                if simular:
+                    resultados.append({"id_estudiante": estudiante.id_estudiante, "cambios": {
+                        campo: [getattr(estudiante, campo), valor]
+                        for campo, valor in zip(campos, valores) if getattr(estudiante, campo) != valor}})
+                else:
+                    pendientes.append(estudiante)
+                    for campo, valor in zip(campos, valores):
+                        anteriores[campo].append(getattr(estudiante, campo))
+                        nuevos[campo].append(valor)
+        
+        if simular:
+            return resultados
+        if errores:
+            raise ValueError(f"{errores} estudiantes quedarían con datos inválidos "
+                             f"({primer_error}); no se modificó ninguno")
+        if not pendientes:
+            return 0
+        
+        modificados = {campo for campo in campos if anteriores[campo] != nuevos[campo]}
+        afectados = [indice for indice in self.indices.values() if indice.campo in modificados]
+        # Con muchos cambios conviene reconstruir los índices al próximo uso
+        if len(pendientes) * 8 >= self.total_estudiantes:
+            self.indices = {nombre: indice for nombre, indice in self.indices.items()
+                            if indice.campo not in modificados}
+            afectados = []
+        internar = "nombre" in modificados or "carrera" in modificados
+        
+        for posicion, estudiante in enumerate(pendientes):
+            for indice in afectados:
+                indice.eliminar(estudiante)
+            for campo in campos:
+                setattr(estudiante, campo, nuevos[campo][posicion])
+            if internar:
+                self._internar(estudiante)
+            for indice in afectados:
+                indice.insertar(estudiante)
+            if self._estatico is not None:
+                self._estatico.actualizar(estudiante)
+            if self.publicador is not None:
+                self._publicar("actualizar", vaciar=False, id_estudiante=estudiante.id_estudiante, cambios={
+                    campo: getattr(estudiante, campo) for campo in campos
+                    if anteriores[campo][posicion] != nuevos[campo][posicion]})
+        
+        self.modificado = True
+        self._anotar("actualizar_varios", [estudiante.id_estudiante for estudiante in pendientes], anteriores)
+        if self.publicador is not None:
+            self.publicador.vaciar()
+        return len(pendientes)
+
+    def guardar_en_json(self, compacto=False, al_progresar=None, cancelar=None):
         """
         Guarda todos los estudiantes en un archivo JSON.
         Solo guarda los datos de los estudiantes, no la estructura del árbol.
         El árbol AVL se reconstruirá automáticamente al cargar.
-        """
-        estudiantes = self.listar_estudiantes()
-        
-        # Usar el total de estudiantes listados para asegurar consistencia
-        total_real = len(estudiantes)
         
-        # Sincronizar el contador si hay discrepancia
-        if self.total_estudiantes != total_real:
-            print(f"[ADVERTENCIA] Sincronizando contador: {self.total_estudiantes} -> {total_real}")
-            self.total_estudiantes = total_real
+        Los estudiantes se escriben uno a uno mientras se recorre el árbol.
+        Si el archivo termina en .json.gz o .json.xz se comprime al escribir.
         
-        datos = {
-            "total_estudiantes": total_real,
-            "estudiantes": [est.to_dict() for est in estudiantes]
-        }
+        Args:
+            compacto: Si es True, escribe sin sangría ni espacios
+            al_progresar: Función opcional (escritos, total) llamada periódicamente
+            cancelar: Evento opcional (threading.Event); si se activa, el guardado
+                      se detiene y el archivo anterior queda intacto
+        """
+        # No se puede reemplazar el archivo mientras se lee de él
+        if self._perezoso is not None:
+            self._materializar()
         
         try:
-            with open(self.archivo_json, 'w', encoding='utf-8') as archivo:
-                json.dump(datos, archivo, indent=4, ensure_ascii=False)
+            registros = (est.to_dict() for est in self.iterar_estudiantes())
+            if al_progresar is not None or cancelar is not None:
+                registros = _con_progreso(registros, al_progresar, cancelar, self.total_estudiantes)
+            escritos = escribir_estudiantes(
+                self.archivo_json,
+                registros,
+                self._encabezado(),
+                compacto
+            )
+            
+            # Cada mutación mantiene exacto el contador, así que el encabezado
+            # se escribe antes de la lista en una sola pasada. Si aun así no
+            # coincidiera, se corrige el contador sin reescribir el archivo:
+            # al cargar, el total del encabezado solo se usa para el progreso
+            if self.total_estudiantes != escritos:
+                print(f"[ADVERTENCIA] Sincronizando contador: {self.total_estudiantes} -> {escritos}")
+                self.total_estudiantes = escritos
+            if self._filtro is not None:
+                self._filtro.guardar(self.archivo_json)
+            if self.publicador is not None:
+                # El archivo ya tiene todo hasta la secuencia de su encabezado
+                self.publicador.rotar()
+            self.modificado = False
             return True
+        except OperacionCancelada:
+            return False
         except Exception as e:
             print(f"Error al guardar en JSON: {e}")
             return False
 
-    def cargar_desde_json(self, mostrar_progreso=False):
+    def _encabezado(self):
+        """Campos del archivo antes de la lista de estudiantes."""
+        encabezado = {"total_estudiantes": self.total_estudiantes}
+        # Las réplicas arrancan desde el archivo y siguen el registro desde aquí
+        secuencia = getattr(self.publicador, "secuencia", None)
+        if secuencia is not None:
+            encabezado["secuencia"] = secuencia
+        return encabezado
+
+    def cargar_desde_json(self, devolver_reporte=False, al_progresar=None, cancelar=None):
         """
         Carga los estudiantes desde un archivo JSON al arbol AVL.
-        Reconstruye el árbol AVL insertando cada estudiante individualmente.
-        El árbol se auto-balancea durante la inserción.
+        
+        Primero se validan todos los registros (tipos, rangos de edad y
+        semestre, IDs repetidos detectados con un solo ordenamiento) y luego
+        se construye un árbol nuevo, ya balanceado en O(n), que reemplaza
+        al actual de una sola vez. Si el archivo no se puede leer o la carga
+        se cancela, los datos actuales no se modifican. No se imprime
+        nada: la consola o la línea de comandos muestran el reporte.
         
         Args:
-            mostrar_progreso: Si es True, muestra información detallada de la carga
+            devolver_reporte: Si es True, retorna también el reporte de validación
+            al_progresar: Función opcional (leidos, total) llamada periódicamente;
+                          total sale del encabezado del archivo (None si no lo tiene)
+            cancelar: Evento opcional (threading.Event) para detener la carga
             
         Returns:
-            True si la carga fue exitosa, False en caso contrario
+            Si devolver_reporte=False: True si la carga fue exitosa, False en caso contrario
+            Si devolver_reporte=True: tupla (exito, reporte) con los conteos y los
+            primeros registros con problemas de cada clase de error; si la carga
+            fue exitosa, "historial_recortado" cuenta las operaciones anteriores
+            que ya no se pueden deshacer
         """
         if not os.path.exists(self.archivo_json):
-            if mostrar_progreso:
-                print(f"Archivo {self.archivo_json} no existe")
-            return False
+            reporte = {"error": f"Archivo {self.archivo_json} no existe"}
+            return (False, reporte) if devolver_reporte else False
         
         try:
-            with open(self.archivo_json, 'r', encoding='utf-8') as archivo:
-                datos = json.load(archivo)
-            
-            estudiantes_data = datos.get("estudiantes", [])
-            total_en_json = datos.get("total_estudiantes", len(estudiantes_data))
-            
-            if mostrar_progreso:
-                print(f"Cargando {len(estudiantes_data)} estudiantes desde JSON...")
-            
-            # Reiniciar árbol y contador: el archivo JSON es la fuente de la carga
-            self.raiz = None
-            self.total_estudiantes = 0
-            insertados = 0
-            omitidos = 0
-
-            for i, est_data in enumerate(estudiantes_data):
-                try:
-                    estudiante = Estudiante(
-                        nombre=est_data["nombre"],
-                        edad=est_data["edad"],
-                        carrera=est_data["carrera"],
-                        semestre=est_data["semestre"],
-                        id_estudiante=est_data["id_estudiante"]
-                    )
-                    inserted = self.agregar_estudiante(estudiante)
-                    if inserted:
-                        insertados += 1
-                        if mostrar_progreso and (i + 1) % 10 == 0:
-                            print(f"  Cargados {insertados}/{len(estudiantes_data)}...")
-                    else:
-                        omitidos += 1
-                        print(f"[ADVERTENCIA] Duplicado omitido: ID {estudiante.id_estudiante}")
-                except Exception as e:
-                    omitidos += 1
-                    print(f"[ERROR] No se pudo cargar estudiante {i+1}: {e}")
-                    continue
-
-            if mostrar_progreso:
-                print(f"\nCarga completada:")
-                print(f"  - Insertados: {insertados}")
-                print(f"  - Omitidos: {omitidos}")
-                print(f"  - Total en árbol: {self.total_estudiantes}")
-            
-            # Verificar consistencia
-            if self.total_estudiantes != insertados:
-                print(f"[ERROR] Inconsistencia: contador={self.total_estudiantes}, insertados={insertados}")
-                self.total_estudiantes = insertados
-
-            return True
+            # Se lee en streaming registro por registro; el archivo puede estar comprimido
+            encabezado = {}
+            registros = iterar_registros(self.archivo_json, encabezado)
+            if al_progresar is not None or cancelar is not None:
+                registros = _con_progreso(registros, al_progresar, cancelar,
+                                          lambda: encabezado.get("total_estudiantes"))
+            estudiantes, reporte = validar_registros(registros)
+            raiz, total = self._construir(estudiantes)
+            if cancelar is not None and cancelar.is_set():
+                raise OperacionCancelada()
+        except OperacionCancelada:
+            reporte = {"error": "Carga cancelada", "cancelado": True}
+            return (False, reporte) if devolver_reporte else False
         except Exception as e:
-            print(f"Error al cargar desde JSON: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
+            reporte = {"error": f"Error al cargar desde JSON: {e}"}
+            return (False, reporte) if devolver_reporte else False
+        
+        # El archivo JSON es la fuente de la carga: reemplaza el árbol actual.
+        # En modo perezoso los datos ya eran los del archivo: no hay qué deshacer
+        recortadas = self._recortadas()
+        if self._perezoso is None:
+            self._anotar("restaurar", self._raiz, self.total_estudiantes)
+        self._reemplazar(raiz, total, desde_archivo=True)
+        self._publicar("recargar")
+        reporte["historial_recortado"] = self._recortadas() - recortadas
+        return (True, reporte) if devolver_reporte else True
+
+    def importar(self, ruta, formato=None, todo_o_nada=False):
+        """
+        Importa estudiantes desde un archivo CSV o NDJSON (.ndjson/.jsonl).
+        Las filas se validan una a una (edad 15-100, semestre 1-12) y se
+        agregan por lotes; los IDs ya existentes se omiten.
+        
+        La importación es una transacción: si se interrumpe (error de
+        lectura, Ctrl+C) no queda ningún lote a medias, y se deshace
+        como una sola operación.
+        
+        Args:
+            todo_o_nada: Si es True y alguna fila es inválida, no se importa ninguna
+        
+        Returns:
+            Reporte con filas leídas, importados, duplicados, inválidos,
+            los primeros errores y el rendimiento en filas por segundo;
+            con "revertido": True si todo_o_nada descartó la importación
+        """
+        self.iniciar_transaccion()
+        try:
+            reporte = Intercambio.importar(self, ruta, formato)
+        except BaseException:
+            self.revertir_transaccion()
+            raise
+        if todo_o_nada and reporte["invalidos"]:
+            self.revertir_transaccion()
+            reporte["revertido"] = True
+            reporte["importados"] = 0
+        else:
+            self.confirmar_transaccion()
+        return reporte
+
+    def exportar(self, ruta, formato=None):
+        """
+        Exporta los estudiantes ordenados por ID a CSV o NDJSON,
+        escribiendo fila por fila durante el recorrido in-order.
+        
+        Returns:
+            Reporte con filas escritas y rendimiento en filas por segundo
+        """
+        return Intercambio.exportar(self.iterar_estudiantes(), ruta, formato)
 
     def buscar_por_nombre(self, nombre, contar_pasos=False):
         """
@@ -280,16 +1047,61 @@ class GestorEstudiantes:
         estudiantes = self.listar_estudiantes()
         coincidencias = []
         pasos = 0
+        coincide = self._filtro_nombre(nombre)
         
         for est in estudiantes:
             pasos += 1
-            if nombre.lower() in est.nombre.lower():
+            if coincide(est):
                 coincidencias.append(est)
         
         if contar_pasos:
             return coincidencias, pasos
         return coincidencias
 
+    def buscar_por_nombre_difuso(self, nombre, distancia_max=1, contar_pasos=False):
+        """
+        Búsqueda aproximada por nombre: no distingue tildes ni mayúsculas y
+        tolera hasta distancia_max errores de escritura por palabra
+        ("Ramirez" encuentra a "Ramírez" y "Ramires").
+        Usa un árbol BK sobre las palabras de los nombres, así que no compara
+        contra todos los estudiantes.
+        
+        Args:
+            nombre: Texto a buscar (una o varias palabras)
+            distancia_max: Errores permitidos por palabra (distancia de edición)
+            contar_pasos: Si es True, retorna (lista_estudiantes, pasos) donde
+                          pasos son las palabras comparadas
+            
+        Returns:
+            Si contar_pasos=False: lista de estudiantes ordenada por ID
+            Si contar_pasos=True: tupla (lista_estudiantes, pasos)
+        """
+        if "nombre_difuso" not in self.indices:
+            self.indices["nombre_difuso"] = IndiceDifuso(self.iterar_estudiantes())
+        
+        ids, pasos = self.indices["nombre_difuso"].buscar(nombre, distancia_max)
+        coincidencias = self.buscar_muchos(sorted(ids))
+        
+        if contar_pasos:
+            return coincidencias, pasos
+        return coincidencias
+
+    def autocompletar(self, prefijo, k=10):
+        """
+        Sugerencias mientras se escribe un nombre: estudiantes con alguna
+        palabra del nombre que empieza con el texto (sin distinguir tildes
+        ni mayúsculas), como máximo k. Usa un árbol radix sobre las palabras
+        de los nombres, construido al primer uso y sincronizado con el árbol.
+        
+        Returns:
+            Lista de hasta k estudiantes
+        """
+        if "prefijos" not in self.indices:
+            self.indices["prefijos"] = IndicePrefijos(self.iterar_estudiantes())
+        
+        ids = self.indices["prefijos"].sugerir(prefijo, k)
+        return self.buscar_muchos(ids)
+
     def buscar_por_carrera(self, carrera, contar_pasos=False):
         """
         Busca estudiantes por carrera.
@@ -303,50 +1115,470 @@ class GestorEstudiantes:
             Si contar_pasos=False: lista de estudiantes de la carrera
             Si contar_pasos=True: tupla (lista_estudiantes, pasos)
         """
-        estudiantes = self.listar_estudiantes()
         coincidencias = []
         pasos = 0
+        coincide = self._filtro_carrera(carrera)
         
-        for est in estudiantes:
+        for est in self.iterar_estudiantes():
             pasos += 1
-            if carrera.lower() in est.carrera.lower():
+            if coincide(est):
                 coincidencias.append(est)
         
         if contar_pasos:
             return coincidencias, pasos
         return coincidencias
 
+    def _filtro_nombre(self, nombre):
+        """Función que indica si un estudiante contiene el texto en su nombre."""
+        nombre = nombre.lower()
+        return lambda est: nombre in est.nombre.lower()
+
+    def _filtro_carrera(self, carrera):
+        """Función que indica si la carrera de un estudiante contiene el texto."""
+        # Se agrupa por código entero: el texto solo se revisa una vez por carrera distinta
+        carrera = carrera.lower()
+        coincide_codigo = {}
+        
+        def coincide(est):
+            resultado = coincide_codigo.get(est.codigo_carrera)
+            if resultado is None:
+                resultado = carrera in self.pool.categoria(est.codigo_carrera).lower()
+                coincide_codigo[est.codigo_carrera] = resultado
+            return resultado
+        
+        return coincide
+
+    def pagina(self, despues_de=None, tamano=TAMANO_PAGINA, nombre=None, carrera=None, contar_pasos=False):
+        """
+        Una página de estudiantes en orden de ID, opcionalmente filtrada por
+        nombre o carrera (búsqueda parcial). La página empieza después del
+        cursor (el último ID de la página anterior): se llega a él en
+        O(log n) y solo se recorre lo necesario para llenar la página.
+        
+        Args:
+            despues_de: Último ID visto (None = desde el principio)
+            tamano: Estudiantes por página
+            nombre: Texto que debe contener el nombre
+            carrera: Texto que debe contener la carrera
+            contar_pasos: Si es True, retorna también los estudiantes revisados
+        
+        Returns:
+            Tupla (estudiantes, hay_mas) o (estudiantes, hay_mas, pasos)
+        """
+        filtros = []
+        if nombre:
+            filtros.append(self._filtro_nombre(nombre))
+        if carrera:
+            filtros.append(self._filtro_carrera(carrera))
+        
+        estudiantes = []
+        hay_mas = False
+        pasos = 0
+        for est in self.iterar_estudiantes(despues_de):
+            pasos += 1
+            if all(coincide(est) for coincide in filtros):
+                if len(estudiantes) == tamano:
+                    hay_mas = True
+                    break
+                estudiantes.append(est)
+        
+        if contar_pasos:
+            return estudiantes, hay_mas, pasos
+        return estudiantes, hay_mas
+
     def obtener_estadisticas(self):
         """
         Retorna estadisticas basicas del sistema.
+        Se hace en una sola pasada agrupando las carreras por su código entero.
         """
-        estudiantes = self.listar_estudiantes()
+        total = 0
+        suma_edades = 0
+        por_codigo = {}
+        for est in self.iterar_estudiantes():
+            total += 1
+            suma_edades += est.edad
+            por_codigo[est.codigo_carrera] = por_codigo.get(est.codigo_carrera, 0) + 1
         
-        if not estudiantes:
+        if total == 0:
             return {
                 "total": 0,
                 "edad_promedio": 0,
                 "carreras": {}
             }
         
-        edad_promedio = sum(est.edad for est in estudiantes) / len(estudiantes)
-        
-        carreras = {}
-        for est in estudiantes:
-            carreras[est.carrera] = carreras.get(est.carrera, 0) + 1
+        carreras = {self.pool.categoria(codigo): cantidad for codigo, cantidad in por_codigo.items()}
         
         return {
             "total": self.total_estudiantes,
-            "edad_promedio": round(edad_promedio, 2),
+            "edad_promedio": round(suma_edades / total, 2),
             "carreras": carreras
         }
 
+    def uso_memoria(self, estudiantes_objetivo=None):
+        """
+        Mide la memoria que ocupan los datos del gestor con sys.getsizeof,
+        contando cada objeto una sola vez aunque se comparta (por ejemplo,
+        una carrera internada cuenta una vez para todos sus estudiantes).
+        En modo perezoso solo se cuentan los estudiantes en la caché.
+        
+        Args:
+            estudiantes_objetivo: Si se indica, agrega una proyección lineal
+                                  del total para esa cantidad de estudiantes
+        
+        Returns:
+            Diccionario con los bytes de "nodos" (árbol AVL), "registros"
+            (objetos Estudiante y sus números), "cadenas" (nombres, carreras
+            y el pool), "indices" (bytes por índice secundario), "total" y
+            "por_estudiante"
+        """
+        vistos = set()
+        uso = {"nodos": 0, "registros": 0, "cadenas": 0, "indices": {}}
+        
+        if self._perezoso is not None:
+            estudiantes = list(self._perezoso.cache.values())
+        else:
+            estudiantes = []
+            pila = [self.raiz] if self.raiz is not None else []
+            while pila:
+                nodo = pila.pop()
+                # El nodo, su diccionario de atributos y la lista de hijos
+                uso["nodos"] += tamano(nodo, vistos) + tamano(nodo.__dict__, vistos) + tamano(nodo.hijos, vistos)
+                estudiantes.append(nodo.valor)
+                pila.extend(hijo for hijo in nodo.hijos if hijo is not None)
+        
+        for estudiante in estudiantes:
+            uso["registros"] += tamano(estudiante, vistos)
+            for valor in (estudiante.id_estudiante, estudiante.edad, estudiante.semestre, estudiante.codigo_carrera):
+                uso["registros"] += tamano(valor, vistos)
+        for estudiante in estudiantes:
+            uso["cadenas"] += tamano(estudiante.nombre, vistos) + tamano(estudiante.carrera, vistos)
+        uso["cadenas"] += tamano_profundo(self.pool, vistos)
+        
+        for nombre, indice in self.indices.items():
+            uso["indices"][nombre] = tamano_profundo(indice, vistos)
+        if self._estatico is not None:
+            uso["indices"]["estatico"] = tamano_profundo(self._estatico, vistos)
+        if self._filtro is not None:
+            uso["indices"]["filtro_bloom"] = tamano_profundo(self._filtro, vistos)
+        
+        uso["total"] = uso["nodos"] + uso["registros"] + uso["cadenas"] + sum(uso["indices"].values())
+        cantidad = len(estudiantes)
+        uso["por_estudiante"] = uso["total"] / cantidad if cantidad else 0
+        
+        if estudiantes_objetivo is not None:
+            uso["proyeccion"] = {
+                "estudiantes": estudiantes_objetivo,
+                "bytes": int(uso["por_estudiante"] * estudiantes_objetivo)
+            }
+        return uso
+
     def limpiar_datos(self):
         """
         Elimina todos los estudiantes del árbol.
+        
+        Returns:
+            Operaciones anteriores que ya no se pueden deshacer: el historial
+            retiene un solo árbol completo (ver Historial)
         """
-        self.raiz = None
-        self.total_estudiantes = 0
+        return self._restaurar(None, 0)
+
+    def reconstruir(self, estudiantes_ordenados):
+        """
+        Reemplaza el contenido del árbol por los estudiantes dados, que deben
+        venir ordenados por ID y sin duplicados. El árbol se construye ya
+        balanceado en O(n), sin inserciones ni rotaciones. Para poder
+        deshacerlo, los estudiantes no deben ser los del árbol actual.
+        
+        Returns:
+            Operaciones anteriores que ya no se pueden deshacer (como limpiar_datos)
+        """
+        return self._restaurar(*self._construir(estudiantes_ordenados))
+
+    def _construir(self, estudiantes_ordenados):
+        """Arma un árbol nuevo sin tocar el actual. Retorna (raiz, total)."""
+        estudiantes = list(estudiantes_ordenados)
+        for est in estudiantes:
+            self._internar(est)
+        return construir_desde_ordenados(estudiantes, NodoAVLConteo), len(estudiantes)
+
+    def _restaurar(self, raiz, total):
+        """
+        Cambia el árbol entero y lo publica. El árbol anterior se anota en
+        el historial tal cual (sus nodos no se tocan), así deshacer es
+        volver a él sin copiar nada. El árbol nuevo no debe compartir
+        estudiantes con el anterior: deshacer y rehacer los recrearían por
+        separado y el anotado quedaría con datos viejos.
+        
+        Returns:
+            Unidades del historial descartadas para retener solo este árbol
+        """
+        recortadas = self._recortadas()
+        if self._anotando():
+            if self._perezoso is not None:
+                # Los datos del modo perezoso están en el archivo, que
+                # guardar_en_json reemplaza: para poder volver a ellos
+                # se construye el árbol y se anota ese
+                self._materializar()
+            self._anotar("restaurar", self._raiz, self.total_estudiantes)
+        self._reemplazar(raiz, total)
+        if self.publicador is not None:
+            self._publicar("limpiar", vaciar=False)
+            for estudiante in self.iterar_estudiantes():
+                self._publicar("agregar", vaciar=False, estudiante=estudiante.to_dict())
+            self.publicador.vaciar()
+        return self._recortadas() - recortadas
+
+    def _recortadas(self):
+        return self.historial.recortadas if self.historial is not None else 0
+
+    def _reemplazar(self, raiz, total, desde_archivo=False):
+        """
+        Cambia el árbol actual por uno ya construido.
+        desde_archivo indica que el árbol es el contenido del archivo JSON.
+        """
+        self._cerrar_perezoso()
+        self.raiz = raiz
+        self.total_estudiantes = total
+        self.indices = {}
+        self._estatico = None
+        self.modificado = not desde_archivo
+        self._preparar_filtro(desde_archivo)
+
+    def usar_filtro_bloom(self, tasa_falsos=TASA_FALSOS, bits_por_clave=None):
+        """
+        Activa (o reconfigura) el filtro de Bloom sobre los IDs y lo
+        construye para los datos actuales.
+        """
+        self.filtro_bloom = True
+        self.tasa_falsos = tasa_falsos
+        self.bits_por_clave = bits_por_clave
+        self._preparar_filtro()
+
+    def _preparar_filtro(self, desde_archivo=False):
+        """
+        Deja el filtro de Bloom (si está activado) al día con los datos.
+        Si los datos son los del archivo se usa el filtro guardado cuando
+        corresponde a ese archivo; si no, el recién construido se guarda.
+        """
+        self._filtro = None
+        self._eliminados_filtro = 0
+        if not self.filtro_bloom:
+            return
+        
+        if desde_archivo:
+            guardado = FiltroBloom.cargar(self.archivo_json)
+            if guardado is not None and guardado.misma_configuracion(self.tasa_falsos, self.bits_por_clave):
+                self._filtro = guardado
+                return
+        
+        # En modo perezoso los IDs salen del índice auxiliar, sin leer estudiantes
+        if self._perezoso is not None:
+            ids = self._perezoso.ids()
+        else:
+            ids = (est.id_estudiante for est in self.iterar_estudiantes())
+        self._filtro = FiltroBloom.construir(ids, self.total_estudiantes, self.tasa_falsos, self.bits_por_clave)
+        if desde_archivo and os.path.exists(self.archivo_json):
+            self._filtro.guardar(self.archivo_json)
+
+    def _filtro_agregar(self, ids):
+        if self._filtro is None:
+            return
+        for id_estudiante in ids:
+            self._filtro.agregar(id_estudiante)
+        # Pasada la capacidad la tasa de falsos positivos crece: se agranda
+        if self._filtro.lleno():
+            self._preparar_filtro()
+
+    def _filtro_eliminados(self, cantidad):
+        # Un filtro de Bloom no puede quitar claves: los IDs eliminados siguen
+        # dando "puede existir" hasta la próxima reconstrucción
+        if self._filtro is None:
+            return
+        self._eliminados_filtro += cantidad
+        if self._eliminados_filtro > len(self._filtro) * FRACCION_ELIMINADOS_FILTRO:
+            self._preparar_filtro()
+
+    def iniciar_transaccion(self):
+        """
+        Abre una transacción: lo que se haga hasta confirmarla o revertirla
+        se aplica o se descarta junto, y se deshace como una sola operación.
+        Las transacciones se pueden anidar.
+        """
+        self.historial.iniciar()
+
+    def confirmar_transaccion(self):
+        self.historial.confirmar()
+
+    def revertir_transaccion(self):
+        """Deshace lo hecho desde iniciar_transaccion, en orden inverso."""
+        self._aplicar_inversas(self.historial.descartar(), [])
+
+    @contextmanager
+    def transaccion(self):
+        """
+        Bloque atómico: si termina con una excepción se revierte todo lo
+        hecho dentro y la excepción sigue su curso.
+        
+            with gestor.transaccion():
+                gestor.eliminar_estudiante(viejo_id)
+                gestor.agregar_estudiante(reemplazo)
+        """
+        self.iniciar_transaccion()
+        try:
+            yield self
+        except BaseException:
+            self.revertir_transaccion()
+            raise
+        self.confirmar_transaccion()
+
+    def deshacer(self):
+        """
+        Deshace la última operación (o transacción) hecha.
+        
+        Returns:
+            True si había algo para deshacer
+        """
+        return self._mover_historial(self.historial.deshacer, self.historial.rehacer)
+
+    def rehacer(self):
+        """
+        Vuelve a hacer lo último que se deshizo; cualquier cambio nuevo
+        después de deshacer descarta lo que se podía rehacer.
+        
+        Returns:
+            True si había algo para rehacer
+        """
+        return self._mover_historial(self.historial.rehacer, self.historial.deshacer)
+
+    def _mover_historial(self, origen, destino):
+        if self.historial.en_transaccion:
+            raise RuntimeError("No se puede deshacer ni rehacer dentro de una transacción")
+        if not origen:
+            return False
+        # Al aplicar las inversas se anotan las suyas: son las que van a la otra pila
+        self.historial.apilar(destino, self._aplicar_inversas(origen.pop(), []))
+        return True
+
+    def _aplicar_inversas(self, unidad, captura):
+        """Aplica las inversas de la última a la primera, anotando las suyas en captura."""
+        self.historial.capturar(captura)
+        try:
+            for operacion, *datos in reversed(unidad):
+                if operacion == "agregar":
+                    self.agregar_estudiante(Estudiante(**datos[0]))
+                elif operacion == "eliminar":
+                    self.eliminar_estudiante(datos[0])
+                elif operacion == "actualizar":
+                    self.actualizar_estudiante(datos[0], **datos[1])
+                elif operacion == "agregar_varios":
+                    self.agregar_lote(Estudiante(**registro) for registro in datos[0])
+                elif operacion == "eliminar_varios":
+                    for id_estudiante in datos[0]:
+                        self.eliminar_estudiante(id_estudiante)
+                elif operacion == "actualizar_varios":
+                    # Valores anteriores por campo, alineados con la lista de IDs
+                    ids, anteriores = datos
+                    for posicion, id_estudiante in enumerate(ids):
+                        self.actualizar_estudiante(
+                            id_estudiante, **{campo: valores[posicion] for campo, valores in anteriores.items()})
+                elif operacion == "restaurar":
+                    self._restaurar(*datos)
+                elif operacion == "reincorporar":
+                    self._reincorporar(*datos)
+                elif operacion == "extraer_en":
+                    self._separar_en(*datos)
+        finally:
+            self.historial.capturar(None)
+        return captura
+
+    def congelar(self, activo=True):
+        """
+        Activa o desactiva el modo congelado, pensado para cargas de trabajo
+        de solo lectura (reportes, consultas masivas). Las búsquedas por ID
+        usan una copia compilada en arreglos ordenados (NumPy si está
+        instalado) en lugar de recorrer nodos. Las escrituras siguen
+        funcionando: agregar, eliminar y actualizar estudiantes corrigen
+        también la copia; las operaciones por lotes (cargar, fusionar,
+        extraer un rango...) la descartan y se vuelve a compilar en O(n)
+        en la siguiente lectura.
+        """
+        self.congelado = activo
+        if not activo:
+            self._estatico = None
+
+    def compilar_estatico(self):
+        """
+        Retorna el IndiceEstatico del contenido actual, compilándolo en O(n)
+        si no existe o si una operación por lotes lo descartó.
+        """
+        if self._estatico is None:
+            self._estatico = IndiceEstatico(self.iterar_estudiantes())
+        return self._estatico
+
+    def buscar_muchos(self, ids):
+        """
+        Busca un lote de IDs. En modo congelado se resuelve con una sola
+        búsqueda binaria vectorizada sobre el arreglo de IDs.
+        
+        Returns:
+            Lista alineada con ids: el estudiante o None si no existe
+        """
+        if self.congelado:
+            return self.compilar_estatico().buscar_muchos(ids)
+        return [self.buscar_estudiante(id_estudiante) for id_estudiante in ids]
+
+    def buscar_rango_ids(self, id_min, id_max):
+        """
+        Estudiantes con ID en [id_min, id_max], en orden. En modo congelado
+        es una rebanada del arreglo; si no, un recorrido desde id_min.
+        """
+        if self.congelado:
+            return self.compilar_estatico().rango(id_min, id_max)
+        estudiantes = []
+        for estudiante in self.iterar_estudiantes(despues_de=id_min - 1):
+            if estudiante.id_estudiante > id_max:
+                break
+            estudiantes.append(estudiante)
+        return estudiantes
+
+    def obtener_indice(self, campo):
+        """
+        Retorna el índice de orden del campo (edad o semestre),
+        construyéndolo la primera vez que se necesita.
+        """
+        if campo not in CAMPOS_INDEXABLES:
+            raise ValueError(f"Campo no indexable: {campo}")
+        if campo not in self.indices:
+            self.indices[campo] = IndiceOrden(campo, self.listar_estudiantes())
+        return self.indices[campo]
+
+    def top_k(self, campo, k, descendente=False):
+        """
+        Retorna los k estudiantes con menor valor del campo
+        (o mayor si descendente=True), en O(log n + k).
+        """
+        return self.obtener_indice(campo).top_k(k, descendente)
+
+    def k_esimo(self, campo, k):
+        """
+        Retorna el estudiante en la posición k (desde 0) ordenando por el campo,
+        o None si k está fuera de rango.
+        """
+        return self.obtener_indice(campo).k_esimo(k)
+
+    def percentil(self, campo, p):
+        """
+        Retorna el valor del campo en el percentil p (0-100).
+        Por ejemplo percentil("edad", 50) es la mediana de edad.
+        """
+        return self.obtener_indice(campo).percentil(p)
+
+    def buscar_por_rango(self, campo, minimo, maximo):
+        """
+        Busca estudiantes con el campo entre minimo y maximo (incluidos),
+        ordenados por ese campo. Complejidad O(log n + k).
+        """
+        return list(self.obtener_indice(campo).iterar(minimo, maximo))
 
     def __str__(self):
         """
@@ -0,0 +1,138 @@
+# Modulo del historial de cambios (deshacer / rehacer y transacciones)
+# Cada mutacion del gestor anota su operacion inversa, lo minimo para
+# volver atras: el ID de un alta, los datos de una baja, los valores
+# anteriores de una actualizacion. Deshacer aplica esas inversas con los
+# metodos normales del gestor, en O(log n) cada una, sin volver a leer el
+# archivo ni copiar el arbol.
+#
+# Las operaciones que reemplazan el arbol entero (limpiar, reconstruir,
+# cargar) anotan la raiz anterior: el arbol viejo queda vivo mientras su
+# entrada siga en el historial, pero no se copia. Para que el historial
+# siga siendo chico se conserva un solo arbol: al apilar una unidad que
+# retiene uno, se descartan la unidad que retenia el anterior y todas las
+# que quedan mas alla de ella (no se podria deshacer pasando por encima).
+# Las unidades descartadas asi se cuentan en "recortadas" y apilar retorna
+# cuantas fueron, para que el gestor pueda avisarlo.
+
+from collections import deque
+
+# Operaciones (o transacciones) que se pueden deshacer
+LIMITE_HISTORIAL = 100
+
+
+def _retiene_arbol(unidad):
+    """True si alguna inversa de la unidad guarda un arbol completo."""
+    return any(inversa[0] == "restaurar" and inversa[1] is not None for inversa in unidad)
+
+
+def _recortar(pila):
+    """
+    Descarta la unidad mas reciente que retiene un arbol y todas las anteriores.
+
+    Returns:
+        Cantidad de unidades descartadas
+    """
+    for posicion in range(len(pila) - 1, -1, -1):
+        if _retiene_arbol(pila[posicion]):
+            for _ in range(posicion + 1):
+                pila.popleft()
+            return posicion + 1
+    return 0
+
+
+class Historial:
+    """
+    Pilas de deshacer y rehacer del gestor. Cada elemento es una unidad:
+    la lista de inversas de una operacion o de una transaccion completa,
+    en el orden en que se anotaron (se aplican al reves).
+    """
+
+    def __init__(self, limite=LIMITE_HISTORIAL):
+        """
+        Args:
+            limite: Unidades que se conservan para deshacer; las mas viejas
+                    se descartan. Con 0 no se puede deshacer, pero las
+                    transacciones se pueden revertir igual
+        """
+        self.deshacer = deque(maxlen=limite)
+        self.rehacer = deque(maxlen=limite)
+        # Inversas de cada transaccion abierta (pueden anidarse)
+        self._transacciones = []
+        # Mientras se deshace o rehace, las inversas van a esta lista
+        self._capturando = None
+        # Unidades descartadas para conservar un solo arbol (ver apilar)
+        self.recortadas = 0
+
+    @property
+    def en_transaccion(self):
+        return bool(self._transacciones)
+
+    @property
+    def activo(self):
+        """False si nada de lo que se anote se va a usar (limite 0 y sin transacción)."""
+        return bool(self.deshacer.maxlen or self._transacciones or self._capturando is not None)
+
+    def anotar(self, *inversas):
+        """Registra las inversas de una operacion recien hecha (una sola unidad)."""
+        if self._capturando is not None:
+            self._capturando.extend(inversas)
+        elif self._transacciones:
+            self._transacciones[-1].extend(inversas)
+        else:
+            self._apilar(list(inversas))
+
+    def _apilar(self, unidad):
+        # Un cambio nuevo invalida lo que se podia rehacer
+        self.rehacer.clear()
+        self.apilar(self.deshacer, unidad)
+
+    def apilar(self, pila, unidad):
+        """
+        Agrega la unidad a una de las pilas, conservando un solo arbol retenido.
+
+        Returns:
+            Unidades descartadas de las dos pilas para retener solo el arbol nuevo
+        """
+        recortadas = 0
+        if _retiene_arbol(unidad):
+            for otra in (self.deshacer, self.rehacer):
+                recortadas += _recortar(otra)
+        self.recortadas += recortadas
+        pila.append(unidad)
+        return recortadas
+
+    def iniciar(self):
+        self._transacciones.append([])
+
+    def confirmar(self):
+        """Cierra la transaccion actual; si esta anidada se suma a la de afuera."""
+        if not self._transacciones:
+            raise RuntimeError("No hay una transacción activa")
+        unidad = self._transacciones.pop()
+        if not unidad:
+            return
+        if self._transacciones:
+            self._transacciones[-1].extend(unidad)
+        else:
+            self._apilar(unidad)
+
+    def descartar(self):
+        """Cierra la transaccion actual y retorna sus inversas para revertirla."""
+        if not self._transacciones:
+            raise RuntimeError("No hay una transacción activa")
+        return self._transacciones.pop()
+
+    def capturar(self, destino):
+        """Dirige las inversas a destino (None = volver a lo normal)."""
+        self._capturando = destino
+
+    def vaciar(self):
+        self.deshacer.clear()
+        self.rehacer.clear()
+
+    def __len__(self):
+        return len(self.deshacer)
+
+    def __repr__(self):
+        return (f"Historial(deshacer={len(self.deshacer)}, rehacer={len(self.rehacer)}, "
+                f"transacciones={len(self._transacciones)})")
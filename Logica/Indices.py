@@ -0,0 +1,336 @@
+# Modulo de indices secundarios del gestor de estudiantes
+# El arbol principal esta ordenado por id_estudiante; estos indices
+# permiten otros accesos ordenados sin recorrer todo el arbol.
+
+from bisect import bisect_left, insort
+from functools import total_ordering
+from Logica.Arboles import NodoAVLConteo, NodoBK, NodoRadix, construir_desde_ordenados
+from Logica.Cadenas import tokens
+
+# Campos numericos que pueden tener un indice de orden
+CAMPOS_INDEXABLES = ("edad", "semestre")
+
+
+@total_ordering
+class EntradaIndice:
+    """
+    Entrada de un indice secundario: se ordena por (clave, id) para que
+    claves repetidas (varias personas con la misma edad) sean unicas.
+    Guarda la referencia al estudiante para no volver a buscarlo por ID.
+    """
+    __slots__ = ("clave", "ident", "estudiante")
+
+    def __init__(self, clave, ident, estudiante=None):
+        self.clave = clave
+        self.ident = ident
+        self.estudiante = estudiante
+
+    def __eq__(self, otra):
+        return (self.clave, self.ident) == (otra.clave, otra.ident)
+
+    def __lt__(self, otra):
+        return (self.clave, self.ident) < (otra.clave, otra.ident)
+
+    def __repr__(self):
+        return f"EntradaIndice({self.clave}, {self.ident})"
+
+
+class IndiceOrden:
+    """
+    Indice de estadisticas de orden sobre un campo del estudiante.
+    Es un arbol AVL con conteo de nodos ordenado por (campo, id_estudiante),
+    que responde top-k, k-esimo, percentiles y rangos en O(log n + k).
+    """
+
+    def __init__(self, campo, estudiantes=()):
+        """
+        Args:
+            campo: Atributo del estudiante por el que se ordena (p. ej. "edad")
+            estudiantes: Estudiantes con los que se construye el indice inicial
+        """
+        if campo not in CAMPOS_INDEXABLES:
+            raise ValueError(f"Campo no indexable: {campo}")
+
+        self.campo = campo
+        entradas = sorted(self._entrada(est) for est in estudiantes)
+        self.raiz = construir_desde_ordenados(entradas, NodoAVLConteo)
+
+    def _entrada(self, estudiante):
+        return EntradaIndice(getattr(estudiante, self.campo), estudiante.id_estudiante, estudiante)
+
+    def __len__(self):
+        return self.raiz.tamano if self.raiz is not None else 0
+
+    def insertar(self, estudiante):
+        """Agrega al estudiante con el valor actual de su campo."""
+        nuevo_nodo = NodoAVLConteo(self._entrada(estudiante))
+        if self.raiz is None:
+            self.raiz = nuevo_nodo
+        else:
+            self.raiz = self.raiz.agregar_hijo(nuevo_nodo)
+        self.raiz.padre = None
+
+    def eliminar(self, estudiante, clave=None):
+        """
+        Quita al estudiante del indice.
+
+        Args:
+            estudiante: Estudiante a quitar
+            clave: Valor del campo con el que fue indexado, si ya cambio
+        """
+        if self.raiz is None:
+            return False
+        if clave is None:
+            clave = getattr(estudiante, self.campo)
+        nueva_raiz, eliminado = self.raiz.eliminar_nodo(EntradaIndice(clave, estudiante.id_estudiante))
+        if eliminado:
+            self.raiz = nueva_raiz
+            if self.raiz is not None:
+                self.raiz.padre = None
+        return eliminado
+
+    def iterar(self, minimo=None, maximo=None, descendente=False):
+        """
+        Recorre los estudiantes en orden del campo (y por ID en empates),
+        empezando directamente en el primer valor del rango.
+
+        Args:
+            minimo: Valor minimo del campo (incluido), None = sin limite
+            maximo: Valor maximo del campo (incluido), None = sin limite
+            descendente: Si es True, recorre de mayor a menor
+        """
+        # Con descendente se intercambian los papeles de los hijos
+        cerca, lejos = (1, 0) if descendente else (0, 1)
+        inicio, fin = (maximo, minimo) if descendente else (minimo, maximo)
+
+        def antes_del_inicio(clave):
+            if inicio is None:
+                return False
+            return clave > inicio if descendente else clave < inicio
+
+        def despues_del_fin(clave):
+            if fin is None:
+                return False
+            return clave < fin if descendente else clave > fin
+
+        # Descenso inicial: solo se apilan los nodos que pueden estar en el rango
+        pila = []
+        nodo = self.raiz
+        while nodo is not None:
+            if antes_del_inicio(nodo.valor.clave):
+                nodo = nodo.hijos[lejos]
+            else:
+                pila.append(nodo)
+                nodo = nodo.hijos[cerca]
+
+        while pila:
+            nodo = pila.pop()
+            if despues_del_fin(nodo.valor.clave):
+                return
+            yield nodo.valor.estudiante
+            nodo = nodo.hijos[lejos]
+            while nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.hijos[cerca]
+
+    def top_k(self, k, descendente=False):
+        """Los k estudiantes con menor (o mayor) valor del campo."""
+        resultado = []
+        if k <= 0:
+            return resultado
+        for estudiante in self.iterar(descendente=descendente):
+            resultado.append(estudiante)
+            if len(resultado) >= k:
+                break
+        return resultado
+
+    def k_esimo(self, k):
+        """Estudiante en la posicion k (desde 0) ordenado por el campo."""
+        if self.raiz is None or not 0 <= k < len(self):
+            return None
+        return self.raiz.k_esimo(k).estudiante
+
+    def percentil(self, p):
+        """
+        Valor del campo en el percentil p (0-100), por el metodo del rango
+        mas cercano. Retorna None si el indice esta vacio.
+        """
+        if not 0 <= p <= 100:
+            raise ValueError("El percentil debe estar entre 0 y 100")
+        total = len(self)
+        if total == 0:
+            return None
+        # Rango mas cercano: ceil(p/100 * n), convertido a posicion desde 0
+        posicion = max(0, -(-p * total // 100) - 1)
+        return getattr(self.k_esimo(int(posicion)), self.campo)
+
+    def contar_rango(self, minimo, maximo):
+        """Cantidad de estudiantes con el campo en [minimo, maximo], en O(log n)."""
+        if self.raiz is None or minimo > maximo:
+            return 0
+        # Los IDs se comparan con infinitos para abarcar todos los empates
+        menores_al_minimo = self.raiz.contar_menores(EntradaIndice(minimo, float("-inf")))
+        hasta_el_maximo = self.raiz.contar_menores(EntradaIndice(maximo, float("inf")))
+        return hasta_el_maximo - menores_al_minimo
+
+
+class IndiceDifuso:
+    """
+    Indice de busqueda aproximada por nombre. Los nombres se separan en
+    palabras normalizadas (sin tildes ni mayusculas) que se guardan en un
+    arbol BK; cada palabra apunta a los IDs de los estudiantes que la usan.
+    """
+    campo = "nombre"
+
+    def __init__(self, estudiantes=()):
+        self.raiz = None
+        self.ids_por_palabra = {}
+        # Palabras que siguen en el arbol BK pero ya no tienen estudiantes
+        # (el arbol BK no permite borrar); se reconstruye si son demasiadas
+        self.palabras_sin_uso = 0
+        for estudiante in estudiantes:
+            self.insertar(estudiante)
+
+    def _agregar_palabra(self, palabra):
+        if self.raiz is None:
+            self.raiz = NodoBK(palabra)
+        else:
+            self.raiz.agregar_hijo(palabra)
+
+    def insertar(self, estudiante):
+        for palabra in set(tokens(estudiante.nombre)):
+            ids = self.ids_por_palabra.get(palabra)
+            if ids is None:
+                self.ids_por_palabra[palabra] = ids = set()
+                self._agregar_palabra(palabra)
+            elif not ids:
+                self.palabras_sin_uso -= 1
+            ids.add(estudiante.id_estudiante)
+
+    def eliminar(self, estudiante):
+        for palabra in set(tokens(estudiante.nombre)):
+            ids = self.ids_por_palabra.get(palabra)
+            if ids and estudiante.id_estudiante in ids:
+                ids.discard(estudiante.id_estudiante)
+                if not ids:
+                    self.palabras_sin_uso += 1
+
+        if self.palabras_sin_uso > len(self.ids_por_palabra) // 2:
+            self._reconstruir()
+
+    def _reconstruir(self):
+        """Vuelve a armar el arbol BK solo con las palabras en uso."""
+        self.ids_por_palabra = {p: ids for p, ids in self.ids_por_palabra.items() if ids}
+        self.raiz = None
+        self.palabras_sin_uso = 0
+        for palabra in self.ids_por_palabra:
+            self._agregar_palabra(palabra)
+
+    def buscar(self, texto, distancia_max=1):
+        """
+        IDs de los estudiantes cuyo nombre contiene, para cada palabra del
+        texto, alguna palabra a distancia de edicion <= distancia_max.
+
+        Returns:
+            Tupla (conjunto de IDs, comparaciones realizadas)
+        """
+        resultado = None
+        comparaciones = 0
+        for palabra in set(tokens(texto)):
+            if self.raiz is None:
+                return set(), comparaciones
+            encontradas, pasos = self.raiz.buscar_nodo(palabra, distancia_max)
+            comparaciones += pasos
+            ids = set()
+            for encontrada, _ in encontradas:
+                ids |= self.ids_por_palabra.get(encontrada, set())
+            resultado = ids if resultado is None else resultado & ids
+            if not resultado:
+                break
+        return (resultado or set()), comparaciones
+
+
+class IndicePrefijos:
+    """
+    Indice para autocompletar nombres. Las palabras normalizadas de los
+    nombres forman un arbol radix; cada palabra guarda la lista ordenada de
+    IDs que la usan, asi las sugerencias para un prefijo salen recorriendo
+    solo el subarbol del prefijo hasta juntar k resultados.
+    """
+    campo = "nombre"
+
+    def __init__(self, estudiantes=()):
+        self.raiz = NodoRadix()
+        # Durante la construccion los nombres se repiten mucho: se normaliza
+        # cada nombre distinto una sola vez y se recuerda el nodo de cada palabra
+        nodos_por_nombre = {}
+        for estudiante in estudiantes:
+            nodos = nodos_por_nombre.get(estudiante.nombre)
+            if nodos is None:
+                nodos = [self.raiz.agregar_hijo(p) for p in set(tokens(estudiante.nombre))]
+                nodos_por_nombre[estudiante.nombre] = nodos
+            for nodo in nodos:
+                self._agregar_id(nodo, estudiante.id_estudiante)
+
+    def _agregar_id(self, nodo, id_estudiante):
+        if nodo.ids is None:
+            nodo.ids = []
+        # Al construir desde el recorrido in-order los IDs llegan ordenados
+        if not nodo.ids or nodo.ids[-1] < id_estudiante:
+            nodo.ids.append(id_estudiante)
+        else:
+            insort(nodo.ids, id_estudiante)
+
+    def insertar(self, estudiante):
+        for palabra in set(tokens(estudiante.nombre)):
+            self._agregar_id(self.raiz.agregar_hijo(palabra), estudiante.id_estudiante)
+
+    def eliminar(self, estudiante):
+        id_estudiante = estudiante.id_estudiante
+        for palabra in set(tokens(estudiante.nombre)):
+            nodo = self.raiz.buscar_nodo(palabra)
+            if nodo is None:
+                continue
+            posicion = bisect_left(nodo.ids, id_estudiante)
+            if posicion < len(nodo.ids) and nodo.ids[posicion] == id_estudiante:
+                del nodo.ids[posicion]
+            if not nodo.ids:
+                self.raiz.eliminar_nodo(palabra)
+
+    def _ids_con_prefijo(self, prefijo):
+        """Todos los IDs de palabras que empiezan con el prefijo."""
+        nodo = self.raiz.buscar_prefijo(prefijo)
+        ids = set()
+        if nodo is not None:
+            for lista in nodo.iterar_ids():
+                ids.update(lista)
+        return ids
+
+    def sugerir(self, texto, k=10):
+        """
+        IDs de estudiantes cuyo nombre tiene una palabra que empieza con cada
+        palabra del texto, ordenados por palabra y luego por ID, hasta k.
+        La ultima palabra del texto es la que se esta escribiendo.
+        """
+        palabras = tokens(texto)
+        if not palabras or k <= 0:
+            return []
+
+        # Las palabras ya escritas filtran; la ultima define el orden
+        filtros = [self._ids_con_prefijo(palabra) for palabra in palabras[:-1]]
+        nodo = self.raiz.buscar_prefijo(palabras[-1])
+        if nodo is None:
+            return []
+
+        resultado = []
+        vistos = set()
+        for lista in nodo.iterar_ids():
+            for id_estudiante in lista:
+                if id_estudiante in vistos:
+                    continue
+                if all(id_estudiante in filtro for filtro in filtros):
+                    vistos.add(id_estudiante)
+                    resultado.append(id_estudiante)
+                    if len(resultado) >= k:
+                        return resultado
+        return resultado
@@ -0,0 +1,138 @@
+# Modulo de importacion y exportacion de estudiantes en CSV y NDJSON
+# Todo se procesa fila por fila: la exportacion recorre el arbol en orden
+# y la importacion valida y agrega los estudiantes por lotes.
+
+import csv
+import json
+import time
+from Logica.Validacion import CAMPOS, validar_registro
+
+# Extensiones reconocidas para cada formato
+FORMATOS = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+
+TAMANO_LOTE = 5000
+MAX_ERRORES_REPORTADOS = 20
+
+
+def formato_de(ruta, formato=None):
+    """Retorna el formato indicado o el que corresponde a la extension."""
+    if formato is not None:
+        if formato not in ("csv", "ndjson"):
+            raise ValueError(f"Formato no soportado: {formato}")
+        return formato
+    for extension, nombre in FORMATOS.items():
+        if ruta.lower().endswith(extension):
+            return nombre
+    raise ValueError(f"No se reconoce el formato de {ruta} (use .csv, .ndjson o .jsonl)")
+
+
+def iterar_filas(ruta, formato=None):
+    """
+    Lee el archivo fila por fila.
+
+    Yields:
+        Tuplas (numero_de_linea, diccionario) o (numero_de_linea, None)
+        si la linea no se pudo interpretar
+    """
+    formato = formato_de(ruta, formato)
+    with open(ruta, "r", encoding="utf-8", newline="") as archivo:
+        if formato == "csv":
+            lector = csv.DictReader(archivo)
+            for fila in lector:
+                yield lector.line_num, fila
+        else:
+            for numero, linea in enumerate(archivo, 1):
+                if not linea.strip():
+                    continue
+                try:
+                    fila = json.loads(linea)
+                except json.JSONDecodeError:
+                    fila = None
+                yield numero, fila if isinstance(fila, dict) else None
+
+
+def exportar(estudiantes, ruta, formato=None):
+    """
+    Escribe los estudiantes en CSV o NDJSON, uno por fila.
+
+    Args:
+        estudiantes: Iterable de Estudiante (p. ej. el recorrido in-order)
+        ruta: Archivo destino
+        formato: "csv" o "ndjson" (None = según la extensión)
+
+    Returns:
+        Diccionario con filas, segundos y filas_por_segundo
+    """
+    formato = formato_de(ruta, formato)
+    inicio = time.perf_counter()
+    filas = 0
+
+    with open(ruta, "w", encoding="utf-8", newline="") as archivo:
+        if formato == "csv":
+            escritor = csv.DictWriter(archivo, fieldnames=CAMPOS)
+            escritor.writeheader()
+            for est in estudiantes:
+                escritor.writerow(est.to_dict())
+                filas += 1
+        else:
+            for est in estudiantes:
+                archivo.write(json.dumps(est.to_dict(), ensure_ascii=False))
+                archivo.write("\n")
+                filas += 1
+
+    return _con_rendimiento({"filas": filas}, inicio)
+
+
+def importar(gestor, ruta, formato=None, tamano_lote=TAMANO_LOTE):
+    """
+    Importa estudiantes al gestor. Cada fila se valida con las mismas
+    reglas de la consola; las válidas se acumulan en lotes que se
+    agregan con gestor.agregar_lote, así la memoria usada depende del
+    tamaño del lote y no del archivo.
+
+    Returns:
+        Diccionario con filas, importados, duplicados, invalidos,
+        errores (primeros errores con su línea), segundos y filas_por_segundo
+    """
+    inicio = time.perf_counter()
+    reporte = {"filas": 0, "importados": 0, "duplicados": 0, "invalidos": 0, "errores": []}
+    lote = []
+
+    def procesar_lote():
+        insertados = gestor.agregar_lote(lote)
+        reporte["importados"] += insertados
+        reporte["duplicados"] += len(lote) - insertados
+        lote.clear()
+
+    for numero, fila in iterar_filas(ruta, formato):
+        reporte["filas"] += 1
+        if fila is None:
+            estudiante, error = None, "Línea con formato inválido"
+        else:
+            estudiante, error = validar_registro(fila)
+
+        if error:
+            reporte["invalidos"] += 1
+            if len(reporte["errores"]) < MAX_ERRORES_REPORTADOS:
+                reporte["errores"].append({"linea": numero, "error": error})
+            continue
+
+        lote.append(estudiante)
+        if len(lote) >= tamano_lote:
+            procesar_lote()
+
+    if lote:
+        procesar_lote()
+
+    return _con_rendimiento(reporte, inicio)
+
+
+def _con_rendimiento(reporte, inicio):
+    segundos = time.perf_counter() - inicio
+    reporte["segundos"] = round(segundos, 4)
+    reporte["filas_por_segundo"] = round(reporte["filas"] / segundos) if segundos > 0 else 0
+    return reporte
@@ -0,0 +1,63 @@
+# Modulo de medicion de memoria
+# Suma sys.getsizeof sobre grafos de objetos, contando cada objeto una sola
+# vez (por su id) aunque este referenciado desde varias estructuras.
+
+import sys
+import types
+
+# Objetos que no pertenecen a los datos (se comparten con todo el programa)
+_IGNORADOS = (type, types.ModuleType, types.FunctionType, types.MethodType,
+              types.BuiltinFunctionType)
+
+
+def tamano(objeto, vistos):
+    """Bytes de un solo objeto, o 0 si ya fue contado."""
+    if id(objeto) in vistos:
+        return 0
+    vistos.add(id(objeto))
+    return sys.getsizeof(objeto)
+
+
+def _atributos(objeto):
+    """Valores de los atributos de una instancia (__dict__ y __slots__)."""
+    diccionario = getattr(objeto, "__dict__", None)
+    if diccionario is not None:
+        yield diccionario
+    for clase in type(objeto).__mro__:
+        slots = clase.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for nombre in slots:
+            if hasattr(objeto, nombre):
+                yield getattr(objeto, nombre)
+
+
+def tamano_profundo(raiz, vistos):
+    """
+    Bytes de un objeto y de todo lo que alcanza (contenedores y atributos),
+    sin volver a contar los objetos cuyo id ya esta en vistos.
+
+    Args:
+        raiz: Objeto inicial
+        vistos: Conjunto de ids ya contados; se actualiza
+
+    Returns:
+        Bytes nuevos encontrados
+    """
+    total = 0
+    pila = [raiz]
+    while pila:
+        objeto = pila.pop()
+        if id(objeto) in vistos or isinstance(objeto, _IGNORADOS):
+            continue
+        vistos.add(id(objeto))
+        total += sys.getsizeof(objeto)
+
+        if isinstance(objeto, dict):
+            pila.extend(objeto.keys())
+            pila.extend(objeto.values())
+        elif isinstance(objeto, (list, tuple, set, frozenset)):
+            pila.extend(objeto)
+        elif not isinstance(objeto, (str, bytes, int, float, bool)):
+            pila.extend(_atributos(objeto))
+    return total
@@ -0,0 +1,236 @@
+# Modulo de persistencia de estudiantes en archivos JSON
+# Lee y escribe en streaming (registro por registro), con compresion
+# gzip o lzma elegida segun la extension del archivo.
+
+import codecs
+import gzip
+import json
+import lzma
+import os
+import re
+
+# Niveles de compresion: equilibrio entre tamaño y tiempo de guardado
+NIVEL_GZIP = 6
+PRESET_LZMA = 3
+
+TAMANO_BLOQUE = 1 << 16
+
+_ESPACIOS = re.compile(r"[ \t\r\n]*")
+
+# Extensiones soportadas y su codec
+CODECS = {
+    ".json.gz": "gzip",
+    ".json.xz": "lzma",
+    ".json": "ninguno",
+}
+
+
+def codec_de(ruta):
+    """Retorna el codec segun la extension ("gzip", "lzma" o "ninguno")."""
+    ruta = ruta.lower()
+    for extension, codec in CODECS.items():
+        if ruta.endswith(extension):
+            return codec
+    return "ninguno"
+
+
+def abrir_binario(ruta, modo="rb", codec=None):
+    """
+    Abre el archivo en modo binario a traves de su compresor.
+    Los compresores trabajan en streaming: nunca cargan el archivo completo.
+
+    Args:
+        ruta: Ruta del archivo
+        modo: "rb" o "wb"
+        codec: Codec a usar (None = deducirlo de la extension)
+    """
+    if codec is None:
+        codec = codec_de(ruta)
+    if codec == "gzip":
+        if "w" in modo:
+            return gzip.open(ruta, modo, compresslevel=NIVEL_GZIP)
+        return gzip.open(ruta, modo)
+    if codec == "lzma":
+        if "w" in modo:
+            return lzma.open(ruta, modo, preset=PRESET_LZMA)
+        return lzma.open(ruta, modo)
+    return open(ruta, modo)
+
+
+def escribir_estudiantes(ruta, registros, encabezado=None, compacto=False):
+    """
+    Escribe el archivo de estudiantes registro por registro.
+    Se escribe primero en un archivo temporal que luego reemplaza al
+    original, para no dejar un archivo a medias si algo falla.
+
+    Args:
+        ruta: Archivo destino (.json, .json.gz o .json.xz)
+        registros: Iterable de diccionarios de estudiantes
+        encabezado: Campos que van antes de la lista (p. ej. total_estudiantes)
+        compacto: Si es True, usa separadores compactos y sin sangria;
+                  si no, el formato es el mismo de json.dump(indent=4)
+
+    Returns:
+        Numero de registros escritos
+    """
+    encabezado = encabezado or {}
+    temporal = ruta + ".tmp"
+    escritos = 0
+
+    try:
+        with abrir_binario(temporal, "wb", codec_de(ruta)) as binario:
+            with codecs.getwriter("utf-8")(binario) as archivo:
+                if compacto:
+                    archivo.write("{")
+                    for clave, valor in encabezado.items():
+                        archivo.write(f"{json.dumps(clave)}:{json.dumps(valor, ensure_ascii=False)},")
+                    archivo.write('"estudiantes":[')
+                    for registro in registros:
+                        if escritos:
+                            archivo.write(",")
+                        archivo.write(json.dumps(registro, ensure_ascii=False, separators=(",", ":")))
+                        escritos += 1
+                    archivo.write("]}")
+                else:
+                    archivo.write("{\n")
+                    for clave, valor in encabezado.items():
+                        archivo.write(f"    {json.dumps(clave)}: {json.dumps(valor, ensure_ascii=False)},\n")
+                    archivo.write('    "estudiantes": [')
+                    for registro in registros:
+                        archivo.write(",\n        " if escritos else "\n        ")
+                        texto = json.dumps(registro, indent=4, ensure_ascii=False)
+                        archivo.write(texto.replace("\n", "\n        "))
+                        escritos += 1
+                    archivo.write("\n    ]\n}" if escritos else "]\n}")
+        os.replace(temporal, ruta)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+
+    return escritos
+
+
+class _LectorFlujo:
+    """
+    Lector incremental de texto JSON sobre un archivo binario.
+    Mantiene solo un bloque en memoria y opcionalmente lleva la cuenta
+    de la posicion en bytes (util para indexar el archivo sin comprimir).
+    """
+
+    def __init__(self, binario, contar_bytes=False):
+        self.binario = binario
+        self.decodificador = codecs.getincrementaldecoder("utf-8")()
+        self.json = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.fin = False
+        self.contar_bytes = contar_bytes
+        self.posicion_bytes = 0
+
+    def _rellenar(self):
+        if self.fin:
+            return False
+        bloque = self.binario.read(TAMANO_BLOQUE)
+        if not bloque:
+            self.fin = True
+            texto = self.decodificador.decode(b"", final=True)
+        else:
+            texto = self.decodificador.decode(bloque)
+        self.buffer = self.buffer[self.pos:] + texto
+        self.pos = 0
+        return True
+
+    def avanzar(self, hasta):
+        if self.contar_bytes:
+            self.posicion_bytes += len(self.buffer[self.pos:hasta].encode("utf-8"))
+        self.pos = hasta
+
+    def siguiente_caracter(self):
+        """Salta espacios y retorna el siguiente caracter ('' al final)."""
+        while True:
+            # Los espacios son ASCII: cada caracter ocupa un byte
+            fin = _ESPACIOS.match(self.buffer, self.pos).end()
+            self.posicion_bytes += fin - self.pos
+            self.pos = fin
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._rellenar():
+                return ""
+
+    def esperar(self, caracter):
+        encontrado = self.siguiente_caracter()
+        if encontrado != caracter:
+            raise ValueError(f"JSON inválido: se esperaba '{caracter}' y se encontró '{encontrado}'")
+        self.avanzar(self.pos + 1)
+
+    def decodificar(self):
+        """Decodifica el siguiente valor JSON, leyendo mas bloques si hace falta."""
+        self.siguiente_caracter()
+        while True:
+            try:
+                valor, fin = self.json.raw_decode(self.buffer, self.pos)
+                # Un numero al final del buffer podria continuar en el siguiente bloque
+                if fin < len(self.buffer) or self.fin:
+                    self.avanzar(fin)
+                    return valor
+            except json.JSONDecodeError:
+                if self.fin:
+                    raise
+            self._rellenar()
+
+
+def iterar_registros(ruta, encabezado=None, con_posiciones=False):
+    """
+    Recorre los estudiantes de un archivo en streaming, sin cargarlo entero.
+
+    Args:
+        ruta: Archivo de estudiantes (.json, .json.gz o .json.xz)
+        encabezado: Diccionario opcional que se llena con los demas campos
+                    del documento (p. ej. total_estudiantes)
+        con_posiciones: Si es True, produce (registro, inicio, longitud) con
+                        la posicion en bytes del registro dentro del archivo
+                        (solo tiene sentido sin compresion)
+
+    Yields:
+        Diccionario de cada estudiante, en el orden del archivo
+    """
+    with abrir_binario(ruta, "rb") as binario:
+        lector = _LectorFlujo(binario, contar_bytes=con_posiciones)
+        lector.esperar("{")
+        if lector.siguiente_caracter() == "}":
+            return
+
+        while True:
+            clave = lector.decodificar()
+            lector.esperar(":")
+
+            if clave == "estudiantes":
+                lector.esperar("[")
+                if lector.siguiente_caracter() == "]":
+                    lector.avanzar(lector.pos + 1)
+                else:
+                    while True:
+                        inicio = lector.posicion_bytes
+                        registro = lector.decodificar()
+                        if con_posiciones:
+                            yield registro, inicio, lector.posicion_bytes - inicio
+                        else:
+                            yield registro
+                        caracter = lector.siguiente_caracter()
+                        lector.avanzar(lector.pos + 1)
+                        if caracter == "]":
+                            break
+                        if caracter != ",":
+                            raise ValueError("JSON inválido en la lista de estudiantes")
+            else:
+                valor = lector.decodificar()
+                if encabezado is not None:
+                    encabezado[clave] = valor
+
+            caracter = lector.siguiente_caracter()
+            lector.avanzar(lector.pos + 1)
+            if caracter == "}":
+                return
+            if caracter != ",":
+                raise ValueError("JSON inválido: se esperaba ',' o '}'")
@@ -0,0 +1,227 @@
+# Modulo del registro de conjuntos de datos (varias sedes)
+# Cada sede tiene su propio archivo de estudiantes. El registro los abre
+# cuando se piden y mantiene en memoria los usados mas recientemente,
+# dentro de un presupuesto total de bytes; al pasarse del presupuesto
+# guarda (si tiene cambios) y descarta el que lleva mas tiempo sin usarse.
+# Todos los gestores comparten un mismo PoolCadenas, asi las carreras y
+# nombres repetidos entre sedes ocupan una sola copia. El pool cuenta dentro
+# del presupuesto, y si se internan los nombres el registro lleva cuantas
+# sedes abiertas usan cada uno para quitar del pool los de las descartadas.
+
+import statistics
+import time
+from collections import OrderedDict
+from Logica.Cadenas import PoolCadenas
+from Logica.Gestor import GestorEstudiantes
+
+# Bytes por estudiante cargado, medidos con uso_memoria() sobre datos
+# sinteticos (arbol, registros y cadenas, sin indices secundarios)
+BYTES_POR_ESTUDIANTE = 430
+
+# Bytes por texto del pool (la cadena y su entrada en el diccionario)
+BYTES_POR_CADENA = 120
+
+# Presupuesto por defecto: unos 2,5 millones de estudiantes en memoria
+PRESUPUESTO_BYTES = 1 << 30
+
+
+def estimar_bytes(gestor):
+    """Estimacion rapida de la memoria de un gestor cargado."""
+    return gestor.total_estudiantes * BYTES_POR_ESTUDIANTE
+
+
+def _nombres_de(gestor):
+    """Nombres distintos de un gestor (los textos que interna en el pool ademas de las carreras)."""
+    return {estudiante.nombre for estudiante in gestor.iterar_estudiantes()}
+
+
+class RegistroConjuntos:
+    def __init__(self, presupuesto_bytes=PRESUPUESTO_BYTES, estimar=estimar_bytes,
+                 internar_nombres=False):
+        """
+        Args:
+            presupuesto_bytes: Memoria total que pueden ocupar los gestores abiertos
+            estimar: Funcion gestor -> bytes usada para respetar el presupuesto
+                     (para una medicion exacta pero lenta: lambda g: g.uso_memoria()["total"])
+            internar_nombres: Si es True, los nombres tambien se comparten en el pool
+        """
+        self.presupuesto_bytes = presupuesto_bytes
+        self.estimar = estimar
+        self.internar_nombres = internar_nombres
+        self.pool = PoolCadenas()
+        self.archivos = {}                  # nombre -> archivo_json
+        self._abiertos = OrderedDict()      # nombre -> gestor, del menos al mas reciente
+        self._ultimo_uso = {}               # nombre -> time.monotonic() del ultimo pedido
+        # Estimacion de cada gestor abierto y su suma, al dia con cada pedido,
+        # carga y desalojo para no recorrer todos los gestores en cada ajuste
+        self._bytes = {}
+        self._bytes_abiertos = 0
+        # Con internar_nombres: nombre -> cuantas sedes abiertas lo usaban al cargarse
+        self._usos_nombres = {}
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.guardados = 0
+        self.latencias_carga = []           # segundos de cada apertura
+
+    def registrar(self, nombre, archivo_json):
+        """Da de alta un conjunto de datos; no se carga hasta que se pida."""
+        if nombre in self._abiertos and self.archivos[nombre] != archivo_json:
+            self.desalojar(nombre)
+        self.archivos[nombre] = archivo_json
+
+    def obtener(self, nombre):
+        """
+        Retorna el gestor del conjunto, cargandolo si no esta en memoria.
+        Puede descartar otros conjuntos para respetar el presupuesto, asi que
+        conviene pedir el gestor cada vez en lugar de guardarlo: los cambios
+        hechos a un gestor ya descartado no se guardan.
+        """
+        if nombre not in self.archivos:
+            raise KeyError(f"Conjunto de datos no registrado: {nombre}")
+
+        gestor = self._abiertos.get(nombre)
+        if gestor is not None:
+            self.aciertos += 1
+            self._abiertos.move_to_end(nombre)
+        else:
+            self.fallos += 1
+            inicio = time.perf_counter()
+            gestor = GestorEstudiantes(self.archivos[nombre], pool=self.pool,
+                                       internar_nombres=self.internar_nombres)
+            self.latencias_carga.append(time.perf_counter() - inicio)
+            self._abiertos[nombre] = gestor
+            if self.internar_nombres:
+                for texto in _nombres_de(gestor):
+                    self._usos_nombres[texto] = self._usos_nombres.get(texto, 0) + 1
+
+        self._ultimo_uso[nombre] = time.monotonic()
+        # El gestor pudo cambiar desde el pedido anterior: se vuelve a estimar
+        bytes_gestor = self.estimar(gestor)
+        self._bytes_abiertos += bytes_gestor - self._bytes.get(nombre, 0)
+        self._bytes[nombre] = bytes_gestor
+        self._ajustar_presupuesto(conservar=nombre)
+        return gestor
+
+    def _ajustar_presupuesto(self, conservar):
+        """Descarta los menos usados hasta entrar en el presupuesto."""
+        for nombre in list(self._abiertos):
+            if self.bytes_en_memoria() <= self.presupuesto_bytes:
+                break
+            if nombre != conservar:
+                self.desalojar(nombre)
+
+    def desalojar(self, nombre):
+        """
+        Saca un conjunto de la memoria, guardandolo antes si tiene cambios.
+        Si el guardado falla el conjunto queda abierto para no perder datos.
+
+        Returns:
+            True si se descarto, False si no estaba abierto o no se pudo guardar
+        """
+        gestor = self._abiertos.get(nombre)
+        if gestor is None:
+            return False
+        if gestor.modificado:
+            if not gestor.guardar_en_json():
+                return False
+            self.guardados += 1
+        del self._abiertos[nombre]
+        del self._ultimo_uso[nombre]
+        self._bytes_abiertos -= self._bytes.pop(nombre)
+        if self.internar_nombres:
+            self._liberar_nombres(gestor)
+        self.desalojos += 1
+        return True
+
+    def _liberar_nombres(self, gestor):
+        """Quita del pool los nombres que ya no usa ninguna sede abierta."""
+        sin_uso = []
+        for texto in _nombres_de(gestor):
+            usos = self._usos_nombres.pop(texto, 0) - 1
+            if usos > 0:
+                self._usos_nombres[texto] = usos
+            else:
+                # Tambien los agregados despues de la carga (sin usos anotados);
+                # si otra sede abierta tambien lo agrego, solo deja de compartirse
+                sin_uso.append(texto)
+        self.pool.descartar(sin_uso)
+
+    def desalojar_inactivos(self, segundos):
+        """
+        Descarta los conjuntos que no se pidieron en los ultimos segundos.
+
+        Returns:
+            Nombres de los conjuntos descartados
+        """
+        limite = time.monotonic() - segundos
+        inactivos = [nombre for nombre, uso in self._ultimo_uso.items() if uso < limite]
+        return [nombre for nombre in inactivos if self.desalojar(nombre)]
+
+    def guardar(self):
+        """
+        Guarda los conjuntos abiertos con cambios pendientes, sin descartarlos.
+
+        Returns:
+            True si todos se guardaron
+        """
+        exito = True
+        for gestor in self._abiertos.values():
+            if gestor.modificado:
+                if gestor.guardar_en_json():
+                    self.guardados += 1
+                else:
+                    exito = False
+        return exito
+
+    def bytes_en_memoria(self):
+        """Estimacion de los gestores abiertos (al ultimo pedido de cada uno) mas el pool."""
+        return self._bytes_abiertos + self.bytes_pool()
+
+    def bytes_pool(self):
+        return len(self.pool) * BYTES_POR_CADENA
+
+    def abiertos(self):
+        """Nombres de los conjuntos en memoria, del menos al mas reciente."""
+        return list(self._abiertos)
+
+    def estadisticas(self):
+        """
+        Returns:
+            Diccionario con aciertos, fallos, tasa_aciertos, desalojos,
+            guardados, latencias de carga (ms), memoria por conjunto abierto
+            y memoria del pool compartido
+        """
+        pedidos = self.aciertos + self.fallos
+        latencias = [segundos * 1e3 for segundos in self.latencias_carga]
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "tasa_aciertos": round(self.aciertos / pedidos, 4) if pedidos else 0,
+            "desalojos": self.desalojos,
+            "guardados": self.guardados,
+            "carga_ms": {
+                "cargas": len(latencias),
+                "mediana": round(statistics.median(latencias), 2) if latencias else 0,
+                "maximo": round(max(latencias), 2) if latencias else 0,
+            },
+            "en_memoria": {nombre: self._bytes[nombre] for nombre in self._abiertos},
+            "bytes_pool": self.bytes_pool(),
+            "bytes_en_memoria": self.bytes_en_memoria(),
+            "presupuesto_bytes": self.presupuesto_bytes,
+        }
+
+    def cerrar(self):
+        """Guarda los cambios pendientes y descarta todos los conjuntos."""
+        for nombre in list(self._abiertos):
+            self.desalojar(nombre)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.cerrar()
+
+    def __str__(self):
+        return (f"RegistroConjuntos(Registrados: {len(self.archivos)}, Abiertos: {len(self._abiertos)}, "
+                f"Memoria: {self.bytes_en_memoria()}/{self.presupuesto_bytes} bytes)")
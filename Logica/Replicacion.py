@@ -0,0 +1,332 @@
+# Modulo de replicacion por registro de mutaciones
+# El gestor principal escribe cada cambio (agregar, actualizar, eliminar,
+# limpiar...) como una linea NDJSON numerada en un archivo de registro.
+# Las replicas de solo lectura, en otros procesos, arrancan desde el ultimo
+# archivo de estudiantes guardado y leen el registro desde donde ese archivo
+# quedo, aplicando los cambios a su propio arbol en memoria.
+#
+# Cada guardado del principal rota el registro: el archivo guardado ya tiene
+# todo hasta la secuencia de su encabezado, asi que el registro actual pasa
+# a ruta + ".1" (reemplazando al anterior) y se empieza uno vacio. Una replica
+# mantiene abierto el registro que lee y lo termina antes de pasar al nuevo;
+# si entre medio se perdio una rotacion entera (falta un tramo de la
+# secuencia), vuelve a cargar el archivo guardado.
+#
+# Aplicar una mutacion dos veces deja el mismo resultado ("agregar" reemplaza
+# al estudiante si ya existe, eliminar uno inexistente no hace nada), asi que
+# una replica puede releer parte del registro sin desincronizarse.
+
+import json
+import os
+import time
+from collections import deque
+from Logica.Estudiante import Estudiante
+from Logica.Gestor import GestorEstudiantes
+from Logica.Persistencia import iterar_registros
+from Logica.Validacion import validar_registros
+
+# Maximo de texto del registro que se lee en cada consulta
+TAMANO_LECTURA = 1 << 20
+# Bytes que se leen por vez al buscar la ultima linea desde el final
+TAMANO_BLOQUE_FINAL = 1 << 16
+
+
+class PublicadorMutaciones:
+    """
+    Escribe las mutaciones del gestor principal en un archivo NDJSON.
+    Cada linea tiene "seq" (numero de secuencia creciente), "ts" (momento
+    de la publicacion), "op" y los datos de la operacion.
+    """
+
+    def __init__(self, ruta_registro):
+        self.ruta_registro = ruta_registro
+        # Si el registro ya existe se continua su numeracion
+        self.secuencia = self._ultima_secuencia()
+        self._archivo = open(ruta_registro, "a", encoding="utf-8")
+
+    def _ultima_secuencia(self):
+        # Justo despues de una rotacion el registro actual esta vacio y la
+        # numeracion sigue desde el rotado
+        for ruta in (self.ruta_registro, ruta_rotada_de(self.ruta_registro)):
+            ultima = ultima_secuencia_de(ruta)
+            if ultima is not None:
+                return ultima
+        return 0
+
+    def publicar(self, operacion, **datos):
+        self.secuencia += 1
+        entrada = {"seq": self.secuencia, "ts": time.time(), "op": operacion}
+        entrada.update(datos)
+        # Una sola escritura por linea: un lector nunca ve dos lineas mezcladas
+        self._archivo.write(json.dumps(entrada, ensure_ascii=False) + "\n")
+
+    def vaciar(self):
+        """Hace visibles para las replicas las lineas escritas."""
+        self._archivo.flush()
+
+    def rotar(self):
+        """
+        Empieza un registro vacio; el actual pasa a ruta + ".1".
+        Se llama despues de guardar el archivo de estudiantes, que ya tiene
+        todo hasta la secuencia actual. La numeracion continua.
+
+        Returns:
+            True si se roto, False si no se pudo renombrar el archivo
+            (p. ej. en Windows con el registro abierto por otro proceso);
+            en ese caso se sigue escribiendo en el mismo registro
+        """
+        self._archivo.close()
+        try:
+            os.replace(self.ruta_registro, ruta_rotada_de(self.ruta_registro))
+            return True
+        except OSError:
+            return False
+        finally:
+            self._archivo = open(self.ruta_registro, "a", encoding="utf-8")
+
+    def cerrar(self):
+        self._archivo.close()
+
+
+def publicar_mutaciones(gestor, ruta_registro=None):
+    """
+    Hace que el gestor publique sus mutaciones para las replicas.
+
+    Args:
+        gestor: GestorEstudiantes principal
+        ruta_registro: Archivo del registro (por defecto, el archivo de
+                       estudiantes con la extension .log)
+
+    Returns:
+        El PublicadorMutaciones asociado al gestor
+    """
+    if ruta_registro is None:
+        ruta_registro = ruta_registro_de(gestor.archivo_json)
+    gestor.publicador = PublicadorMutaciones(ruta_registro)
+    return gestor.publicador
+
+
+def ruta_registro_de(archivo_json):
+    """Ruta por defecto del registro de mutaciones de un archivo de estudiantes."""
+    return archivo_json + ".log"
+
+
+def ruta_rotada_de(ruta_registro):
+    """Ruta a la que pasa el registro de mutaciones al rotarlo."""
+    return ruta_registro + ".1"
+
+
+def ultima_secuencia_de(ruta_registro):
+    """
+    Secuencia de la ultima linea completa del registro.
+    Se lee por bloques desde el final, sin recorrer el archivo entero.
+
+    Args:
+        ruta_registro: Archivo NDJSON del registro
+
+    Returns:
+        El numero de secuencia, o None si el archivo no existe o no tiene
+        ninguna linea valida
+    """
+    if not os.path.exists(ruta_registro):
+        return None
+    with open(ruta_registro, "rb") as archivo:
+        fin = archivo.seek(0, os.SEEK_END)
+        resto = b""
+        while fin > 0:
+            inicio = max(0, fin - TAMANO_BLOQUE_FINAL)
+            archivo.seek(inicio)
+            lineas = (archivo.read(fin - inicio) + resto).split(b"\n")
+            # La primera parte puede ser el final de una linea del bloque anterior
+            resto = lineas.pop(0) if inicio > 0 else b""
+            for linea in reversed(lineas):
+                try:
+                    return json.loads(linea)["seq"]
+                except (ValueError, KeyError):
+                    # Una linea vacia o incompleta al final (p. ej. tras un corte)
+                    pass
+            fin = inicio
+    return None
+
+
+def _abrir_registro(ruta_registro):
+    """Abre el registro para leerlo (None si todavia no existe)."""
+    try:
+        return open(ruta_registro, "r", encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+class Replica:
+    """
+    Copia de solo lectura de un gestor principal que vive en otro proceso.
+    Se consulta con los metodos del gestor (atributo gestor) despues de
+    llamar a aplicar_pendientes(), o mientras seguir() corre en un hilo.
+    """
+
+    def __init__(self, archivo_json, ruta_registro=None):
+        """
+        Args:
+            archivo_json: Archivo de estudiantes que guarda el principal
+            ruta_registro: Registro de mutaciones (por defecto archivo_json + ".log")
+        """
+        self.archivo_json = archivo_json
+        self.ruta_registro = ruta_registro or ruta_registro_de(archivo_json)
+        # Solo aplica lo que publica el principal: no hay nada que deshacer
+        self.gestor = GestorEstudiantes(archivo_json, cargar_automatico=False, limite_historial=0)
+        # Ultima secuencia aplicada y lineas leidas que faltan aplicar
+        self.secuencia = 0
+        self.pendientes = deque()
+        self._resto = ""
+        # El registro se lee con un archivo abierto: si el principal lo rota,
+        # se sigue leyendo el mismo hasta el final y luego se pasa al nuevo.
+        # Se abre antes de cargar el archivo de estudiantes, asi una rotacion
+        # entre medio solo hace que se relean lineas ya incluidas en el
+        self._registro = _abrir_registro(self.ruta_registro)
+        self.cargar_instantanea()
+        # Ultima secuencia leida y si hay que revisar la primera linea del registro
+        self._ultima_leida = self.secuencia
+        self._revisar_salto = True
+
+    def cargar_instantanea(self):
+        """
+        Reemplaza el contenido de la replica por el archivo de estudiantes.
+        La secuencia guardada en su encabezado indica desde donde seguir.
+        """
+        encabezado = {}
+        if os.path.exists(self.archivo_json):
+            estudiantes, _ = validar_registros(iterar_registros(self.archivo_json, encabezado))
+        else:
+            estudiantes = []
+        self.gestor.reconstruir(estudiantes)
+        self.secuencia = encabezado.get("secuencia", 0)
+
+    def _leer_nuevas(self):
+        """Lee las lineas completas agregadas al registro desde la ultima lectura."""
+        if self._registro is None:
+            self._registro = _abrir_registro(self.ruta_registro)
+            if self._registro is None:
+                return
+        # Se mira antes de leer: si ya estaba rotado, el principal no le
+        # agrega nada mas y se lee hasta el final antes de pasar al nuevo
+        rotado = self._rotado()
+        leidos = self._leer_bloque()
+        if rotado:
+            while leidos:
+                leidos = self._leer_bloque()
+            self._registro.close()
+            self._registro = _abrir_registro(self.ruta_registro)
+            self._resto = ""
+            self._revisar_salto = True
+            if self._registro is not None:
+                self._leer_bloque()
+
+    def _rotado(self):
+        """True si la ruta del registro ya no es el archivo que se esta leyendo."""
+        try:
+            return os.stat(self.ruta_registro).st_ino != os.fstat(self._registro.fileno()).st_ino
+        except OSError:
+            return False
+
+    def _leer_bloque(self):
+        """
+        Lee un bloque del registro abierto desde donde se quedo.
+
+        Returns:
+            Cantidad de caracteres leidos (0 si no habia nada nuevo)
+        """
+        texto = self._registro.read(TAMANO_LECTURA)
+        lineas = (self._resto + texto).split("\n")
+        # La ultima parte puede ser una linea que el principal aun esta escribiendo
+        self._resto = lineas.pop()
+        for linea in lineas:
+            if linea.strip():
+                entrada = json.loads(linea)
+                if self._revisar_salto:
+                    self._revisar_salto = False
+                    if entrada["seq"] > self._ultima_leida + 1:
+                        # Falta al menos un registro rotado entero (la replica
+                        # se atraso mas de un guardado): lo que no se leyo
+                        # esta en el archivo de estudiantes
+                        self.cargar_instantanea()
+                self._ultima_leida = entrada["seq"]
+                if entrada["seq"] > self.secuencia:
+                    self.pendientes.append(entrada)
+        return len(texto)
+
+    def aplicar_pendientes(self):
+        """
+        Lee el registro y aplica las mutaciones nuevas, en orden.
+
+        Returns:
+            Cantidad de mutaciones aplicadas
+        """
+        self._leer_nuevas()
+        aplicadas = 0
+        while self.pendientes:
+            entrada = self.pendientes.popleft()
+            if entrada["seq"] <= self.secuencia:
+                continue
+            self._aplicar(entrada)
+            self.secuencia = entrada["seq"]
+            aplicadas += 1
+        return aplicadas
+
+    def _aplicar(self, entrada):
+        gestor = self.gestor
+        operacion = entrada["op"]
+
+        if operacion == "agregar":
+            datos = entrada["estudiante"]
+            id_estudiante = datos["id_estudiante"]
+            if gestor.buscar_nodo(id_estudiante) is not None:
+                campos = {campo: valor for campo, valor in datos.items() if campo != "id_estudiante"}
+                gestor.actualizar_estudiante(id_estudiante, **campos)
+            else:
+                gestor.agregar_estudiante(Estudiante(**datos))
+        elif operacion == "actualizar":
+            gestor.actualizar_estudiante(entrada["id_estudiante"], **entrada["cambios"])
+        elif operacion == "eliminar":
+            gestor.eliminar_estudiante(entrada["id_estudiante"])
+        elif operacion == "eliminar_rango":
+            gestor.eliminar_rango(entrada["id_min"], entrada["id_max"])
+        elif operacion == "limpiar":
+            gestor.limpiar_datos()
+        elif operacion == "recargar":
+            # El principal reemplazo sus datos por los del archivo: lo anterior
+            # del registro ya no cuenta y se sigue despues de esta entrada
+            self.cargar_instantanea()
+
+    def retraso(self):
+        """
+        Cuanto le falta a la replica para estar al dia con lo publicado.
+
+        Returns:
+            Diccionario con "operaciones" sin aplicar y "segundos" desde que
+            se publico la mas antigua de ellas (0 si esta al dia)
+        """
+        self._leer_nuevas()
+        if not self.pendientes:
+            return {"operaciones": 0, "segundos": 0.0}
+        return {
+            "operaciones": len(self.pendientes),
+            "segundos": max(0.0, time.time() - self.pendientes[0]["ts"])
+        }
+
+    def seguir(self, detener, intervalo=0.05):
+        """
+        Aplica las mutaciones a medida que llegan hasta que se active detener.
+
+        Args:
+            detener: Evento (threading.Event o multiprocessing.Event)
+            intervalo: Segundos de espera cuando no hay nada nuevo
+        """
+        while not detener.is_set():
+            if not self.aplicar_pendientes():
+                detener.wait(intervalo)
+
+    def cerrar(self):
+        """Cierra el registro que se esta leyendo."""
+        if self._registro is not None:
+            self._registro.close()
+            self._registro = None
@@ -0,0 +1,185 @@
+# Modulo de validacion de los datos de estudiantes
+# Reglas compartidas por la interfaz de consola y las importaciones.
+
+from Logica.Estudiante import Estudiante
+
+EDAD_MINIMA = 15
+EDAD_MAXIMA = 100
+SEMESTRE_MINIMO = 1
+SEMESTRE_MAXIMO = 12
+
+CAMPOS = ("id_estudiante", "nombre", "edad", "carrera", "semestre")
+
+
+def _entero(valor, campo):
+    # Los booleanos son int en Python pero no son datos validos
+    if isinstance(valor, bool):
+        raise ValueError(f"{campo} debe ser un número entero")
+    if isinstance(valor, int):
+        return valor
+    if isinstance(valor, str) and valor.strip().lstrip("-").isdigit():
+        return int(valor.strip())
+    raise ValueError(f"{campo} debe ser un número entero")
+
+
+def validar_edad(edad):
+    """Retorna un mensaje de error, o None si la edad es válida."""
+    if not EDAD_MINIMA <= edad <= EDAD_MAXIMA:
+        return f"La edad debe estar entre {EDAD_MINIMA} y {EDAD_MAXIMA}"
+    return None
+
+
+def validar_semestre(semestre):
+    """Retorna un mensaje de error, o None si el semestre es válido."""
+    if not SEMESTRE_MINIMO <= semestre <= SEMESTRE_MAXIMO:
+        return f"El semestre debe estar entre {SEMESTRE_MINIMO} y {SEMESTRE_MAXIMO}"
+    return None
+
+
+# Clases de error del reporte de validacion
+ERROR_REGISTRO = "registro_invalido"
+ERROR_FALTANTES = "campos_faltantes"
+ERROR_TIPO = "tipo_invalido"
+ERROR_VACIO = "texto_vacio"
+ERROR_EDAD = "edad_fuera_de_rango"
+ERROR_SEMESTRE = "semestre_fuera_de_rango"
+ERROR_DUPLICADO = "id_duplicado"
+
+MAX_EJEMPLOS = 5
+
+
+def _validar(datos):
+    """
+    Valida un registro.
+
+    Returns:
+        Tupla (estudiante, None, None) si es válido,
+        o (None, clase_de_error, mensaje)
+    """
+    if not isinstance(datos, dict):
+        return None, ERROR_REGISTRO, "El registro no es un objeto JSON"
+
+    faltantes = [campo for campo in CAMPOS if datos.get(campo) is None]
+    if faltantes:
+        return None, ERROR_FALTANTES, f"Faltan campos: {', '.join(faltantes)}"
+
+    try:
+        id_estudiante = _entero(datos["id_estudiante"], "id_estudiante")
+        edad = _entero(datos["edad"], "edad")
+        semestre = _entero(datos["semestre"], "semestre")
+    except ValueError as e:
+        return None, ERROR_TIPO, str(e)
+
+    nombre = str(datos["nombre"]).strip()
+    carrera = str(datos["carrera"]).strip()
+    if not nombre:
+        return None, ERROR_VACIO, "El nombre no puede estar vacío"
+    if not carrera:
+        return None, ERROR_VACIO, "La carrera no puede estar vacía"
+
+    error = validar_edad(edad)
+    if error:
+        return None, ERROR_EDAD, error
+    error = validar_semestre(semestre)
+    if error:
+        return None, ERROR_SEMESTRE, error
+
+    return Estudiante(nombre, edad, carrera, semestre, id_estudiante), None, None
+
+
+def validar_registro(datos):
+    """
+    Valida un registro (diccionario) y lo convierte en Estudiante.
+    Acepta números como texto, tal como llegan desde un CSV.
+
+    Args:
+        datos: Diccionario con los campos del estudiante
+
+    Returns:
+        Tupla (estudiante, None) si es válido, o (None, mensaje_error)
+    """
+    estudiante, _, mensaje = _validar(datos)
+    return estudiante, mensaje
+
+
+def validar_campo(campo, valor):
+    """
+    Valida un solo campo con las mismas reglas que un registro completo.
+
+    Returns:
+        Tupla (valor_normalizado, None) si es válido, o (None, mensaje_error)
+    """
+    if valor is None:
+        return None, f"Falta el campo {campo}"
+
+    if campo == "nombre" or campo == "carrera":
+        texto = str(valor).strip()
+        if not texto:
+            return None, "El nombre no puede estar vacío" if campo == "nombre" else "La carrera no puede estar vacía"
+        return texto, None
+
+    try:
+        numero = _entero(valor, campo)
+    except ValueError as e:
+        return None, str(e)
+    if campo == "edad":
+        error = validar_edad(numero)
+    elif campo == "semestre":
+        error = validar_semestre(numero)
+    else:
+        error = None
+    return (None, error) if error else (numero, None)
+
+
+def validar_registros(registros, max_ejemplos=MAX_EJEMPLOS):
+    """
+    Valida todos los registros y descarta los IDs repetidos.
+    Los duplicados se detectan con un solo ordenamiento por ID (estable,
+    así se conserva la primera aparición), sin búsquedas en el árbol.
+    Nada se imprime: todo queda en el reporte.
+
+    Args:
+        registros: Iterable de diccionarios (p. ej. iterar_registros)
+        max_ejemplos: Registros con problemas que se guardan por clase de error
+
+    Returns:
+        Tupla (estudiantes, reporte): estudiantes válidos ordenados por ID y sin
+        repetidos, y un diccionario con total, validos, invalidos, duplicados y
+        errores = {clase: {"cantidad": n, "ejemplos": [...]}}
+    """
+    reporte = {"total": 0, "validos": 0, "invalidos": 0, "duplicados": 0, "errores": {}}
+
+    def registrar(clase, posicion, mensaje, id_estudiante=None):
+        error = reporte["errores"].setdefault(clase, {"cantidad": 0, "ejemplos": []})
+        error["cantidad"] += 1
+        if len(error["ejemplos"]) < max_ejemplos:
+            ejemplo = {"posicion": posicion, "mensaje": mensaje}
+            if id_estudiante is not None:
+                ejemplo["id_estudiante"] = id_estudiante
+            error["ejemplos"].append(ejemplo)
+
+    validos = []
+    for posicion, datos in enumerate(registros):
+        reporte["total"] += 1
+        estudiante, clase, mensaje = _validar(datos)
+        if estudiante is None:
+            reporte["invalidos"] += 1
+            registrar(clase, posicion, mensaje, datos.get("id_estudiante") if isinstance(datos, dict) else None)
+        else:
+            validos.append((estudiante.id_estudiante, posicion, estudiante))
+
+    # Si el archivo ya venía ordenado (como lo escribe el gestor) el ordenamiento es O(n)
+    validos.sort(key=lambda tupla: tupla[0])
+
+    estudiantes = []
+    ultimo_id = None
+    for id_estudiante, posicion, estudiante in validos:
+        if id_estudiante == ultimo_id:
+            reporte["duplicados"] += 1
+            registrar(ERROR_DUPLICADO, posicion, "ID repetido", id_estudiante)
+            continue
+        estudiantes.append(estudiante)
+        ultimo_id = id_estudiante
+
+    reporte["validos"] = len(estudiantes)
+    return estudiantes, reporte
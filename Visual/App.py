@@ -8,19 +8,20 @@
 # Joshoa Alarcon Sanchez - 20221020013
 
 import os
+import sys
+from bisect import bisect_right
 from Logica.Estudiante import Estudiante
-from Logica.Gestor import GestorEstudiantes
-from Logica.Arboles import NodoAVL
-
-# Códigos ANSI para colores
-CYAN = "\033[36m"
-RESET = "\033[0m"
+from Logica.Gestor import GestorEstudiantes, TAMANO_PAGINA
+from Logica.Validacion import validar_edad, validar_semestre
+from Visual.VisorArbol import CYAN, RESET, renderizar_arbol, exportar_dot, exportar_json
+from Visual.Progreso import ejecutar_con_progreso
 
 
 class AplicacionGestorEstudiantes:
     def __init__(self):
         """Inicializa la aplicación con el gestor de estudiantes."""
-        self.gestor = GestorEstudiantes()
+        # Modo perezoso: el menú aparece sin esperar a construir el árbol
+        self.gestor = GestorEstudiantes(perezoso=True)
         
     def limpiar_pantalla(self):
         """Limpia la pantalla de la consola."""
@@ -30,6 +31,62 @@ class AplicacionGestorEstudiantes:
         """Pausa la ejecución hasta que el usuario presione Enter."""
         input("\nPresione Enter para continuar...")
     
+    def paginar(self, titulo, obtener_pagina):
+        """
+        Muestra resultados por páginas. Cada página se pide con el cursor
+        (último ID de la página anterior) y se escribe de una sola vez.
+        
+        Args:
+            titulo: Encabezado de cada página
+            obtener_pagina: Función (despues_de) -> (estudiantes, hay_mas, pasos)
+        """
+        # Cursores del inicio de cada página visitada, para volver atrás
+        cursores = [None]
+        mensaje = ""
+        while True:
+            estudiantes, hay_mas, pasos = obtener_pagina(cursores[-1])
+            
+            partes = ["\n" + "="*60, f"   {titulo}", "="*60]
+            if estudiantes:
+                partes.append(f"\nPágina {len(cursores)} - IDs {estudiantes[0].id_estudiante} "
+                              f"a {estudiantes[-1].id_estudiante} (ordenados por ID)")
+                for est in estudiantes:
+                    partes.append(f"\n{est}")
+            else:
+                partes.append("\n[INFO] No hay estudiantes en esta página")
+            partes.append(f"\n[INFO] Estudiantes revisados para esta página: {pasos}")
+            if mensaje:
+                partes.append(mensaje)
+            opciones = []
+            if hay_mas:
+                opciones.append("[s] siguiente")
+            if len(cursores) > 1:
+                opciones.append("[a] anterior")
+            opciones.append("[i] ir a un ID")
+            opciones.append("[Enter] salir")
+            partes.append("\n" + "  ".join(opciones))
+            
+            self.limpiar_pantalla()
+            sys.stdout.write("\n".join(partes) + "\n")
+            sys.stdout.flush()
+            
+            mensaje = ""
+            opcion = input("Opción: ").strip().lower()
+            if opcion == "s" and hay_mas:
+                cursores.append(estudiantes[-1].id_estudiante)
+            elif opcion == "a" and len(cursores) > 1:
+                cursores.pop()
+            elif opcion == "i":
+                id_str = input("Ir al ID (o el siguiente existente): ").strip()
+                try:
+                    cursores.append(int(id_str) - 1)
+                except ValueError:
+                    mensaje = "\n[ERROR] El ID debe ser un número entero"
+            elif not opcion:
+                return
+            else:
+                mensaje = "\n[ERROR] Opción inválida"
+    
     def mostrar_menu_principal(self):
         """Muestra el menú principal de la aplicación."""
         print("\n" + "="*60)
@@ -48,6 +105,10 @@ class AplicacionGestorEstudiantes:
         print("10. Guardar datos en archivo")
         print("11. Cargar datos desde archivo")
         print("12. Limpiar todos los datos")
+        print("13. Importar estudiantes (CSV/NDJSON)")
+        print("14. Exportar estudiantes (CSV/NDJSON)")
+        print(f"15. Deshacer última operación ({len(self.gestor.historial.deshacer)} disponibles)")
+        print(f"16. Rehacer ({len(self.gestor.historial.rehacer)} disponibles)")
         print("0.  Salir")
         print("="*60)
     
@@ -74,8 +135,9 @@ class AplicacionGestorEstudiantes:
                 return
             
             edad = int(input("Edad: "))
-            if edad <= 0:
-                print("\n[ERROR] La edad debe ser mayor a 0")
+            error = validar_edad(edad)
+            if error:
+                print(f"\n[ERROR] {error}")
                 self.pausar()
                 return
             
@@ -86,8 +148,9 @@ class AplicacionGestorEstudiantes:
                 return
             
             semestre = int(input("Semestre: "))
-            if semestre <= 0:
-                print("\n[ERROR] El semestre debe ser mayor a 0")
+            error = validar_semestre(semestre)
+            if error:
+                print(f"\n[ERROR] {error}")
                 self.pausar()
                 return
             
@@ -148,21 +211,32 @@ class AplicacionGestorEstudiantes:
             self.pausar()
             return
         
-        estudiantes, pasos = self.gestor.buscar_por_nombre(nombre, contar_pasos=True)
+        aproximada = input("¿Búsqueda aproximada (ignora tildes y tolera errores)? (s/n): ").strip().lower() == 's'
         
-        if estudiantes:
-            print(f"\n[OK] Se encontraron {len(estudiantes)} estudiante(s):")
-            for est in estudiantes:
-                print(f"\n{est}")
-            print(f"\n[INFO] Búsqueda lineal completada en {pasos} paso(s)")
-            print(f"[INFO] Complejidad: O(n) - Se revisaron todos los {pasos} estudiantes")
-            if len(estudiantes) == 1:
-                print(f"[INFO] Nota: Búsqueda por ID sería más eficiente: O(log n)")
-        else:
-            print(f"\n[ERROR] No se encontraron estudiantes con el nombre '{nombre}'")
-            print(f"[INFO] Se revisaron {pasos} estudiante(s) en total")
+        if aproximada:
+            estudiantes, pasos = self.gestor.buscar_por_nombre_difuso(nombre, contar_pasos=True)
+            if not estudiantes:
+                print(f"\n[ERROR] No se encontraron estudiantes con un nombre parecido a '{nombre}'")
+                print(f"\n[INFO] Búsqueda en árbol BK: {pasos} palabra(s) comparadas "
+                      f"de {self.gestor.total_estudiantes} estudiante(s)")
+                self.pausar()
+                return
+            
+            # Los resultados ya están ordenados por ID: el cursor se ubica con bisección
+            ids = [est.id_estudiante for est in estudiantes]
+            
+            def pagina_difusa(despues_de):
+                inicio = 0 if despues_de is None else bisect_right(ids, despues_de)
+                pagina = estudiantes[inicio:inicio + TAMANO_PAGINA]
+                return pagina, inicio + TAMANO_PAGINA < len(estudiantes), len(pagina)
+            
+            self.paginar(f"NOMBRES PARECIDOS A '{nombre}' ({len(estudiantes)} encontrados)", pagina_difusa)
+            return
         
-        self.pausar()
+        self.paginar(
+            f"ESTUDIANTES CON '{nombre}' EN EL NOMBRE",
+            lambda despues_de: self.gestor.pagina(despues_de, nombre=nombre, contar_pasos=True)
+        )
     
     def buscar_por_carrera_menu(self):
         """Menú para buscar estudiantes por carrera."""
@@ -178,19 +252,10 @@ class AplicacionGestorEstudiantes:
             self.pausar()
             return
         
-        estudiantes, pasos = self.gestor.buscar_por_carrera(carrera, contar_pasos=True)
-        
-        if estudiantes:
-            print(f"\n[OK] Se encontraron {len(estudiantes)} estudiante(s) en {carrera}:")
-            for est in estudiantes:
-                print(f"\n{est}")
-            print(f"\n[INFO] Búsqueda lineal completada en {pasos} paso(s)")
-            print(f"[INFO] Complejidad: O(n) - Se revisaron todos los {pasos} estudiantes")
-        else:
-            print(f"\n[ERROR] No se encontraron estudiantes en la carrera '{carrera}'")
-            print(f"[INFO] Se revisaron {pasos} estudiante(s) en total")
-        
-        self.pausar()
+        self.paginar(
+            f"ESTUDIANTES DE LA CARRERA '{carrera}'",
+            lambda despues_de: self.gestor.pagina(despues_de, carrera=carrera, contar_pasos=True)
+        )
     
     def listar_estudiantes_menu(self):
         """Menú para listar todos los estudiantes."""
@@ -199,17 +264,15 @@ class AplicacionGestorEstudiantes:
         print("   LISTA DE TODOS LOS ESTUDIANTES")
         print("="*60)
         
-        estudiantes = self.gestor.listar_estudiantes()
-        
-        if estudiantes:
-            print(f"\n[OK] Total de estudiantes: {len(estudiantes)}")
-            print("\n(Ordenados por ID)")
-            for i, est in enumerate(estudiantes, 1):
-                print(f"\n{i}. {est}")
-        else:
+        if self.gestor.total_estudiantes == 0:
             print("\n[INFO] No hay estudiantes registrados en el sistema")
+            self.pausar()
+            return
         
-        self.pausar()
+        self.paginar(
+            f"LISTA DE TODOS LOS ESTUDIANTES ({self.gestor.total_estudiantes})",
+            lambda despues_de: self.gestor.pagina(despues_de, contar_pasos=True)
+        )
     
     def actualizar_estudiante_menu(self):
         """Menú para actualizar los datos de un estudiante."""
@@ -249,7 +312,7 @@ class AplicacionGestorEstudiantes:
             if edad_str:
                 try:
                     edad = int(edad_str)
-                    if edad > 0:
+                    if validar_edad(edad) is None:
                         datos_actualizar['edad'] = edad
                     else:
                         print("\n[ADVERTENCIA] Edad inválida, se mantendrá el valor actual")
@@ -262,7 +325,7 @@ class AplicacionGestorEstudiantes:
             if semestre_str:
                 try:
                     semestre = int(semestre_str)
-                    if semestre > 0:
+                    if validar_semestre(semestre) is None:
                         datos_actualizar['semestre'] = semestre
                     else:
                         print("\n[ADVERTENCIA] Semestre inválido, se mantendrá el valor actual")
@@ -270,7 +333,13 @@ class AplicacionGestorEstudiantes:
                     print("\n[ADVERTENCIA] Semestre inválido, se mantendrá el valor actual")
             
             if datos_actualizar:
-                if self.gestor.actualizar_estudiante(id_estudiante, **datos_actualizar):
+                try:
+                    actualizado = self.gestor.actualizar_estudiante(id_estudiante, **datos_actualizar)
+                except ValueError as e:
+                    print(f"\n[ERROR] {e}")
+                    self.pausar()
+                    return
+                if actualizado:
                     print("\n[OK] Estudiante actualizado exitosamente!")
                     estudiante_actualizado = self.gestor.buscar_estudiante(id_estudiante)
                     print(f"\nNuevos datos:")
@@ -312,7 +381,7 @@ class AplicacionGestorEstudiantes:
             
             if confirmacion == 's':
                 if self.gestor.eliminar_estudiante(id_estudiante):
-                    print("\n[OK] Estudiante eliminado exitosamente")
+                    print("\n[OK] Estudiante eliminado exitosamente (opción 15 para deshacer)")
                 else:
                     print("\n[ERROR] Error al eliminar el estudiante")
             else:
@@ -334,53 +403,52 @@ class AplicacionGestorEstudiantes:
         
         if self.gestor.raiz is None:
             print("\n[INFO] El árbol está vacío")
-        else:
-            print(f"\nÁrbol AVL con factores de balance mostrados en {CYAN}cian{RESET}.")
-            print(f"Total de nodos: {self.gestor.total_estudiantes}\n")
-            self._mostrar_arbol_recursivo(self.gestor.raiz, "", None)
-        
-        self.pausar()
-    
-    def _mostrar_arbol_recursivo(self, nodo, prefijo, es_izquierdo):
-        """Función recursiva para mostrar el árbol de forma visual."""
-        if nodo is None:
+            self.pausar()
             return
         
-        # Formatear la representación del nodo con ID y factor de balanceo
-        if isinstance(nodo, NodoAVL):
-            # Mostrar ID del estudiante y factor de balanceo en cian
-            nombre_corto = nodo.valor.nombre[:15] + "..." if len(nodo.valor.nombre) > 15 else nodo.valor.nombre
-            repr_nodo = f"ID:{nodo.valor.id_estudiante} ({nombre_corto}) [{CYAN}FB:{nodo.factor_balance}{RESET}]"
-        else:
-            repr_nodo = f"ID:{nodo.valor.id_estudiante} ({nodo.valor.nombre})"
-        
-        if es_izquierdo is None:
-            # Es la raíz
-            print(f"{repr_nodo}")
-        elif es_izquierdo:
-            print(f"{prefijo}├── {repr_nodo}")
-        else:
-            print(f"{prefijo}└── {repr_nodo}")
-        
-        # Preparar el nuevo prefijo para los hijos
-        if es_izquierdo is None:
-            nuevo_prefijo = ""
-        elif es_izquierdo:
-            nuevo_prefijo = prefijo + "│   "
-        else:
-            nuevo_prefijo = prefijo + "    "
-        
-        # Mostrar hijos (primero izquierdo, luego derecho)
-        if nodo.hijos[0] is not None or nodo.hijos[1] is not None:
-            if nodo.hijos[0] is not None:
-                self._mostrar_arbol_recursivo(nodo.hijos[0], nuevo_prefijo, True)
-            else:
-                print(f"{nuevo_prefijo}├──  ⃠")
+        try:
+            id_str = input("\nID raíz del subárbol (Enter = árbol completo): ").strip()
+            profundidad_str = input("Profundidad máxima (Enter = sin límite): ").strip()
             
-            if nodo.hijos[1] is not None:
-                self._mostrar_arbol_recursivo(nodo.hijos[1], nuevo_prefijo, False)
-            else:
-                print(f"{nuevo_prefijo}└──  ⃠")
+            nodo = self.gestor.raiz
+            if id_str:
+                nodo = self.gestor.buscar_nodo(int(id_str))
+                if nodo is None:
+                    print(f"\n[ERROR] No se encontró ningún estudiante con el ID {id_str}")
+                    self.pausar()
+                    return
+            
+            profundidad = int(profundidad_str) if profundidad_str else None
+            if profundidad is not None and profundidad < 0:
+                print("\n[ERROR] La profundidad no puede ser negativa")
+                self.pausar()
+                return
+            
+            # Se construye toda la salida y se escribe de una sola vez
+            encabezado = (
+                f"\nÁrbol AVL con factores de balance mostrados en {CYAN}cian{RESET}.\n"
+                f"Total de nodos: {self.gestor.total_estudiantes}\n\n"
+            )
+            sys.stdout.write(encabezado + renderizar_arbol(nodo, profundidad) + "\n")
+            sys.stdout.flush()
+            
+            formato = input("\n¿Exportar la estructura? (dot/json/Enter = no): ").strip().lower()
+            if formato in ("dot", "json"):
+                ruta = input(f"Archivo de salida [arbol.{formato}]: ").strip() or f"arbol.{formato}"
+                if formato == "dot":
+                    exportados = exportar_dot(nodo, ruta, profundidad)
+                else:
+                    exportados = exportar_json(nodo, ruta, profundidad)
+                print(f"\n[OK] {exportados} nodo(s) exportados a {ruta}")
+            elif formato:
+                print("\n[ERROR] Formato no soportado")
+                
+        except ValueError:
+            print("\n[ERROR] El ID y la profundidad deben ser números enteros")
+        except OSError as e:
+            print(f"\n[ERROR] No se pudo exportar: {e}")
+        
+        self.pausar()
     
     def mostrar_estadisticas_menu(self):
         """Menú para mostrar estadísticas del sistema."""
@@ -401,6 +469,26 @@ class AplicacionGestorEstudiantes:
         else:
             print("\n[INFO] No hay estudiantes registrados")
         
+        objetivo_str = input("\nProyectar memoria a cuántos estudiantes (Enter = omitir): ").strip()
+        objetivo = None
+        if objetivo_str:
+            if objetivo_str.isdigit():
+                objetivo = int(objetivo_str)
+            else:
+                print("\n[ERROR] La cantidad debe ser un número entero")
+        
+        uso = self.gestor.uso_memoria(objetivo)
+        print("\nUso de memoria:")
+        print(f"   - Nodos del árbol: {uso['nodos'] / 1e6:.2f} MB")
+        print(f"   - Registros: {uso['registros'] / 1e6:.2f} MB")
+        print(f"   - Cadenas: {uso['cadenas'] / 1e6:.2f} MB")
+        for nombre, bytes_indice in sorted(uso['indices'].items()):
+            print(f"   - Índice {nombre}: {bytes_indice / 1e6:.2f} MB")
+        print(f"   Total: {uso['total'] / 1e6:.2f} MB ({uso['por_estudiante']:.0f} bytes por estudiante)")
+        if "proyeccion" in uso:
+            proyeccion = uso["proyeccion"]
+            print(f"   Proyección para {proyeccion['estudiantes']} estudiantes: {proyeccion['bytes'] / 1e6:.2f} MB")
+        
         self.pausar()
     
     def guardar_datos_menu(self):
@@ -414,8 +502,16 @@ class AplicacionGestorEstudiantes:
         confirmacion = input("\n¿Desea guardar los datos actuales? (s/n): ").strip().lower()
         
         if confirmacion == 's':
-            if self.gestor.guardar_en_json():
+            # El archivo anterior solo se reemplaza si el guardado termina
+            exito, cancelado = ejecutar_con_progreso(
+                "Guardando",
+                lambda al_progresar, cancelar: self.gestor.guardar_en_json(
+                    al_progresar=al_progresar, cancelar=cancelar)
+            )
+            if exito:
                 print("\n[OK] Datos guardados exitosamente")
+            elif cancelado:
+                print("\n[INFO] Guardado cancelado; el archivo anterior no se modificó")
             else:
                 print("\n[ERROR] Error al guardar los datos")
         else:
@@ -437,16 +533,36 @@ class AplicacionGestorEstudiantes:
         
         if confirmacion == 's':
             print("\nCargando datos...")
-            if self.gestor.cargar_desde_json(mostrar_progreso=True):
+            # El árbol nuevo se arma en otro hilo y reemplaza al actual al terminar
+            (exito, reporte), _ = ejecutar_con_progreso(
+                "Cargando",
+                lambda al_progresar, cancelar: self.gestor.cargar_desde_json(
+                    devolver_reporte=True, al_progresar=al_progresar, cancelar=cancelar)
+            )
+            if reporte.get("cancelado"):
+                print("\n[INFO] Carga cancelada; los datos actuales no se modificaron")
+            elif exito:
                 print("\n[OK] Datos cargados exitosamente")
                 print(f"Total de estudiantes en el árbol: {self.gestor.total_estudiantes}")
+                self.avisar_historial_recortado(reporte["historial_recortado"])
+                for clase, error in reporte["errores"].items():
+                    print(f"\n[ADVERTENCIA] {clase}: {error['cantidad']} registro(s) omitido(s)")
+                    for ejemplo in error["ejemplos"]:
+                        id_texto = f" (ID {ejemplo['id_estudiante']})" if "id_estudiante" in ejemplo else ""
+                        print(f"   - Registro {ejemplo['posicion'] + 1}{id_texto}: {ejemplo['mensaje']}")
             else:
-                print("\n[ERROR] Error al cargar los datos o el archivo no existe")
+                print(f"\n[ERROR] {reporte['error']}")
         else:
             print("\n[INFO] Operación cancelada")
         
         self.pausar()
     
+    def avisar_historial_recortado(self, recortadas):
+        """Informa las operaciones que dejaron de poder deshacerse."""
+        if recortadas:
+            print(f"[INFO] {recortadas} operación(es) anterior(es) ya no se pueden deshacer: "
+                  "el historial guarda un solo árbol completo")
+    
     def limpiar_datos_menu(self):
         """Menú para limpiar todos los datos del sistema."""
         self.limpiar_pantalla()
@@ -455,14 +571,15 @@ class AplicacionGestorEstudiantes:
         print("="*60)
         
         print(f"\n[ADVERTENCIA] Se eliminarán todos los {self.gestor.total_estudiantes} estudiantes")
-        print("[ADVERTENCIA] Esta acción no se puede deshacer")
+        print("[INFO] Se puede deshacer con la opción 15 mientras la consola siga abierta")
         confirmacion = input("\n¿Está seguro? (s/n): ").strip().lower()
         
         if confirmacion == 's':
             segunda_confirmacion = input("Escriba 'CONFIRMAR' para proceder: ").strip()
             if segunda_confirmacion == 'CONFIRMAR':
-                self.gestor.limpiar_datos()
-                print("\n[OK] Todos los datos han sido eliminados")
+                recortadas = self.gestor.limpiar_datos()
+                print("\n[OK] Todos los datos han sido eliminados (opción 15 para deshacer)")
+                self.avisar_historial_recortado(recortadas)
             else:
                 print("\n[INFO] Operación cancelada")
         else:
@@ -470,6 +587,85 @@ class AplicacionGestorEstudiantes:
         
         self.pausar()
     
+    def importar_datos_menu(self):
+        """Menú para importar estudiantes desde CSV o NDJSON."""
+        self.limpiar_pantalla()
+        print("\n" + "="*60)
+        print("   IMPORTAR ESTUDIANTES")
+        print("="*60)
+        
+        ruta = input("\nArchivo a importar (.csv, .ndjson o .jsonl): ").strip()
+        if not ruta:
+            print("\n[INFO] Operación cancelada")
+            self.pausar()
+            return
+        
+        try:
+            reporte = self.gestor.importar(ruta)
+            print(f"\n[OK] Importación completada en {reporte['segundos']} s "
+                  f"({reporte['filas_por_segundo']} filas/s)")
+            print(f"   - Filas leídas: {reporte['filas']}")
+            print(f"   - Importados: {reporte['importados']}")
+            print(f"   - Duplicados omitidos: {reporte['duplicados']}")
+            print(f"   - Inválidos: {reporte['invalidos']}")
+            for error in reporte["errores"]:
+                print(f"     Línea {error['linea']}: {error['error']}")
+        except (OSError, ValueError) as e:
+            print(f"\n[ERROR] {e}")
+        
+        self.pausar()
+    
+    def exportar_datos_menu(self):
+        """Menú para exportar los estudiantes a CSV o NDJSON."""
+        self.limpiar_pantalla()
+        print("\n" + "="*60)
+        print("   EXPORTAR ESTUDIANTES")
+        print("="*60)
+        
+        ruta = input("\nArchivo de salida (.csv, .ndjson o .jsonl): ").strip()
+        if not ruta:
+            print("\n[INFO] Operación cancelada")
+            self.pausar()
+            return
+        
+        try:
+            reporte = self.gestor.exportar(ruta)
+            print(f"\n[OK] {reporte['filas']} estudiante(s) exportados en {reporte['segundos']} s "
+                  f"({reporte['filas_por_segundo']} filas/s)")
+        except (OSError, ValueError) as e:
+            print(f"\n[ERROR] {e}")
+        
+        self.pausar()
+    
+    def deshacer_menu(self):
+        """Menú para deshacer la última operación que modificó los datos."""
+        self.limpiar_pantalla()
+        print("\n" + "="*60)
+        print("   DESHACER")
+        print("="*60)
+        
+        if self.gestor.deshacer():
+            print(f"\n[OK] Operación deshecha. Total de estudiantes: {self.gestor.total_estudiantes}")
+            print("[INFO] Los cambios no se guardan en el archivo hasta usar la opción 10")
+        else:
+            print("\n[INFO] No hay operaciones para deshacer")
+        
+        self.pausar()
+    
+    def rehacer_menu(self):
+        """Menú para volver a aplicar la última operación deshecha."""
+        self.limpiar_pantalla()
+        print("\n" + "="*60)
+        print("   REHACER")
+        print("="*60)
+        
+        if self.gestor.rehacer():
+            print(f"\n[OK] Operación rehecha. Total de estudiantes: {self.gestor.total_estudiantes}")
+        else:
+            print("\n[INFO] No hay operaciones para rehacer")
+        
+        self.pausar()
+    
     def ejecutar(self):
         """Ejecuta el bucle principal de la aplicación."""
         while True:
@@ -503,6 +699,14 @@ class AplicacionGestorEstudiantes:
                     self.cargar_datos_menu()
                 elif opcion == '12':
                     self.limpiar_datos_menu()
+                elif opcion == '13':
+                    self.importar_datos_menu()
+                elif opcion == '14':
+                    self.exportar_datos_menu()
+                elif opcion == '15':
+                    self.deshacer_menu()
+                elif opcion == '16':
+                    self.rehacer_menu()
                 elif opcion == '0':
                     self.limpiar_pantalla()
                     print("\n" + "="*60)
@@ -0,0 +1,339 @@
+# Interfaz de linea de comandos no interactiva
+# Cada subcomando carga los datos una sola vez, hace su trabajo y escribe
+# el resultado como JSON en la salida estandar (NDJSON en "consultar").
+# Los tiempos de cada etapa se informan en la salida de errores para no
+# mezclarlos con los datos.
+#
+# Uso (desde la raiz del proyecto):
+#   python main.py [-a archivo.json] <subcomando> [opciones]
+#   python main.py consultar lote.ndjson        (o "-" para leer de stdin)
+#
+# Los modulos del gestor se importan recien al ejecutar un subcomando, asi
+# "--help" y los errores de uso responden sin cargar nada.
+
+import argparse
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+ARCHIVO_POR_DEFECTO = "Archivos/estudiantes.json"
+
+
+class Tiempos:
+    """Acumula la duracion de cada etapa de un comando."""
+
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.etapas = {}
+
+    @contextmanager
+    def etapa(self, nombre):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.etapas[nombre] = self.etapas.get(nombre, 0.0) + time.perf_counter() - inicio
+
+    def reporte(self):
+        tiempos = {nombre: round(segundos, 4) for nombre, segundos in self.etapas.items()}
+        tiempos["total"] = round(time.perf_counter() - self.inicio, 4)
+        return tiempos
+
+
+def _escribir(datos):
+    sys.stdout.write(json.dumps(datos, ensure_ascii=False) + "\n")
+
+
+def _abrir_gestor(args, tiempos, perezoso=False):
+    """Importa el gestor y carga el archivo, midiendo ambas etapas."""
+    with tiempos.etapa("importar_modulos"):
+        from Logica.Gestor import GestorEstudiantes
+    with tiempos.etapa("carga"):
+        gestor = GestorEstudiantes(args.archivo, cargar_automatico=False)
+        if os.path.exists(args.archivo):
+            if perezoso:
+                gestor.abrir_perezoso()
+            else:
+                exito, reporte = gestor.cargar_desde_json(devolver_reporte=True)
+                if not exito:
+                    raise RuntimeError(reporte["error"])
+    return gestor
+
+
+def _guardar(gestor, tiempos, compacto=False):
+    with tiempos.etapa("guardado"):
+        if not gestor.guardar_en_json(compacto):
+            raise RuntimeError(f"No se pudo guardar {gestor.archivo_json}")
+
+
+def comando_importar(args, tiempos):
+    gestor = _abrir_gestor(args, tiempos)
+    with tiempos.etapa("operacion"):
+        reporte = gestor.importar(args.origen, args.formato, todo_o_nada=args.todo_o_nada)
+    if reporte["importados"]:
+        _guardar(gestor, tiempos)
+    return reporte
+
+
+def comando_exportar(args, tiempos):
+    gestor = _abrir_gestor(args, tiempos, perezoso=True)
+    with tiempos.etapa("operacion"):
+        return gestor.exportar(args.destino, args.formato)
+
+
+def comando_estadisticas(args, tiempos):
+    gestor = _abrir_gestor(args, tiempos)
+    with tiempos.etapa("operacion"):
+        resultado = gestor.obtener_estadisticas()
+        if args.memoria:
+            resultado["memoria"] = gestor.uso_memoria()
+    return resultado
+
+
+def comando_compactar(args, tiempos):
+    antes = os.path.getsize(args.archivo) if os.path.exists(args.archivo) else 0
+    gestor = _abrir_gestor(args, tiempos)
+    _guardar(gestor, tiempos, compacto=True)
+    return {"estudiantes": gestor.total_estudiantes, "bytes_antes": antes,
+            "bytes_despues": os.path.getsize(args.archivo)}
+
+
+def comando_bench(args, tiempos):
+    import random
+    gestor = _abrir_gestor(args, tiempos)
+    if args.congelar:
+        gestor.congelar()
+        with tiempos.etapa("compilacion"):
+            gestor.compilar_estatico()
+
+    ids = [est.id_estudiante for est in gestor.iterar_estudiantes()]
+    aleatorio = random.Random(args.semilla)
+    muestra = [aleatorio.choice(ids) for _ in range(args.busquedas)] if ids else []
+    resultado = {"estudiantes": gestor.total_estudiantes, "busquedas": len(muestra)}
+
+    with tiempos.etapa("operacion"):
+        inicio = time.perf_counter()
+        for id_estudiante in muestra:
+            gestor.buscar_estudiante(id_estudiante)
+        segundos = time.perf_counter() - inicio
+        resultado["busquedas_por_segundo"] = round(len(muestra) / segundos) if segundos > 0 else None
+
+        inicio = time.perf_counter()
+        gestor.buscar_muchos(muestra)
+        segundos = time.perf_counter() - inicio
+        resultado["lote_por_segundo"] = round(len(muestra) / segundos) if segundos > 0 else None
+    return resultado
+
+
+# Operaciones de un lote de "consultar": nombre -> (funcion, modifica_datos)
+def _op_buscar(gestor, op):
+    estudiante = gestor.buscar_estudiante(op["id"])
+    return estudiante.to_dict() if estudiante is not None else None
+
+
+def _op_buscar_muchos(gestor, op):
+    return [est.to_dict() if est is not None else None for est in gestor.buscar_muchos(op["ids"])]
+
+
+def _op_rango(gestor, op):
+    return [est.to_dict() for est in gestor.buscar_rango_ids(op["id_min"], op["id_max"])]
+
+
+def _op_nombre(gestor, op):
+    return [est.to_dict() for est in gestor.buscar_por_nombre(op["texto"])]
+
+
+def _op_carrera(gestor, op):
+    return [est.to_dict() for est in gestor.buscar_por_carrera(op["texto"])]
+
+
+def _op_autocompletar(gestor, op):
+    return [est.to_dict() for est in gestor.autocompletar(op["texto"], op.get("k", 10))]
+
+
+def _op_estadisticas(gestor, op):
+    return gestor.obtener_estadisticas()
+
+
+def _op_agregar(gestor, op):
+    from Logica.Validacion import validar_registro
+    estudiante, error = validar_registro(op["estudiante"])
+    if error:
+        raise ValueError(error)
+    return gestor.agregar_estudiante(estudiante)
+
+
+def _op_actualizar(gestor, op):
+    return gestor.actualizar_estudiante(op["id"], **op["cambios"])
+
+
+def _op_eliminar(gestor, op):
+    return gestor.eliminar_estudiante(op["id"])
+
+
+def _op_actualizar_muchos(gestor, op):
+    # "donde": igualdad de campos; "incrementar": sumas, p. ej. {"semestre": 1}
+    donde = op.get("donde", {})
+    cambios = dict(op.get("cambios", {}))
+    for campo, incremento in op.get("incrementar", {}).items():
+        cambios[campo] = lambda est, campo=campo, incremento=incremento: getattr(est, campo) + incremento
+    return gestor.actualizar_muchos(
+        lambda est: all(getattr(est, campo, None) == valor for campo, valor in donde.items()),
+        cambios, simular=op.get("simular", False))
+
+
+OPERACIONES = {
+    "buscar": (_op_buscar, False),
+    "buscar_muchos": (_op_buscar_muchos, False),
+    "rango": (_op_rango, False),
+    "nombre": (_op_nombre, False),
+    "carrera": (_op_carrera, False),
+    "autocompletar": (_op_autocompletar, False),
+    "estadisticas": (_op_estadisticas, False),
+    "agregar": (_op_agregar, True),
+    "actualizar": (_op_actualizar, True),
+    "eliminar": (_op_eliminar, True),
+    "actualizar_muchos": (_op_actualizar_muchos, True),
+}
+
+
+def comando_consultar(args, tiempos):
+    """
+    Ejecuta un lote de operaciones, una por linea en JSON, por ejemplo
+    {"op": "buscar", "id": 42}. Cada resultado se escribe como una linea
+    {"linea", "op", "ok", "resultado"} o {"linea", "ok": false, "error"}.
+    Si alguna operacion modifico los datos, al final se guarda el archivo.
+    Con --atomico el lote es una transaccion: si alguna operacion falla se
+    revierten todas y no se guarda nada.
+    """
+    gestor = _abrir_gestor(args, tiempos)
+    if args.congelar:
+        gestor.congelar()
+    if args.atomico:
+        gestor.iniciar_transaccion()
+
+    entrada = sys.stdin if args.lote == "-" else open(args.lote, "r", encoding="utf-8")
+    resumen = {"operaciones": 0, "errores": 0, "modificaciones": 0}
+    try:
+        with tiempos.etapa("operacion"):
+            for numero, linea in enumerate(entrada, 1):
+                if not linea.strip():
+                    continue
+                resumen["operaciones"] += 1
+                salida = {"linea": numero}
+                try:
+                    op = json.loads(linea)
+                    salida["op"] = op.get("op")
+                    if salida["op"] not in OPERACIONES:
+                        raise ValueError(f"Operación desconocida: {salida['op']}")
+                    funcion, modifica = OPERACIONES[salida["op"]]
+                    salida["resultado"] = funcion(gestor, op)
+                    salida["ok"] = True
+                    if modifica and salida["resultado"] and not op.get("simular"):
+                        resumen["modificaciones"] += 1
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    salida["ok"] = False
+                    salida["error"] = str(e) if not isinstance(e, KeyError) else f"Falta el campo {e}"
+                    resumen["errores"] += 1
+                _escribir(salida)
+    except BaseException:
+        if args.atomico:
+            gestor.revertir_transaccion()
+        raise
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+
+    if args.atomico:
+        if resumen["errores"]:
+            with tiempos.etapa("reversion"):
+                gestor.revertir_transaccion()
+            resumen["revertido"] = True
+            resumen["modificaciones"] = 0
+        else:
+            gestor.confirmar_transaccion()
+
+    if resumen["modificaciones"] and not args.sin_guardar:
+        _guardar(gestor, tiempos)
+    return resumen
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Gestión de estudiantes sin menú interactivo. Sin argumentos se abre la consola.")
+    parser.add_argument("-a", "--archivo", default=ARCHIVO_POR_DEFECTO,
+                        help=f"Archivo de estudiantes (por defecto {ARCHIVO_POR_DEFECTO})")
+    parser.add_argument("--sin-tiempos", action="store_true",
+                        help="No informar los tiempos por etapa en la salida de errores")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    importar = subcomandos.add_parser("importar", aliases=["import"], help="Importar CSV o NDJSON")
+    importar.add_argument("origen")
+    importar.add_argument("--formato", choices=["csv", "ndjson"])
+    importar.add_argument("--todo-o-nada", action="store_true",
+                          help="No importar ninguna fila si alguna es inválida")
+    importar.set_defaults(funcion=comando_importar)
+
+    exportar = subcomandos.add_parser("exportar", aliases=["export"], help="Exportar a CSV o NDJSON")
+    exportar.add_argument("destino")
+    exportar.add_argument("--formato", choices=["csv", "ndjson"])
+    exportar.set_defaults(funcion=comando_exportar)
+
+    consultar = subcomandos.add_parser("consultar", aliases=["query"],
+                                       help="Ejecutar un lote de operaciones NDJSON")
+    consultar.add_argument("lote", nargs="?", default="-", help="Archivo del lote o - para stdin")
+    consultar.add_argument("--congelar", action="store_true",
+                           help="Usar el modo congelado para las lecturas por ID")
+    consultar.add_argument("--sin-guardar", action="store_true",
+                           help="No guardar el archivo aunque el lote lo modifique")
+    consultar.add_argument("--atomico", action="store_true",
+                           help="Si alguna operación falla, revertir todo el lote")
+    consultar.set_defaults(funcion=comando_consultar)
+
+    estadisticas = subcomandos.add_parser("estadisticas", aliases=["stats"], help="Estadísticas generales")
+    estadisticas.add_argument("--memoria", action="store_true", help="Incluir el uso de memoria")
+    estadisticas.set_defaults(funcion=comando_estadisticas)
+
+    bench = subcomandos.add_parser("bench", help="Medir búsquedas por ID sobre los datos cargados")
+    bench.add_argument("--busquedas", type=int, default=100000)
+    bench.add_argument("--semilla", type=int, default=1)
+    bench.add_argument("--congelar", action="store_true")
+    bench.set_defaults(funcion=comando_bench)
+
+    compactar = subcomandos.add_parser("compactar", aliases=["compact"],
+                                       help="Reescribir el archivo en formato compacto")
+    compactar.set_defaults(funcion=comando_compactar)
+    return parser
+
+
+def main(argv=None):
+    """
+    Ejecuta un subcomando.
+
+    Returns:
+        Codigo de salida: 0 si termino bien, 1 si fallo
+    """
+    args = crear_parser().parse_args(argv)
+    tiempos = Tiempos()
+    codigo = 0
+    try:
+        resultado = args.funcion(args, tiempos)
+        if resultado is not None and args.funcion is not comando_consultar:
+            _escribir(resultado)
+        elif resultado is not None:
+            # En "consultar" la salida estandar ya tiene los resultados
+            print(json.dumps({"resumen": resultado}, ensure_ascii=False), file=sys.stderr)
+    except (OSError, RuntimeError, ValueError) as e:
+        _escribir({"error": str(e)})
+        codigo = 1
+
+    if not args.sin_tiempos:
+        print(json.dumps({"tiempos": tiempos.reporte()}), file=sys.stderr)
+    return codigo
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+# Barra de progreso de consola para operaciones largas (carga y guardado)
+# La operacion corre en un hilo de trabajo que solo actualiza contadores;
+# el hilo de la interfaz dibuja la barra a intervalos fijos.
+
+import sys
+import threading
+import time
+
+ANCHO_BARRA = 30
+INTERVALO_DIBUJO = 0.1   # segundos entre redibujos
+
+
+def _formato_tiempo(segundos):
+    minutos, segundos = divmod(int(segundos), 60)
+    horas, minutos = divmod(minutos, 60)
+    if horas:
+        return f"{horas}:{minutos:02d}:{segundos:02d}"
+    return f"{minutos:02d}:{segundos:02d}"
+
+
+class BarraProgreso:
+    """
+    Estado de una operacion en curso: registros procesados, total esperado
+    (si se conoce), registros por segundo y tiempo restante estimado.
+    """
+
+    def __init__(self, titulo):
+        self.titulo = titulo
+        self.procesados = 0
+        self.total = None
+        self.inicio = time.perf_counter()
+        # Momento en que se procesaron todos los registros (luego puede
+        # quedar trabajo, como construir el arbol)
+        self.fin = None
+        self._ultimo_dibujo = 0.0
+
+    def actualizar(self, procesados, total=None):
+        """Lo llama el hilo de trabajo; solo guarda los contadores."""
+        self.procesados = procesados
+        self.total = total
+        if total is not None and procesados >= total and self.fin is None:
+            self.fin = time.perf_counter()
+
+    def texto(self):
+        transcurrido = (self.fin or time.perf_counter()) - self.inicio
+        velocidad = self.procesados / transcurrido if transcurrido > 0 else 0
+        partes = [self.titulo]
+
+        if self.total:
+            fraccion = min(1.0, self.procesados / self.total)
+            llenos = int(fraccion * ANCHO_BARRA)
+            partes.append(f"[{'#' * llenos}{'-' * (ANCHO_BARRA - llenos)}] {fraccion * 100:5.1f}%")
+            partes.append(f"{self.procesados}/{self.total}")
+        else:
+            partes.append(f"{self.procesados} registros")
+
+        partes.append(f"{velocidad:,.0f} reg/s")
+        if self.fin is not None:
+            partes.append("finalizando...")
+        elif self.total and velocidad > 0:
+            restante = max(0, self.total - self.procesados) / velocidad
+            partes.append(f"ETA {_formato_tiempo(restante)}")
+        return "  ".join(partes)
+
+    def dibujar(self, forzar=False):
+        """Redibuja la linea de progreso, como maximo cada INTERVALO_DIBUJO segundos."""
+        ahora = time.perf_counter()
+        if not forzar and ahora - self._ultimo_dibujo < INTERVALO_DIBUJO:
+            return
+        self._ultimo_dibujo = ahora
+        sys.stdout.write("\r" + self.texto() + "\033[K")
+        sys.stdout.flush()
+
+
+def ejecutar_con_progreso(titulo, operacion):
+    """
+    Ejecuta operacion(al_progresar, cancelar) en un hilo de trabajo mientras
+    la consola muestra la barra de progreso. Ctrl+C activa la cancelacion;
+    la operacion debe revisar el evento y terminar sin modificar los datos.
+
+    Returns:
+        Tupla (resultado, cancelado); si la operacion lanzo una excepcion,
+        se vuelve a lanzar aqui
+    """
+    barra = BarraProgreso(titulo)
+    cancelar = threading.Event()
+    # Se espera sobre un evento y no con join: un Ctrl+C durante join
+    # puede dejar al hilo marcado como terminado antes de tiempo
+    terminado = threading.Event()
+    salida = {}
+
+    def trabajar():
+        try:
+            salida["resultado"] = operacion(barra.actualizar, cancelar)
+        except BaseException as e:
+            salida["error"] = e
+        finally:
+            terminado.set()
+
+    hilo = threading.Thread(target=trabajar, name=titulo, daemon=True)
+    hilo.start()
+    print("(Ctrl+C para cancelar)")
+
+    while not terminado.is_set():
+        try:
+            terminado.wait(INTERVALO_DIBUJO)
+            barra.dibujar()
+        except KeyboardInterrupt:
+            if not cancelar.is_set():
+                cancelar.set()
+                sys.stdout.write("\nCancelando...\n")
+    hilo.join()
+
+    barra.dibujar(forzar=True)
+    sys.stdout.write("\n")
+
+    if "error" in salida:
+        raise salida["error"]
+    return salida.get("resultado"), cancelar.is_set()
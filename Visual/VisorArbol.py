@@ -0,0 +1,214 @@
+# Modulo de visualizacion y exportacion de la estructura del arbol AVL
+# Los recorridos son iterativos (pila explicita) para que arboles muy
+# profundos no desborden la pila de recursion de Python.
+
+import json
+from Logica.Arboles import NodoAVL
+
+# Códigos ANSI para colores
+CYAN = "\033[36m"
+RESET = "\033[0m"
+
+VACIO = " ⃠"
+OCULTO = "…"
+
+
+def _representar_nodo(nodo, color=True):
+    """Texto de un nodo: ID, nombre corto y factor de balanceo."""
+    if isinstance(nodo, NodoAVL):
+        nombre_corto = nodo.valor.nombre[:15] + "..." if len(nodo.valor.nombre) > 15 else nodo.valor.nombre
+        if color:
+            return f"ID:{nodo.valor.id_estudiante} ({nombre_corto}) [{CYAN}FB:{nodo.factor_balance}{RESET}]"
+        return f"ID:{nodo.valor.id_estudiante} ({nombre_corto}) [FB:{nodo.factor_balance}]"
+    return f"ID:{nodo.valor.id_estudiante} ({nodo.valor.nombre})"
+
+
+def lineas_arbol(raiz, profundidad_max=None, color=True):
+    """
+    Genera las lineas de la visualizacion del arbol en pre-orden.
+
+    Args:
+        raiz: Nodo desde el que se dibuja (raiz del arbol o de un subarbol)
+        profundidad_max: Niveles a mostrar debajo de la raiz (None = todos)
+        color: Si es True, el factor de balanceo se muestra en cian
+
+    Yields:
+        Cada linea de texto (sin salto de linea)
+    """
+    if raiz is None:
+        return
+
+    # Cada entrada: (nodo, prefijo, es_izquierdo, profundidad)
+    # nodo=None representa un hijo vacio que solo se dibuja como marcador
+    pila = [(raiz, "", None, 0)]
+
+    while pila:
+        nodo, prefijo, es_izquierdo, profundidad = pila.pop()
+
+        if es_izquierdo is None:
+            conector = ""
+        elif es_izquierdo:
+            conector = prefijo + "├── "
+        else:
+            conector = prefijo + "└── "
+
+        if nodo is None:
+            yield conector + VACIO
+            continue
+
+        yield conector + _representar_nodo(nodo, color)
+
+        if nodo.hijos[0] is None and nodo.hijos[1] is None:
+            continue
+
+        # Preparar el nuevo prefijo para los hijos
+        if es_izquierdo is None:
+            nuevo_prefijo = ""
+        elif es_izquierdo:
+            nuevo_prefijo = prefijo + "│   "
+        else:
+            nuevo_prefijo = prefijo + "    "
+
+        # Limite de profundidad: se indica que hay nodos sin mostrar
+        if profundidad_max is not None and profundidad >= profundidad_max:
+            yield nuevo_prefijo + "└── " + OCULTO
+            continue
+
+        # Se apila primero el derecho para que el izquierdo salga antes
+        pila.append((nodo.hijos[1], nuevo_prefijo, False, profundidad + 1))
+        pila.append((nodo.hijos[0], nuevo_prefijo, True, profundidad + 1))
+
+
+def renderizar_arbol(raiz, profundidad_max=None, color=True):
+    """
+    Construye toda la visualizacion en un solo string para escribirla
+    de una vez en lugar de hacer un print por nodo.
+    """
+    return "\n".join(lineas_arbol(raiz, profundidad_max, color))
+
+
+def _nodo_a_dict(nodo):
+    """Datos de un nodo para la exportacion (sin sus hijos)."""
+    datos = {
+        "id_estudiante": nodo.valor.id_estudiante,
+        "nombre": nodo.valor.nombre,
+    }
+    if isinstance(nodo, NodoAVL):
+        datos["altura"] = nodo.altura
+        datos["factor_balance"] = nodo.factor_balance
+    return datos
+
+
+def _abrir_salida(salida):
+    """Acepta una ruta o un objeto archivo ya abierto."""
+    if hasattr(salida, "write"):
+        return salida, False
+    return open(salida, "w", encoding="utf-8"), True
+
+
+def _escapar_dot(texto):
+    """Escapa comillas y barras para un string entre comillas de DOT."""
+    return texto.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def exportar_dot(raiz, salida, profundidad_max=None):
+    """
+    Exporta la estructura del arbol en formato Graphviz DOT.
+    Se escribe nodo por nodo, sin construir el documento en memoria.
+    Los IDs de nodo van entre comillas ("n-5"): los IDs negativos son
+    validos para el gestor pero no como identificadores DOT sin comillas.
+
+    Args:
+        raiz: Nodo desde el que se exporta
+        salida: Ruta del archivo o objeto con metodo write
+        profundidad_max: Niveles a exportar debajo de la raiz (None = todos)
+
+    Returns:
+        Numero de nodos exportados
+    """
+    archivo, cerrar = _abrir_salida(salida)
+    exportados = 0
+    try:
+        archivo.write("digraph ArbolAVL {\n")
+        archivo.write('    node [shape=box, fontname="Helvetica"];\n')
+
+        pila = [(raiz, 0)] if raiz is not None else []
+        while pila:
+            nodo, profundidad = pila.pop()
+            datos = _nodo_a_dict(nodo)
+            partes = [f"ID:{datos['id_estudiante']}", datos["nombre"]]
+            if "factor_balance" in datos:
+                partes.append(f"FB:{datos['factor_balance']}")
+            etiqueta = "\\n".join(_escapar_dot(parte) for parte in partes)
+            archivo.write(f"    \"n{datos['id_estudiante']}\" [label=\"{etiqueta}\"];\n")
+            exportados += 1
+
+            if profundidad_max is not None and profundidad >= profundidad_max:
+                continue
+
+            for lado, hijo in (("izq", nodo.hijos[0]), ("der", nodo.hijos[1])):
+                if hijo is not None:
+                    archivo.write(f"    \"n{datos['id_estudiante']}\" -> \"n{hijo.valor.id_estudiante}\" [label=\"{lado}\"];\n")
+                    pila.append((hijo, profundidad + 1))
+
+        archivo.write("}\n")
+    finally:
+        if cerrar:
+            archivo.close()
+    return exportados
+
+
+def exportar_json(raiz, salida, profundidad_max=None):
+    """
+    Exporta la estructura del arbol como JSON anidado
+    ({..., "izquierdo": {...}, "derecho": {...}}).
+    El documento se escribe en streaming con un recorrido iterativo.
+
+    Args:
+        raiz: Nodo desde el que se exporta
+        salida: Ruta del archivo o objeto con metodo write
+        profundidad_max: Niveles a exportar debajo de la raiz (None = todos)
+
+    Returns:
+        Numero de nodos exportados
+    """
+    archivo, cerrar = _abrir_salida(salida)
+    exportados = 0
+    try:
+        if raiz is None:
+            archivo.write("null\n")
+            return 0
+
+        # La pila mezcla nodos por abrir y fragmentos de texto por escribir
+        pila = [("nodo", raiz, 0)]
+        while pila:
+            tipo, elemento, profundidad = pila.pop()
+
+            if tipo == "texto":
+                archivo.write(elemento)
+                continue
+
+            if elemento is None:
+                archivo.write("null")
+                continue
+
+            # Se escribe el objeto sin la llave de cierre
+            cuerpo = json.dumps(_nodo_a_dict(elemento), ensure_ascii=False)[:-1]
+            archivo.write(cuerpo)
+            exportados += 1
+
+            if profundidad_max is not None and profundidad >= profundidad_max:
+                archivo.write("}")
+                continue
+
+            pila.append(("texto", "}", profundidad))
+            pila.append(("nodo", elemento.hijos[1], profundidad + 1))
+            pila.append(("texto", ', "derecho": ', profundidad))
+            pila.append(("nodo", elemento.hijos[0], profundidad + 1))
+            pila.append(("texto", ', "izquierdo": ', profundidad))
+
+        archivo.write("\n")
+    finally:
+        if cerrar:
+            archivo.close()
+    return exportados
@@ -0,0 +1,2 @@
+# Con este archivo en la raiz, pytest agrega la raiz del proyecto al
+# sys.path y las pruebas importan Logica.* igual que main.py
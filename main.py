@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
 # Script de entrada principal para el Sistema de Gestión de Estudiantes
+# Sin argumentos abre la consola interactiva; con argumentos ejecuta un
+# subcomando sin menú (ver Visual/Comandos.py y "python main.py --help")
 
-from Visual.App import AplicacionGestorEstudiantes
+import sys
 
 if __name__ == "__main__":
     
+    if len(sys.argv) > 1:
+        from Visual.Comandos import main
+        sys.exit(main(sys.argv[1:]))
+    
+    from Visual.App import AplicacionGestorEstudiantes
     app = AplicacionGestorEstudiantes()
     app.ejecutar()
@@ -0,0 +1,15 @@
+# Datos compartidos por las pruebas
+
+import pytest
+
+from Logica.Gestor import GestorEstudiantes
+from Benchmarks.sinteticos import generar_estudiantes
+
+
+@pytest.fixture
+def gestor(tmp_path):
+    """Gestor con 300 estudiantes sintéticos y el historial vacío."""
+    gestor = GestorEstudiantes(str(tmp_path / "estudiantes.json"), cargar_automatico=False)
+    gestor.reconstruir(generar_estudiantes(300))
+    gestor.historial.vaciar()
+    return gestor
@@ -0,0 +1,81 @@
+# Pruebas de la actualización masiva por predicado (GestorEstudiantes.actualizar_muchos)
+
+import gc
+
+import pytest
+
+from utilidades import foto
+
+
+def promover(gestor, simular=False):
+    return gestor.actualizar_muchos(lambda est: est.semestre < 12,
+                                    {"semestre": lambda est: est.semestre + 1}, simular=simular)
+
+
+def test_simular_no_modifica_el_arbol(gestor):
+    gestor.modificado = False
+    antes = foto(gestor)
+    resultados = promover(gestor, simular=True)
+
+    assert foto(gestor) == antes
+    assert not gestor.modificado
+    assert len(gestor.historial.deshacer) == 0
+    esperados = [est for est in antes if est["semestre"] < 12]
+    assert [r["id_estudiante"] for r in resultados] == [est["id_estudiante"] for est in esperados]
+    assert all(r["cambios"] == {"semestre": [est["semestre"], est["semestre"] + 1]}
+               for r, est in zip(resultados, esperados))
+
+
+def test_simular_informa_los_errores(gestor):
+    antes = foto(gestor)
+    resultados = gestor.actualizar_muchos(None, {"edad": lambda est: est.edad + 70}, simular=True)
+    assert foto(gestor) == antes
+    errores = [r for r in resultados if "error" in r]
+    assert errores and all(est["edad"] + 70 > 100 for est in antes
+                           if est["id_estudiante"] in {r["id_estudiante"] for r in errores})
+
+
+def test_un_valor_invalido_no_modifica_ninguno(gestor):
+    antes = foto(gestor)
+    with pytest.raises(ValueError, match="no se modificó ninguno"):
+        gestor.actualizar_muchos(None, {"semestre": lambda est: est.semestre + 1})
+    with pytest.raises(ValueError, match="Campos no actualizables"):
+        gestor.actualizar_muchos(None, {"id_estudiante": 1})
+    assert foto(gestor) == antes
+
+
+def test_actualizar_indices_y_deshacer(gestor):
+    antes = foto(gestor)
+    gestor.obtener_indice("semestre")
+
+    modificados = gestor.actualizar_muchos(lambda est: est.semestre == 3, {"semestre": 4, "carrera": "Arte"})
+    esperados = [est for est in antes if est["semestre"] == 3]
+    assert modificados == len(esperados)
+    for est in esperados:
+        estudiante = gestor.buscar_estudiante(est["id_estudiante"])
+        assert (estudiante.semestre, estudiante.carrera) == (4, "Arte")
+        assert estudiante.carrera is gestor.pool.codificar("Arte")[0]
+    # Pocos cambios: el índice se corrige por registro en lugar de descartarse
+    assert "semestre" in gestor.indices
+    assert gestor.buscar_por_rango("semestre", 3, 4) == \
+        [est for est in gestor.iterar_estudiantes() if est.semestre == 4]
+    assert not [est for est in gestor.iterar_estudiantes() if est.semestre == 3]
+
+    # Una sola unidad de deshacer
+    gestor.deshacer()
+    assert foto(gestor) == antes
+    gestor.rehacer()
+    assert all(gestor.buscar_estudiante(est["id_estudiante"]).semestre == 4 for est in esperados)
+
+
+def test_sin_cambios_no_anota_nada(gestor):
+    assert gestor.actualizar_muchos(lambda est: est.semestre == 5, {"semestre": 5}) == 0
+    assert len(gestor.historial.deshacer) == 0
+
+
+def test_no_toca_el_recolector(gestor, monkeypatch):
+    def prohibido():
+        raise AssertionError("actualizar_muchos no debe cambiar el estado global del recolector")
+    monkeypatch.setattr(gc, "disable", prohibido)
+    monkeypatch.setattr(gc, "enable", prohibido)
+    assert promover(gestor) > 0
@@ -0,0 +1,97 @@
+import random
+
+import pytest
+
+from Logica.Arboles import construir_desde_ordenados, separar_rango, union_arboles, dividir
+
+
+def claves(raiz):
+    """Recorrido en orden que además comprueba padres, alturas y balance."""
+    resultado = []
+
+    def recorrer(nodo, padre):
+        if nodo is None:
+            return 0
+        assert nodo.padre is padre
+        altura_izquierda = recorrer(nodo.hijos[0], nodo)
+        resultado.append(nodo.valor)
+        altura_derecha = recorrer(nodo.hijos[1], nodo)
+        assert nodo.altura == 1 + max(altura_izquierda, altura_derecha)
+        assert abs(altura_derecha - altura_izquierda) <= 1
+        return nodo.altura
+
+    recorrer(raiz, None)
+    assert resultado == sorted(set(resultado))
+    return resultado
+
+
+def test_construir_desde_ordenados_queda_balanceado():
+    assert construir_desde_ordenados([]) is None
+    assert claves(construir_desde_ordenados(range(1000))) == list(range(1000))
+
+
+@pytest.mark.parametrize("minimo, maximo", [
+    (0, 99), (-5, 10), (30, 60), (90, 200), (50, 50), (200, 300), (60, 30),
+])
+def test_separar_rango(minimo, maximo):
+    raiz = construir_desde_ordenados(range(0, 100))
+    resto, rango = separar_rango(raiz, minimo, maximo)
+    esperado = [clave for clave in range(100) if minimo <= clave <= maximo]
+    assert claves(rango) == esperado
+    assert claves(resto) == [clave for clave in range(100) if clave not in esperado]
+
+
+def test_dividir_por_clave_ausente():
+    menores, nodo, mayores = dividir(construir_desde_ordenados(range(0, 100, 2)), 51)
+    assert nodo is None
+    assert claves(menores) == list(range(0, 51, 2))
+    assert claves(mayores) == list(range(52, 100, 2))
+
+
+def test_union_arboles_sin_solapamiento_y_desbalanceados():
+    union = union_arboles(construir_desde_ordenados(range(0, 1000)),
+                          construir_desde_ordenados(range(2000, 2003)))
+    assert claves(union) == list(range(0, 1000)) + [2000, 2001, 2002]
+
+
+def test_union_arboles_con_repetidos_y_elegir():
+    aleatorio = random.Random(3)
+    a = sorted(aleatorio.sample(range(500), 200))
+    b = sorted(aleatorio.sample(range(500), 50))
+    nodos_b = {}
+
+    def elegir(nodo_a, nodo_b):
+        nodos_b[nodo_b.valor] = nodo_b
+        return nodo_b
+
+    union = union_arboles(construir_desde_ordenados(a), construir_desde_ordenados(b), elegir)
+    assert claves(union) == sorted(set(a) | set(b))
+    assert set(nodos_b) == set(a) & set(b)
+
+
+def test_separar_y_volver_a_unir_conserva_todo():
+    aleatorio = random.Random(11)
+    valores = list(range(300))
+    raiz = construir_desde_ordenados(valores)
+    for _ in range(20):
+        minimo = aleatorio.randrange(300)
+        maximo = minimo + aleatorio.randrange(60)
+        raiz, rango = separar_rango(raiz, minimo, maximo)
+        raiz = union_arboles(raiz, rango)
+        assert claves(raiz) == valores
+
+
+def test_el_tamano_se_mantiene_al_dividir_y_unir():
+    from Logica.Arboles import NodoAVLConteo
+
+    def revisar(nodo):
+        if nodo is None:
+            return 0
+        tamano = 1 + revisar(nodo.hijos[0]) + revisar(nodo.hijos[1])
+        assert nodo.tamano == tamano
+        return tamano
+
+    raiz = construir_desde_ordenados(range(500), NodoAVLConteo)
+    resto, rango = separar_rango(raiz, 100, 349)
+    assert (revisar(resto), revisar(rango)) == (250, 250)
+    assert revisar(union_arboles(resto, rango)) == 500
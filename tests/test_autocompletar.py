@@ -0,0 +1,70 @@
+from Logica.Arboles import NodoRadix
+from Logica.Estudiante import Estudiante
+
+
+def palabras(raiz):
+    """Palabras guardadas en el arbol radix, en orden alfabetico."""
+    resultado = []
+    pila = [(raiz, "")]
+    while pila:
+        nodo, prefijo = pila.pop()
+        if nodo.ids is not None:
+            resultado.append(prefijo)
+        for hijo in nodo.hijos.values():
+            pila.append((hijo, prefijo + hijo.valor))
+    return sorted(resultado)
+
+
+def radix(*lista):
+    raiz = NodoRadix()
+    for palabra in lista:
+        raiz.agregar_hijo(palabra).ids = [len(palabra)]
+    return raiz
+
+
+def test_las_aristas_se_comprimen():
+    raiz = radix("romano", "romulo", "rubens")
+    assert list(raiz.hijos) == ["r"]
+    r = raiz.hijos["r"]
+    assert r.valor == "r"
+    assert sorted(h.valor for h in r.hijos.values()) == ["om", "ubens"]
+    assert palabras(raiz) == ["romano", "romulo", "rubens"]
+
+
+def test_buscar_palabra_y_prefijo():
+    raiz = radix("ana", "anabel", "andres")
+    assert raiz.buscar_nodo("ana") is not None
+    assert raiz.buscar_nodo("an") is None
+    assert raiz.buscar_nodo("anab") is None
+    assert raiz.buscar_prefijo("anab").valor == "bel"
+    assert raiz.buscar_prefijo("x") is None
+    assert [ids for ids in raiz.buscar_prefijo("an").iterar_ids()] == [[3], [6], [6]]
+
+
+def test_eliminar_poda_y_fusiona():
+    raiz = radix("ana", "anabel", "andres")
+    assert raiz.eliminar_nodo("ana")
+    assert not raiz.eliminar_nodo("ana")
+    assert palabras(raiz) == ["anabel", "andres"]
+    # "ana" ya no tiene IDs: su arista se fusiona con "bel"
+    assert raiz.buscar_prefijo("ana").valor == "abel"
+    raiz.eliminar_nodo("andres")
+    assert palabras(raiz) == ["anabel"]
+    assert raiz.hijos["a"].valor == "anabel"
+
+
+def test_autocompletar_en_el_gestor(gestor):
+    nuevos = [Estudiante("Ramón Álvarez", 20, "Arte", 1, 10**6),
+              Estudiante("Ramona Díaz", 20, "Arte", 1, 10**6 + 1),
+              Estudiante("Rafael Álvarez", 20, "Arte", 1, 10**6 + 2)]
+    gestor.autocompletar("x")  # construye el índice antes de los cambios
+    for estudiante in nuevos:
+        gestor.agregar_estudiante(estudiante)
+
+    ids = [e.id_estudiante for e in gestor.autocompletar("ramo", k=10)]
+    assert ids == [10**6, 10**6 + 1]
+    assert [e.id_estudiante for e in gestor.autocompletar("alvarez ra", k=10)] == [10**6 + 2, 10**6]
+    assert len(gestor.autocompletar("a", k=3)) == 3
+
+    gestor.eliminar_estudiante(10**6)
+    assert [e.id_estudiante for e in gestor.autocompletar("ramo")] == [10**6 + 1]
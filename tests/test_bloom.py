@@ -0,0 +1,96 @@
+# Pruebas del filtro de Bloom sobre los IDs (módulo Bloom)
+
+import os
+
+from Logica.Bloom import FiltroBloom, ruta_filtro
+from Logica.Estudiante import Estudiante
+from Logica.Gestor import GestorEstudiantes
+from Benchmarks.sinteticos import generar_estudiantes
+from utilidades import escribir, registro
+
+
+def ids_del_arbol(gestor):
+    return [est.id_estudiante for est in gestor.iterar_estudiantes()]
+
+
+def sin_falsos_negativos(gestor):
+    ids = ids_del_arbol(gestor)
+    assert all(id_estudiante in gestor._filtro for id_estudiante in ids)
+    assert all(gestor.buscar_estudiante(id_estudiante) is not None for id_estudiante in ids)
+
+
+def test_filtro_sin_falsos_negativos_y_tasa_acotada():
+    filtro = FiltroBloom.construir(range(0, 20000, 2), 10000)
+    assert all(clave in filtro for clave in range(0, 20000, 2))
+    falsos = sum(1 for clave in range(1, 20000, 2) if clave in filtro)
+    assert falsos / 10000 < 0.03
+    assert filtro.tasa_estimada() < 0.03
+    assert not filtro.lleno()
+
+
+def test_altas_y_bajas_no_dejan_falsos_negativos(tmp_path):
+    gestor = GestorEstudiantes(str(tmp_path / "estudiantes.json"), cargar_automatico=False, filtro_bloom=True)
+    gestor.reconstruir(generar_estudiantes(500))
+    ids = ids_del_arbol(gestor)
+    capacidad = gestor._filtro.capacidad
+
+    # Altas hasta pasar la capacidad: el filtro se reconstruye más grande
+    for id_estudiante in range(10000, 10000 + capacidad):
+        gestor.agregar_estudiante(Estudiante("Ana Pérez", 20, "Arte", 1, id_estudiante))
+    assert gestor._filtro.capacidad > capacidad
+    sin_falsos_negativos(gestor)
+
+    # Bajas sueltas y por rango, hasta forzar una reconstrucción
+    for id_estudiante in ids[::2]:
+        gestor.eliminar_estudiante(id_estudiante)
+    gestor.eliminar_rango(10000, 10100)
+    sin_falsos_negativos(gestor)
+    assert gestor.buscar_estudiante(10050) is None
+
+    # Deshacer vuelve a agregar al árbol y al filtro
+    gestor.deshacer()
+    gestor.deshacer()
+    sin_falsos_negativos(gestor)
+    assert gestor.buscar_estudiante(10050) is not None
+    assert gestor.buscar_estudiante(ids[::2][-1]) is not None
+
+
+def test_lotes_fusion_y_rangos(tmp_path):
+    gestor = GestorEstudiantes(str(tmp_path / "estudiantes.json"), cargar_automatico=False, filtro_bloom=True)
+    gestor.reconstruir(generar_estudiantes(300))
+    gestor.agregar_lote([Estudiante("Luis Gómez", 30, "Arte", 2, i) for i in range(5000, 5400)])
+    sin_falsos_negativos(gestor)
+
+    otro = GestorEstudiantes(str(tmp_path / "otro.json"), cargar_automatico=False)
+    otro.reconstruir([Estudiante("Eva Ruiz", 25, "Derecho", 3, i) for i in range(7000, 7050)])
+    gestor.fusionar(otro)
+    sin_falsos_negativos(gestor)
+
+    extraido = gestor.extraer_rango(5000, 5399)
+    assert gestor.buscar_estudiante(5100) is None
+    gestor.deshacer()
+    assert extraido.total_estudiantes == 0
+    sin_falsos_negativos(gestor)
+
+
+def test_filtro_guardado_junto_al_archivo(tmp_path):
+    archivo = escribir(tmp_path / "estudiantes.json", [registro(i * 2) for i in range(1, 200)])
+    gestor = GestorEstudiantes(archivo, filtro_bloom=True)
+    assert os.path.exists(ruta_filtro(archivo))
+    gestor.agregar_estudiante(Estudiante("Ana Pérez", 20, "Arte", 1, 1001))
+    gestor.eliminar_estudiante(2)
+    gestor.guardar_en_json()
+
+    # Al volver a abrir se usa el filtro guardado, que ya tiene el alta
+    assert FiltroBloom.cargar(archivo) is not None
+    otro = GestorEstudiantes(archivo, filtro_bloom=True)
+    sin_falsos_negativos(otro)
+    assert otro.buscar_estudiante(1001) is not None
+
+    # Si el JSON cambia por fuera el filtro guardado ya no corresponde
+    escribir(archivo, [registro(i * 3) for i in range(1, 100)])
+    assert FiltroBloom.cargar(archivo) is None
+    perezoso = GestorEstudiantes(archivo, perezoso=True, filtro_bloom=True)
+    assert perezoso.buscar_estudiante(297) is not None
+    assert perezoso._perezoso is not None
+    assert FiltroBloom.cargar(archivo) is not None
@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from Logica.Arboles import NodoBK, distancia_edicion
+from Logica.Cadenas import tokens
+from Logica.Estudiante import Estudiante
+
+
+@pytest.mark.parametrize("a, b, distancia", [
+    ("", "", 0), ("", "abc", 3), ("ramirez", "ramires", 1), ("kitten", "sitting", 3), ("abc", "cab", 2),
+])
+def test_distancia_edicion(a, b, distancia):
+    assert distancia_edicion(a, b) == distancia == distancia_edicion(b, a)
+
+
+@pytest.mark.parametrize("k", [0, 1, 2])
+def test_el_arbol_bk_encuentra_exactamente_las_palabras_a_distancia_k(k):
+    aleatorio = random.Random(5)
+    palabras = {"".join(aleatorio.choice("abcde") for _ in range(aleatorio.randint(2, 6))) for _ in range(300)}
+    lista = sorted(palabras)
+    raiz = NodoBK(lista[0])
+    for palabra in lista[1:]:
+        assert raiz.agregar_hijo(palabra)
+    assert not raiz.agregar_hijo(lista[0])
+
+    for consulta in ("abc", "eeee", "badcab", "z"):
+        encontradas, comparaciones = raiz.buscar_nodo(consulta, k)
+        esperado = {(p, distancia_edicion(consulta, p)) for p in palabras if distancia_edicion(consulta, p) <= k}
+        assert set(encontradas) == esperado
+        assert comparaciones <= len(palabras)
+
+
+def test_buscar_por_nombre_difuso(gestor):
+    gestor.agregar_estudiante(Estudiante("José Ramírez", 20, "Arte", 1, 10**6))
+    gestor.agregar_estudiante(Estudiante("Jose Ramires", 20, "Arte", 1, 10**6 + 1))
+    gestor.agregar_estudiante(Estudiante("Josefa Ramos", 20, "Arte", 1, 10**6 + 2))
+
+    encontrados, pasos = gestor.buscar_por_nombre_difuso("RAMIREZ jose", contar_pasos=True)
+    ids = [e.id_estudiante for e in encontrados]
+    assert {10**6, 10**6 + 1} <= set(ids)
+    assert 10**6 + 2 not in ids
+    assert ids == sorted(ids)
+    # Todo lo encontrado está a distancia 1 por palabra
+    for estudiante in encontrados:
+        for palabra in ("ramirez", "jose"):
+            assert min(distancia_edicion(palabra, t) for t in tokens(estudiante.nombre)) <= 1
+
+    # El índice sigue a las bajas
+    gestor.eliminar_estudiante(10**6)
+    assert 10**6 not in [e.id_estudiante for e in gestor.buscar_por_nombre_difuso("ramirez")]
+    assert gestor.buscar_por_nombre_difuso("xqzw") == []
@@ -0,0 +1,57 @@
+from Logica.Cadenas import PoolCadenas, normalizar, tokens
+from Logica.Estudiante import Estudiante
+from Logica.Gestor import GestorEstudiantes
+from utilidades import registro, escribir
+
+
+def test_internar_devuelve_la_misma_instancia():
+    pool = PoolCadenas()
+    a = pool.internar("".join(["Medi", "cina"]))
+    b = pool.internar("".join(["Medic", "ina"]))
+    assert a is b
+    assert len(pool) == 1
+
+
+def test_codigos_de_categoria():
+    pool = PoolCadenas()
+    assert pool.codificar("Arte")[1] == 0
+    assert pool.codificar("Derecho")[1] == 1
+    texto, codigo = pool.codificar("".join(["Ar", "te"]))
+    assert codigo == 0 and texto is pool.categoria(0)
+    assert pool.codigo("Medicina") is None
+    assert pool.num_categorias == 2
+
+
+def test_normalizar():
+    assert normalizar("RAMÍREZ") == normalizar("ramirez") == "ramirez"
+    assert tokens("  José   Pérez ") == ["jose", "perez"]
+
+
+def test_el_gestor_comparte_las_carreras_al_cargar(tmp_path):
+    archivo = escribir(tmp_path / "e.json", [
+        registro(i, nombre="Ana Pérez", carrera="Medicina" if i % 2 else "Derecho") for i in range(1, 11)])
+    gestor = GestorEstudiantes(archivo, internar_nombres=True)
+    estudiantes = gestor.listar_estudiantes()
+    assert len({id(e.carrera) for e in estudiantes}) == 2
+    assert len({id(e.nombre) for e in estudiantes}) == 1
+    assert all(gestor.pool.categoria(e.codigo_carrera) is e.carrera for e in estudiantes)
+    assert gestor.obtener_estadisticas()["carreras"] == {"Medicina": 5, "Derecho": 5}
+
+
+def test_actualizar_la_carrera_cambia_el_codigo(tmp_path):
+    gestor = GestorEstudiantes(str(tmp_path / "e.json"), cargar_automatico=False)
+    gestor.agregar_estudiante(Estudiante("Ana", 20, "Arte", 1, 1))
+    gestor.agregar_estudiante(Estudiante("Bo", 20, "Arte", 1, 2))
+    gestor.actualizar_estudiante(2, carrera="Derecho")
+    assert gestor.buscar_estudiante(2).codigo_carrera == gestor.pool.codigo("Derecho")
+    assert [e.id_estudiante for e in gestor.buscar_por_carrera("derecho")] == [2]
+    assert gestor.obtener_estadisticas()["carreras"] == {"Arte": 1, "Derecho": 1}
+
+
+def test_pool_compartido_entre_gestores(tmp_path):
+    pool = PoolCadenas()
+    uno = GestorEstudiantes(str(tmp_path / "a.json"), cargar_automatico=False, pool=pool)
+    otro = GestorEstudiantes(str(tmp_path / "b.json"), cargar_automatico=False, pool=pool)
+    uno.agregar_estudiante(Estudiante("Ana", 20, "".join(["Me", "dicina"]), 1, 1))
+    otro.agregar_estudiante(Estudiante("Bo", 20, "".join(["Medi", "cina"]), 1, 1))
+    assert uno.buscar_estudiante(1).carrera is otro.buscar_estudiante(1).carrera
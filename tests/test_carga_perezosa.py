@@ -0,0 +1,82 @@
+import os
+
+import pytest
+
+from Logica.Estudiante import Estudiante
+from Logica.Gestor import GestorEstudiantes
+from Benchmarks.sinteticos import generar_datos
+from utilidades import registro, escribir, foto
+
+
+@pytest.fixture
+def archivo_sucio(tmp_path):
+    """Archivo con registros inválidos y un ID repetido entre los válidos."""
+    return escribir(tmp_path / "sucio.json", [
+        registro(5),
+        registro(2, edad=200),
+        {"id_estudiante": 3, "edad": 20, "carrera": "Arte", "semestre": 1},
+        registro("4", nombre=" Cy ", edad="21"),
+        registro(5, nombre="Repetido"),
+        registro(1, semestre=12),
+    ])
+
+
+def test_perezoso_y_completo_ven_los_mismos_datos(archivo_sucio):
+    completo = GestorEstudiantes(archivo_sucio)
+    perezoso = GestorEstudiantes(archivo_sucio, perezoso=True)
+    assert perezoso._perezoso is not None
+
+    assert perezoso.total_estudiantes == completo.total_estudiantes == 3
+    for id_estudiante in range(0, 7):
+        esperado = completo.buscar_estudiante(id_estudiante)
+        encontrado = perezoso.buscar_estudiante(id_estudiante)
+        assert (encontrado and encontrado.to_dict()) == (esperado and esperado.to_dict())
+    assert foto(perezoso) == foto(completo)
+    assert perezoso.obtener_estadisticas() == completo.obtener_estadisticas()
+
+
+def test_paridad_con_datos_sinteticos(tmp_path):
+    archivo = escribir(tmp_path / "e.json", list(generar_datos(2000)))
+    completo = GestorEstudiantes(archivo)
+    perezoso = GestorEstudiantes(archivo, perezoso=True, capacidad_cache=16)
+    ids = [estudiante.id_estudiante for estudiante in completo.iterar_estudiantes()]
+    for id_estudiante in ids[::37] + [ids[-1] + 1]:
+        esperado = completo.buscar_estudiante(id_estudiante)
+        encontrado = perezoso.buscar_estudiante(id_estudiante)
+        assert (encontrado and encontrado.to_dict()) == (esperado and esperado.to_dict())
+    assert foto(perezoso) == foto(completo)
+
+
+def test_escribir_materializa_con_los_mismos_datos(archivo_sucio):
+    completo = GestorEstudiantes(archivo_sucio)
+    perezoso = GestorEstudiantes(archivo_sucio, perezoso=True)
+    completo.eliminar_estudiante(4)
+    perezoso.eliminar_estudiante(4)
+    assert perezoso._perezoso is None
+    assert foto(perezoso) == foto(completo)
+
+
+def test_el_indice_se_reutiliza_y_detecta_cambios(tmp_path):
+    archivo = escribir(tmp_path / "e.json", [registro(i) for i in range(1, 20)])
+    assert GestorEstudiantes(archivo, perezoso=True).total_estudiantes == 19
+    assert os.path.exists(archivo + ".idx")
+
+    # Si el archivo cambia, el índice viejo se descarta y se rehace
+    escribir(tmp_path / "e.json", [registro(i) for i in range(1, 5)])
+    perezoso = GestorEstudiantes(archivo, perezoso=True)
+    assert perezoso.total_estudiantes == 4
+    assert perezoso.buscar_estudiante(10) is None
+
+
+def test_si_no_se_puede_materializar_se_conserva_el_indice(tmp_path):
+    archivo = escribir(tmp_path / "e.json", [registro(1)])
+    perezoso = GestorEstudiantes(archivo, perezoso=True)
+    os.rename(archivo, archivo + ".movido")
+    with pytest.raises(RuntimeError):
+        perezoso.agregar_estudiante(Estudiante("Bo", 20, "Arte", 1, 2))
+    os.rename(archivo + ".movido", archivo)
+
+    assert perezoso._perezoso is not None
+    assert perezoso.buscar_estudiante(1).nombre == "Ana Pérez"
+    assert perezoso.agregar_estudiante(Estudiante("Bo", 20, "Arte", 1, 2))
+    assert perezoso.total_estudiantes == 2
@@ -0,0 +1,124 @@
+# Pruebas de la línea de comandos no interactiva (Visual/Comandos.py)
+
+import json
+import os
+import subprocess
+import sys
+
+from Visual.Comandos import main
+from utilidades import escribir, registro
+
+
+def ejecutar(capsys, *argumentos):
+    """Corre un subcomando y devuelve (codigo, lineas JSON de stdout, lineas JSON de stderr)."""
+    codigo = main(list(argumentos))
+    salida = capsys.readouterr()
+    return (codigo, [json.loads(linea) for linea in salida.out.splitlines()],
+            [json.loads(linea) for linea in salida.err.splitlines()])
+
+
+def datos(tmp_path):
+    return escribir(tmp_path / "estudiantes.json", [registro(i, edad=20 + i % 5) for i in range(1, 11)])
+
+
+def ids_del_archivo(archivo):
+    with open(archivo, encoding="utf-8") as f:
+        return [est["id_estudiante"] for est in json.load(f)["estudiantes"]]
+
+
+def test_consultar_un_lote(tmp_path, capsys):
+    archivo = datos(tmp_path)
+    lote = tmp_path / "lote.ndjson"
+    lote.write_text("\n".join([
+        '{"op": "buscar", "id": 3}',
+        '{"op": "buscar_muchos", "ids": [1, 99]}',
+        '{"op": "rango", "id_min": 4, "id_max": 6}',
+        '',
+        '{"op": "agregar", "estudiante": {"id_estudiante": 50, "nombre": "Luis Gómez",'
+        ' "edad": 30, "carrera": "Arte", "semestre": 2}}',
+        '{"op": "eliminar", "id": 1}',
+        '{"op": "desconocida"}',
+        '{"op": "buscar"}',
+        'no es json',
+    ]), encoding="utf-8")
+
+    codigo, salida, errores = ejecutar(capsys, "-a", archivo, "consultar", str(lote))
+    assert codigo == 0
+    assert [linea["linea"] for linea in salida] == [1, 2, 3, 5, 6, 7, 8, 9]
+    assert salida[0]["resultado"]["id_estudiante"] == 3
+    assert [est and est["id_estudiante"] for est in salida[1]["resultado"]] == [1, None]
+    assert [est["id_estudiante"] for est in salida[2]["resultado"]] == [4, 5, 6]
+    assert salida[3]["ok"] and salida[4]["ok"]
+    assert not salida[5]["ok"] and "desconocida" in salida[5]["error"]
+    assert salida[6]["error"] == "Falta el campo 'id'"
+    assert not salida[7]["ok"]
+
+    resumen = next(linea["resumen"] for linea in errores if "resumen" in linea)
+    assert resumen == {"operaciones": 8, "errores": 3, "modificaciones": 2}
+    tiempos = next(linea["tiempos"] for linea in errores if "tiempos" in linea)
+    assert {"importar_modulos", "carga", "operacion", "guardado", "total"} <= set(tiempos)
+    # Las modificaciones se guardan al final
+    assert ids_del_archivo(archivo) == list(range(2, 11)) + [50]
+
+
+def test_consultar_atomico_revierte_todo(tmp_path, capsys):
+    archivo = datos(tmp_path)
+    lote = tmp_path / "lote.ndjson"
+    lote.write_text('{"op": "eliminar", "id": 1}\n'
+                    '{"op": "actualizar", "id": 2, "cambios": {"edad": 200}}\n', encoding="utf-8")
+    antes = os.path.getmtime(archivo), ids_del_archivo(archivo)
+
+    codigo, salida, errores = ejecutar(capsys, "-a", archivo, "--sin-tiempos", "consultar", "--atomico", str(lote))
+    assert codigo == 0
+    assert [linea["ok"] for linea in salida] == [True, False]
+    assert errores == [{"resumen": {"operaciones": 2, "errores": 1, "modificaciones": 0, "revertido": True}}]
+    assert (os.path.getmtime(archivo), ids_del_archivo(archivo)) == antes
+
+
+def test_consultar_desde_stdin_congelado(tmp_path, capsys, monkeypatch):
+    archivo = datos(tmp_path)
+    monkeypatch.setattr(sys, "stdin", iter(['{"op": "buscar_muchos", "ids": [2, 4]}\n']))
+    codigo, salida, _ = ejecutar(capsys, "-a", archivo, "consultar", "--congelar")
+    assert codigo == 0
+    assert [est["id_estudiante"] for est in salida[0]["resultado"]] == [2, 4]
+
+
+def test_importar_exportar_estadisticas_y_compactar(tmp_path, capsys):
+    archivo = datos(tmp_path)
+    csv = str(tmp_path / "salida.csv")
+
+    codigo, salida, _ = ejecutar(capsys, "-a", archivo, "exportar", csv)
+    assert codigo == 0 and salida[0]["filas"] == 10
+
+    otro = str(tmp_path / "otro.json")
+    codigo, salida, _ = ejecutar(capsys, "-a", otro, "importar", csv)
+    assert codigo == 0 and salida[0]["importados"] == 10
+    assert ids_del_archivo(otro) == ids_del_archivo(archivo)
+
+    codigo, salida, _ = ejecutar(capsys, "-a", otro, "estadisticas", "--memoria")
+    assert salida[0]["total"] == 10
+    assert salida[0]["carreras"] == {"Medicina": 10}
+    assert "memoria" in salida[0]
+
+    codigo, salida, _ = ejecutar(capsys, "-a", otro, "compactar")
+    assert salida[0]["estudiantes"] == 10
+    assert salida[0]["bytes_despues"] < salida[0]["bytes_antes"]
+    assert ids_del_archivo(otro) == ids_del_archivo(archivo)
+
+
+def test_errores_con_codigo_de_salida(tmp_path, capsys):
+    archivo = datos(tmp_path)
+    codigo, salida, _ = ejecutar(capsys, "-a", archivo, "importar", str(tmp_path / "no_existe.csv"))
+    assert codigo == 1
+    assert "error" in salida[0]
+
+
+def test_ayuda_sin_importar_el_gestor():
+    # Los módulos del gestor se importan recién al ejecutar un subcomando
+    codigo = ("import sys\n"
+              "from Visual.Comandos import crear_parser\n"
+              "crear_parser().format_help()\n"
+              "print('Logica.Gestor' in sys.modules)\n")
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    resultado = subprocess.run([sys.executable, "-c", codigo], cwd=raiz, capture_output=True, text=True)
+    assert resultado.stdout.strip() == "False"
@@ -0,0 +1,37 @@
+import io
+import json
+
+import pytest
+
+from Logica.Comparacion import diferencias, escribir_diferencias
+from utilidades import registro, escribir
+
+
+def test_diferencias_entre_dos_archivos(tmp_path):
+    antes = escribir(tmp_path / "antes.json", [registro(1), registro(2), registro(4, edad=30)])
+    despues = escribir(tmp_path / "despues.json", [registro(2), registro(3), registro(4, edad=31, semestre=2)])
+    resumen = {}
+    cambios = list(diferencias(antes, despues, resumen))
+
+    assert [(c["tipo"], c["id_estudiante"]) for c in cambios] == [
+        ("eliminado", 1), ("agregado", 3), ("modificado", 4)]
+    assert cambios[2]["cambios"] == {"edad": [30, 31], "semestre": [1, 2]}
+    assert resumen == {"agregado": 1, "eliminado": 1, "modificado": 1, "igual": 1}
+
+
+def test_comparar_un_gestor_con_su_archivo(tmp_path, gestor):
+    gestor.guardar_en_json()
+    ids = [e.id_estudiante for e in gestor.iterar_estudiantes()]
+    gestor.eliminar_estudiante(ids[0])
+    gestor.actualizar_estudiante(ids[1], nombre="Otro Nombre")
+
+    salida = io.StringIO()
+    resumen = escribir_diferencias(gestor.archivo_json, gestor, salida)
+    lineas = [json.loads(linea) for linea in salida.getvalue().splitlines()]
+    assert [(l["tipo"], l["id_estudiante"]) for l in lineas] == [("eliminado", ids[0]), ("modificado", ids[1])]
+    assert resumen["igual"] == 298
+
+
+def test_instantanea_desordenada():
+    with pytest.raises(ValueError):
+        list(diferencias([registro(2), registro(1)], []))
@@ -0,0 +1,73 @@
+# Pruebas del modo congelado (módulo Estatico)
+
+from Logica.Estatico import IndiceEstatico
+from Logica.Estudiante import Estudiante
+
+
+def comparar_con_el_arbol(gestor):
+    """El índice estático coincide con un recorrido del árbol."""
+    estudiantes = list(gestor.iterar_estudiantes())
+    estatico = gestor.compilar_estatico()
+    assert estatico.estudiantes == estudiantes
+    assert list(estatico.ids) == [est.id_estudiante for est in estudiantes]
+    for campo in ("edad", "semestre", "codigo_carrera"):
+        assert list(estatico.columnas[campo]) == [getattr(est, campo) for est in estudiantes]
+
+
+def test_busquedas_congeladas(gestor):
+    ids = [est.id_estudiante for est in gestor.iterar_estudiantes()]
+    gestor.congelar()
+    assert gestor.buscar_estudiante(ids[10]).id_estudiante == ids[10]
+    assert gestor.buscar_estudiante(ids[-1] + 1) is None
+    assert [est and est.id_estudiante for est in gestor.buscar_muchos([ids[3], -5, ids[0]])] == [ids[3], None, ids[0]]
+    assert [est.id_estudiante for est in gestor.buscar_rango_ids(ids[20], ids[30])] == ids[20:31]
+    assert list(gestor.compilar_estatico().columna("edad", ids[20], ids[22])) == \
+        [est.edad for est in gestor.buscar_rango_ids(ids[20], ids[22])]
+
+
+def test_escrituras_corrigen_el_indice_sin_recompilar(gestor):
+    gestor.congelar()
+    estatico = gestor.compilar_estatico()
+    primero = next(gestor.iterar_estudiantes()).id_estudiante
+
+    gestor.agregar_estudiante(Estudiante("Nueva Persona", 22, "Arte", 3, 1000))
+    gestor.agregar_estudiante(Estudiante("Primera Persona", 30, "Derecho", 5, -1))
+    gestor.eliminar_estudiante(primero)
+    gestor.actualizar_estudiante(1000, edad=40, carrera="Medicina")
+    gestor.actualizar_muchos(lambda est: est.semestre == 1, {"semestre": 2})
+
+    # La misma copia, corregida en su lugar
+    assert gestor.compilar_estatico() is estatico
+    comparar_con_el_arbol(gestor)
+    assert gestor.buscar_estudiante(1000).edad == 40
+    assert gestor.buscar_estudiante(-1).nombre == "Primera Persona"
+    assert gestor.buscar_estudiante(primero) is None
+    assert gestor.buscar_muchos([1000, primero]) == [gestor.buscar_nodo(1000).valor, None]
+
+    # Deshacer pasa por las mismas escrituras
+    for _ in range(5):
+        gestor.deshacer()
+    assert gestor.compilar_estatico() is estatico
+    comparar_con_el_arbol(gestor)
+    assert gestor.buscar_estudiante(1000) is None
+
+
+def test_operaciones_por_lotes_descartan_el_indice(gestor):
+    gestor.congelar()
+    estatico = gestor.compilar_estatico()
+    ids = [est.id_estudiante for est in gestor.iterar_estudiantes()]
+    gestor.eliminar_rango(ids[10], ids[50])
+    assert gestor.compilar_estatico() is not estatico
+    comparar_con_el_arbol(gestor)
+    assert gestor.buscar_rango_ids(ids[0], ids[60]) == \
+        [gestor.buscar_nodo(id_estudiante).valor for id_estudiante in ids[:10] + ids[51:61]]
+
+
+def test_indice_estatico_vacio():
+    estatico = IndiceEstatico([])
+    assert estatico.buscar(1) is None
+    assert estatico.buscar_muchos([1, 2]) == [None, None]
+    assert not estatico.eliminar(1)
+    estatico.insertar(Estudiante("Ana Pérez", 20, "Arte", 1, 7))
+    assert estatico.buscar(7).nombre == "Ana Pérez"
+    assert estatico.rango(0, 10) == [estatico.buscar(7)]
@@ -0,0 +1,108 @@
+import os
+
+import pytest
+
+from Logica import Fragmentos
+from Logica.Estudiante import Estudiante
+from Logica.Fragmentos import GestorFragmentado, _tarea_fragmento
+from Benchmarks.sinteticos import generar_estudiantes
+
+
+def nuevo(tmp_path, **opciones):
+    return GestorFragmentado(str(tmp_path / "fragmentos"), **opciones)
+
+
+def ids(gestor):
+    return [e.id_estudiante for e in gestor.listar_estudiantes()]
+
+
+def test_cada_id_va_a_su_rango(tmp_path):
+    gestor = nuevo(tmp_path, num_fragmentos=4, id_maximo=400)
+    assert gestor.limites == [100, 200, 300]
+    for id_estudiante in (0, 99, 100, 250, 399, 5000):
+        assert gestor.agregar_estudiante(Estudiante("Ana Pérez", 20, "Arte", 1, id_estudiante))
+    assert [ids_fragmento for ids_fragmento in (
+        [e.id_estudiante for e in f.listar_estudiantes()] for f in gestor.fragmentos)] == [
+        [0, 99], [100], [250], [399, 5000]]
+    assert gestor.fragmento_de(150) is gestor.fragmentos[1]
+    assert gestor.buscar_estudiante(250).id_estudiante == 250
+    assert not gestor.agregar_estudiante(Estudiante("Otra", 20, "Arte", 1, 250))
+
+
+def test_un_fragmento_grande_se_divide_por_la_mediana(tmp_path):
+    gestor = nuevo(tmp_path, num_fragmentos=2, id_maximo=10**6, minimo_para_dividir=50)
+    for estudiante in generar_estudiantes(60):
+        gestor.agregar_estudiante(estudiante)
+    assert len(gestor.fragmentos) == 3
+    tamanos = [f.total_estudiantes for f in gestor.fragmentos]
+    assert sum(tamanos) == 60 and max(tamanos) < 50
+    assert ids(gestor) == sorted(ids(gestor))
+
+    # Los límites quedan en disco: al reabrir se reparte igual
+    gestor.guardar_en_json()
+    reabierto = nuevo(tmp_path)
+    assert reabierto.limites == gestor.limites
+    assert ids(reabierto) == ids(gestor)
+
+
+def test_las_bajas_unen_fragmentos_chicos(tmp_path):
+    gestor = nuevo(tmp_path, num_fragmentos=4, id_maximo=400, minimo_para_dividir=1000)
+    for id_estudiante in range(400):
+        gestor.agregar_estudiante(Estudiante("Ana Pérez", 20, "Arte", 1, id_estudiante))
+    archivos = {f.archivo_json for f in gestor.fragmentos}
+
+    for id_estudiante in range(100, 190):
+        gestor.eliminar_estudiante(id_estudiante)
+    assert len(gestor.fragmentos) == 3
+    assert ids(gestor) == list(range(100)) + list(range(190, 400))
+    assert gestor.fragmento_de(195).buscar_estudiante(195) is not None
+    # El archivo del fragmento absorbido se borra
+    assert len(archivos - {f.archivo_json for f in gestor.fragmentos}) == 1
+    gestor.guardar_en_json()
+    assert ids(nuevo(tmp_path)) == ids(gestor)
+
+
+def test_rebalancear_une_fragmentos_tras_bajas_masivas(tmp_path):
+    gestor = nuevo(tmp_path, num_fragmentos=8, id_maximo=800, minimo_para_dividir=100)
+    for id_estudiante in range(0, 800, 4):
+        gestor.agregar_estudiante(Estudiante("Ana Pérez", 20, "Arte", 1, id_estudiante))
+    gestor.rebalancear()
+    # 200 estudiantes: al menos 50 por fragmento
+    assert len(gestor.fragmentos) == 4
+    assert [f.total_estudiantes for f in gestor.fragmentos] == [50] * 4
+
+    gestor.rebalancear(num_fragmentos=6)
+    assert len(gestor.fragmentos) == 6
+    assert ids(gestor) == list(range(0, 800, 4))
+    assert len([n for n in os.listdir(gestor.directorio) if n.startswith("fragmento_")]) == 6
+
+
+def test_el_trabajador_recarga_solo_si_cambia_la_version(tmp_path):
+    gestor = nuevo(tmp_path, num_fragmentos=1)
+    gestor.agregar_estudiante(Estudiante("Ana Pérez", 20, "Arte", 1, 1))
+    gestor.guardar_en_json()
+    archivo = gestor.fragmentos[0].archivo_json
+    version = gestor._versiones[archivo]
+    try:
+        assert _tarea_fragmento(archivo, version, "estadisticas", None, {archivo})["total"] == 1
+        # Reescritura del mismo tamaño: solo la versión la delata
+        gestor.actualizar_estudiante(1, edad=21)
+        gestor.guardar_en_json()
+        assert gestor._versiones[archivo] == version + 1
+        assert _tarea_fragmento(archivo, version, "estadisticas", None, {archivo})["suma_edades"] == 20
+        assert _tarea_fragmento(archivo, version + 1, "estadisticas", None, {archivo})["suma_edades"] == 21
+    finally:
+        Fragmentos._cache_trabajador.clear()
+
+
+@pytest.mark.parametrize("procesos", [0, 2])
+def test_consultas_repartidas(tmp_path, procesos):
+    with nuevo(tmp_path, num_fragmentos=3, id_maximo=900, procesos=procesos) as gestor:
+        for estudiante in generar_estudiantes(200):
+            gestor.agregar_estudiante(estudiante)
+        todos = gestor.listar_estudiantes()
+        assert gestor.obtener_estadisticas()["total"] == 200
+        assert len(gestor.buscar_por_carrera("Medicina")) == sum(e.carrera == "Medicina" for e in todos)
+
+        gestor.eliminar_estudiante(todos[0].id_estudiante)
+        assert gestor.obtener_estadisticas()["total"] == 199
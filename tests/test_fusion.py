@@ -0,0 +1,68 @@
+import pytest
+
+from Logica.Estudiante import Estudiante
+from Logica.Gestor import GestorEstudiantes
+from utilidades import foto
+
+
+def otro_gestor(tmp_path, *estudiantes):
+    otro = GestorEstudiantes(str(tmp_path / "otro.json"), cargar_automatico=False)
+    otro.reconstruir(estudiantes)
+    return otro
+
+
+def traslados(gestor, tmp_path):
+    """Un ID repetido (el primero del gestor) y dos nuevos."""
+    primero = gestor.listar_estudiantes()[0].id_estudiante
+    return otro_gestor(tmp_path,
+                       Estudiante("Repetida", 30, "Arte", 5, primero),
+                       Estudiante("Nueva Uno", 20, "Arte", 1, 10**6),
+                       Estudiante("Nueva Dos", 21, "Arte", 2, 10**6 + 1)), primero
+
+
+@pytest.mark.parametrize("politica, nombre_esperado", [("izquierda", None), ("derecha", "Repetida")])
+def test_fusionar_con_politica(gestor, tmp_path, politica, nombre_esperado):
+    otro, repetido = traslados(gestor, tmp_path)
+    nombre_original = gestor.buscar_estudiante(repetido).nombre
+    reporte = gestor.fusionar(otro, politica)
+
+    assert (reporte["agregados"], reporte["conflictos"]) == (2, [repetido])
+    assert reporte["reemplazados"] == (1 if politica == "derecha" else 0)
+    assert gestor.total_estudiantes == 302 == len(foto(gestor))
+    assert gestor.buscar_estudiante(repetido).nombre == (nombre_esperado or nombre_original)
+    assert otro.total_estudiantes == 0 and otro.raiz is None
+    ids = [e["id_estudiante"] for e in foto(gestor)]
+    assert ids == sorted(ids)
+
+
+def test_politica_error_no_toca_nada(gestor, tmp_path):
+    otro, repetido = traslados(gestor, tmp_path)
+    antes = foto(gestor)
+    reporte = gestor.fusionar(otro, "error")
+    assert reporte["conflictos"] == [repetido] and "error" in reporte
+    assert foto(gestor) == antes
+    assert otro.total_estudiantes == 3
+
+
+def test_fusionar_mantiene_los_indices_y_se_deshace(gestor, tmp_path):
+    gestor.obtener_indice("edad")
+    antes = foto(gestor)
+    otro, repetido = traslados(gestor, tmp_path)
+    gestor.fusionar(otro, "derecha")
+    assert len(gestor.top_k("edad", 1000)) == 302
+
+    assert gestor.deshacer()
+    assert foto(gestor) == antes
+    assert len(gestor.top_k("edad", 1000)) == 300
+
+
+def test_el_otro_mas_grande(tmp_path, gestor):
+    chico = otro_gestor(tmp_path, Estudiante("Solo", 20, "Arte", 1, 10**6))
+    reporte = chico.fusionar(gestor)
+    assert reporte["agregados"] == 300
+    assert chico.total_estudiantes == 301 and gestor.total_estudiantes == 0
+
+
+def test_politica_desconocida(gestor, tmp_path):
+    with pytest.raises(ValueError):
+        gestor.fusionar(otro_gestor(tmp_path), "mayoria")
@@ -0,0 +1,147 @@
+# Pruebas de deshacer, rehacer y transacciones (módulo Historial)
+
+import pytest
+
+from Logica.Estudiante import Estudiante
+from Logica.Gestor import GestorEstudiantes
+from Logica.Historial import Historial, _retiene_arbol
+from utilidades import foto, registro, escribir
+
+
+def test_deshacer_y_rehacer_cada_operacion(gestor):
+    ids = [estudiante.id_estudiante for estudiante in gestor.iterar_estudiantes()]
+    operaciones = [
+        lambda: gestor.agregar_estudiante(Estudiante("Ana Pérez", 20, "Medicina", 3, 10**7)),
+        lambda: gestor.eliminar_estudiante(ids[5]),
+        lambda: gestor.actualizar_estudiante(ids[7], nombre="Zoe", semestre=9),
+        lambda: gestor.actualizar_muchos(lambda e: e.semestre < 12, {"semestre": lambda e: e.semestre + 1}),
+        lambda: gestor.eliminar_rango(ids[100], ids[150]),
+        lambda: gestor.agregar_lote([Estudiante("X Y", 30, "Derecho", 2, 10**7 + i) for i in range(1, 40)]),
+        lambda: gestor.limpiar_datos(),
+        lambda: gestor.agregar_estudiante(Estudiante("Solo", 20, "Medicina", 3, 1)),
+    ]
+    fotos = [foto(gestor)]
+    for operacion in operaciones:
+        operacion()
+        fotos.append(foto(gestor))
+
+    for esperado in reversed(fotos[:-1]):
+        assert gestor.deshacer()
+        assert foto(gestor) == esperado
+    assert not gestor.deshacer()
+
+    for esperado in fotos[1:]:
+        assert gestor.rehacer()
+        assert foto(gestor) == esperado
+    assert not gestor.rehacer()
+
+
+def test_un_cambio_nuevo_descarta_rehacer(gestor):
+    primero = gestor.listar_estudiantes()[0].id_estudiante
+    gestor.eliminar_estudiante(primero)
+    gestor.deshacer()
+    gestor.actualizar_estudiante(primero, edad=30)
+    assert not gestor.rehacer()
+    assert gestor.buscar_estudiante(primero) is not None
+
+
+def test_transaccion_revertida_por_excepcion(gestor):
+    antes = foto(gestor)
+    ids = [e["id_estudiante"] for e in antes]
+    with pytest.raises(ValueError):
+        with gestor.transaccion():
+            gestor.eliminar_estudiante(ids[1])
+            gestor.limpiar_datos()
+            raise ValueError("falla a mitad")
+    assert foto(gestor) == antes
+    assert len(gestor.historial) == 0
+
+
+def test_transaccion_anidada_se_deshace_junta(gestor):
+    antes = foto(gestor)
+    ids = [e["id_estudiante"] for e in antes]
+    with gestor.transaccion():
+        gestor.eliminar_estudiante(ids[1])
+        with gestor.transaccion():
+            gestor.eliminar_estudiante(ids[2])
+    assert len(gestor.historial) == 1
+    assert gestor.deshacer()
+    assert foto(gestor) == antes
+    with gestor.transaccion(), pytest.raises(RuntimeError):
+        gestor.deshacer()
+
+
+def test_limite_del_historial(gestor):
+    gestor.historial = Historial(limite=3)
+    ids = [estudiante.id_estudiante for estudiante in gestor.iterar_estudiantes()]
+    for id_estudiante in ids[:5]:
+        gestor.eliminar_estudiante(id_estudiante)
+    assert sum(gestor.deshacer() for _ in range(5)) == 3
+    assert gestor.total_estudiantes == len(ids) - 2
+
+
+def test_se_retiene_un_solo_arbol(tmp_path):
+    archivo = escribir(tmp_path / "e.json", [registro(i) for i in range(1, 50)])
+    gestor = GestorEstudiantes(archivo)
+    for _ in range(5):
+        gestor.cargar_desde_json()
+        gestor.agregar_estudiante(Estudiante("Z Z", 20, "Arte", 1, 1000))
+        gestor.limpiar_datos()
+    unidades = list(gestor.historial.deshacer) + list(gestor.historial.rehacer)
+    assert sum(map(_retiene_arbol, unidades)) == 1
+    while gestor.deshacer():
+        pass
+    assert sum(map(_retiene_arbol, gestor.historial.rehacer)) <= 1
+
+
+def test_limpiar_perezoso_guardar_y_deshacer(tmp_path):
+    archivo = escribir(tmp_path / "e.json", [registro(i) for i in range(1, 50)])
+    gestor = GestorEstudiantes(archivo, perezoso=True)
+    antes = foto(gestor)
+    gestor.limpiar_datos()
+    assert gestor.total_estudiantes == 0
+    # Guardar reemplaza el archivo: deshacer no puede depender de él
+    assert gestor.guardar_en_json()
+    assert gestor.deshacer()
+    assert gestor.total_estudiantes == 49
+    assert foto(gestor) == antes
+    assert gestor.rehacer()
+    assert gestor.total_estudiantes == 0
+
+
+def test_recorte_del_historial_se_informa(tmp_path):
+    archivo = escribir(tmp_path / "e.json", [registro(i) for i in range(1, 50)])
+    gestor = GestorEstudiantes(archivo)
+    assert gestor.limpiar_datos() == 0
+    gestor.agregar_estudiante(Estudiante("Z Z", 20, "Arte", 1, 1000))
+
+    exito, reporte = gestor.cargar_desde_json(devolver_reporte=True)
+    assert exito
+    # Se descarta la unidad que retenía el árbol de 49 (el alta posterior queda)
+    assert reporte["historial_recortado"] == 1
+    assert len(gestor.historial) == 2
+    gestor.agregar_estudiante(Estudiante("Z Z", 20, "Arte", 1, 2000))
+    # Ahora se descarta la carga (retenía el árbol de 1) y el alta anterior a ella
+    assert gestor.limpiar_datos() == 2
+    assert len(gestor.historial) == 2
+    assert gestor.historial.recortadas == 3
+    assert gestor.deshacer() and gestor.deshacer()
+    assert gestor.total_estudiantes == 49
+    assert not gestor.deshacer()
+
+
+def test_lote_chico_se_deshace_junto(gestor, tmp_path):
+    antes = foto(gestor)
+    nuevos = [Estudiante("X Y", 30, "Derecho", 2, 10**7 + i) for i in range(5)]
+    assert gestor.agregar_lote(nuevos + [Estudiante("X Y", 30, "Derecho", 2, antes[0]["id_estudiante"])]) == 5
+    assert len(gestor.historial) == 1
+    assert gestor.deshacer()
+    assert foto(gestor) == antes
+
+    csv = tmp_path / "chico.csv"
+    csv.write_text("id_estudiante,nombre,edad,carrera,semestre\n"
+                   + "".join(f"{10**7 + i},Eva Ruiz,25,Arte,3\n" for i in range(4)), encoding="utf-8")
+    assert gestor.importar(str(csv))["importados"] == 4
+    assert len(gestor.historial) == 1
+    assert gestor.deshacer()
+    assert foto(gestor) == antes
@@ -0,0 +1,51 @@
+import pytest
+
+from Logica.Estudiante import Estudiante
+from Logica.Indices import IndiceOrden
+
+
+def ordenados(gestor, campo, descendente=False):
+    """Lo que deberia responder el indice, calculado recorriendo todo."""
+    estudiantes = sorted(gestor.iterar_estudiantes(), key=lambda e: (getattr(e, campo), e.id_estudiante))
+    return estudiantes[::-1] if descendente else estudiantes
+
+
+def ids(estudiantes):
+    return [e.id_estudiante for e in estudiantes]
+
+
+@pytest.mark.parametrize("campo", ["edad", "semestre"])
+def test_consultas_iguales_a_ordenar_todo(gestor, campo):
+    esperado = ordenados(gestor, campo)
+    assert ids(gestor.top_k(campo, 10)) == ids(esperado[:10])
+    # En descendente los empates también se recorren al revés
+    assert ids(gestor.top_k(campo, 10, descendente=True)) == ids(ordenados(gestor, campo, True)[:10])
+    assert gestor.k_esimo(campo, 150) is esperado[150]
+    assert gestor.k_esimo(campo, len(esperado)) is None
+    assert gestor.percentil(campo, 50) == getattr(esperado[149], campo)
+    assert gestor.percentil(campo, 100) == getattr(esperado[-1], campo)
+    assert ids(gestor.buscar_por_rango(campo, 5, 9)) == ids(e for e in esperado if 5 <= getattr(e, campo) <= 9)
+
+
+def test_el_indice_sigue_a_las_escrituras(gestor):
+    indice = gestor.obtener_indice("edad")
+    primero = gestor.listar_estudiantes()[0]
+    gestor.eliminar_estudiante(primero.id_estudiante)
+    gestor.agregar_estudiante(Estudiante("Nueva Persona", 99, "Arte", 1, 10**6))
+    segundo = gestor.listar_estudiantes()[1]
+    gestor.actualizar_estudiante(segundo.id_estudiante, edad=15)
+
+    assert gestor.obtener_indice("edad") is indice
+    assert len(indice) == gestor.total_estudiantes
+    assert ids(gestor.top_k("edad", 300)) == ids(ordenados(gestor, "edad"))
+    assert gestor.top_k("edad", 1, descendente=True)[0].id_estudiante == 10**6
+    assert indice.contar_rango(15, 15) == sum(e.edad == 15 for e in gestor.iterar_estudiantes())
+
+
+def test_campos_no_indexables(gestor):
+    with pytest.raises(ValueError):
+        IndiceOrden("nombre")
+    with pytest.raises(ValueError):
+        gestor.obtener_indice("carrera")
+    with pytest.raises(ValueError):
+        gestor.percentil("edad", 101)
@@ -0,0 +1,74 @@
+import pytest
+
+from Logica.Gestor import GestorEstudiantes
+from Logica.Intercambio import formato_de, iterar_filas
+from utilidades import foto
+
+
+def vacio(tmp_path, nombre="copia.json"):
+    return GestorEstudiantes(str(tmp_path / nombre), cargar_automatico=False)
+
+
+@pytest.mark.parametrize("nombre", ["e.csv", "e.ndjson", "e.jsonl"])
+def test_exportar_e_importar_ida_y_vuelta(tmp_path, gestor, nombre):
+    ruta = str(tmp_path / nombre)
+    assert gestor.exportar(ruta)["filas"] == 300
+
+    copia = vacio(tmp_path)
+    reporte = copia.importar(ruta)
+    assert (reporte["filas"], reporte["importados"], reporte["invalidos"], reporte["duplicados"]) == (300, 300, 0, 0)
+    assert foto(copia) == foto(gestor)
+
+    # Importar de nuevo: todos los IDs ya existen
+    assert copia.importar(ruta)["duplicados"] == 300
+
+
+def test_filas_rechazadas_con_su_linea(tmp_path):
+    ruta = tmp_path / "e.csv"
+    ruta.write_text(
+        "id_estudiante,nombre,edad,carrera,semestre\n"
+        "1,Ana Pérez,20,Medicina,3\n"
+        "2,Sin Edad,,Medicina,3\n"
+        "3,Muy Mayor,200,Medicina,3\n"
+        "4, Luis ,21,Derecho,13\n"
+        "5, Luis ,21,Derecho,12\n"
+        "1,Repetida,20,Medicina,3\n", encoding="utf-8")
+    gestor = vacio(tmp_path)
+    reporte = gestor.importar(str(ruta))
+    assert (reporte["filas"], reporte["importados"], reporte["invalidos"], reporte["duplicados"]) == (6, 2, 3, 1)
+    assert [error["linea"] for error in reporte["errores"]] == [3, 4, 5]
+    assert gestor.buscar_estudiante(5).nombre == "Luis"
+
+
+def test_ndjson_con_lineas_rotas(tmp_path):
+    ruta = tmp_path / "e.ndjson"
+    ruta.write_text(
+        '{"id_estudiante": 1, "nombre": "Ana", "edad": 20, "carrera": "Arte", "semestre": 1}\n'
+        "\n"
+        "no es json\n"
+        "[1, 2]\n", encoding="utf-8")
+    assert [fila is None for _, fila in iterar_filas(str(ruta))] == [False, True, True]
+    reporte = vacio(tmp_path).importar(str(ruta))
+    assert (reporte["importados"], reporte["invalidos"]) == (1, 2)
+    assert reporte["errores"][0] == {"linea": 3, "error": "Línea con formato inválido"}
+
+
+def test_todo_o_nada(tmp_path, gestor):
+    ruta = tmp_path / "e.ndjson"
+    ruta.write_text(
+        '{"id_estudiante": 100000, "nombre": "Ana", "edad": 20, "carrera": "Arte", "semestre": 1}\n'
+        '{"id_estudiante": 100001, "nombre": "Bo", "edad": 2, "carrera": "Arte", "semestre": 1}\n',
+        encoding="utf-8")
+    antes = foto(gestor)
+    reporte = gestor.importar(str(ruta), todo_o_nada=True)
+    assert reporte["revertido"]
+    assert foto(gestor) == antes
+
+
+def test_formato():
+    assert formato_de("A.CSV") == "csv"
+    assert formato_de("a.txt", "ndjson") == "ndjson"
+    with pytest.raises(ValueError):
+        formato_de("a.txt")
+    with pytest.raises(ValueError):
+        formato_de("a.csv", "xml")
@@ -0,0 +1,86 @@
+# Pruebas de la paginación por cursor (GestorEstudiantes.pagina y el paginador de la consola)
+
+import sys
+
+from Logica.Gestor import GestorEstudiantes
+from Visual.App import AplicacionGestorEstudiantes
+from utilidades import escribir, registro
+
+
+def recorrer(gestor, tamano, **filtros):
+    """Todas las páginas siguiendo el cursor; devuelve los IDs por página."""
+    paginas = []
+    cursor = None
+    while True:
+        estudiantes, hay_mas = gestor.pagina(cursor, tamano, **filtros)
+        paginas.append([est.id_estudiante for est in estudiantes])
+        if not hay_mas:
+            return paginas
+        cursor = estudiantes[-1].id_estudiante
+
+
+def test_las_paginas_cubren_todo_en_orden(gestor):
+    paginas = recorrer(gestor, 7)
+    ids = [id_estudiante for pagina in paginas for id_estudiante in pagina]
+    assert ids == [est.id_estudiante for est in gestor.iterar_estudiantes()]
+    assert all(len(pagina) == 7 for pagina in paginas[:-1])
+    assert 0 < len(paginas[-1]) <= 7
+
+
+def test_pagina_solo_revisa_lo_necesario(gestor):
+    ids = [est.id_estudiante for est in gestor.iterar_estudiantes()]
+    cursor = ids[200]
+    estudiantes, hay_mas, pasos = gestor.pagina(cursor, 10, contar_pasos=True)
+    assert [est.id_estudiante for est in estudiantes] == ids[201:211]
+    assert hay_mas
+    # Se llega al cursor descendiendo el árbol: solo se revisa la página y uno más
+    assert pasos == 11
+
+    # Un cursor que no existe sigue desde el siguiente ID
+    estudiantes, _ = gestor.pagina(ids[-1] + 1000)
+    assert estudiantes == []
+    estudiantes, _ = gestor.pagina(ids[5] - 1, 1)
+    assert estudiantes[0].id_estudiante == ids[5]
+
+
+def test_paginas_filtradas(gestor):
+    carrera = next(gestor.iterar_estudiantes()).carrera
+    esperados = [est.id_estudiante for est in gestor.iterar_estudiantes() if carrera in est.carrera]
+    paginas = recorrer(gestor, 4, carrera=carrera)
+    assert [id_estudiante for pagina in paginas for id_estudiante in pagina] == esperados
+
+
+def test_paginas_en_modo_perezoso(tmp_path):
+    archivo = escribir(tmp_path / "estudiantes.json", [registro(i * 3) for i in range(1, 40)])
+    perezoso = GestorEstudiantes(archivo, perezoso=True)
+    estudiantes, hay_mas = perezoso.pagina(30, 5)
+    assert [est.id_estudiante for est in estudiantes] == [33, 36, 39, 42, 45]
+    assert hay_mas
+    assert perezoso._perezoso is not None
+
+
+def test_paginador_de_la_consola(gestor, monkeypatch):
+    app = AplicacionGestorEstudiantes.__new__(AplicacionGestorEstudiantes)
+    app.gestor = gestor
+    monkeypatch.setattr(app, "limpiar_pantalla", lambda: None)
+    ids = [est.id_estudiante for est in gestor.iterar_estudiantes()]
+
+    escrituras = []
+    monkeypatch.setattr(sys.stdout, "write", escrituras.append)
+    respuestas = iter(["s", "s", "a", "i", str(ids[100]), "x", ""])
+    monkeypatch.setattr("builtins.input", lambda mensaje="": next(respuestas))
+    cursores = []
+
+    def obtener(despues_de):
+        cursores.append(despues_de)
+        return gestor.pagina(despues_de, 20, contar_pasos=True)
+
+    app.paginar("TODOS", obtener)
+    monkeypatch.undo()
+
+    # Siguiente, siguiente, anterior, ir al ID y una opción inválida
+    assert cursores == [None, ids[19], ids[39], ids[19], ids[100] - 1, ids[100] - 1]
+    # Cada página se escribe de una sola vez
+    assert len(escrituras) == len(cursores)
+    assert f"Página 3 - IDs {ids[100]}" in escrituras[4]
+    assert "Opción inválida" in escrituras[5]
@@ -0,0 +1,89 @@
+import gzip
+import json
+import lzma
+
+import pytest
+
+from Logica import Gestor as modulo_gestor
+from Logica.Gestor import GestorEstudiantes
+from Logica.Persistencia import codec_de, escribir_estudiantes, iterar_registros
+from Benchmarks.sinteticos import generar_datos
+from utilidades import foto
+
+
+@pytest.mark.parametrize("nombre, abrir", [
+    ("e.json", open), ("e.json.gz", gzip.open), ("e.json.xz", lzma.open),
+])
+@pytest.mark.parametrize("compacto", [False, True])
+def test_ida_y_vuelta(tmp_path, nombre, abrir, compacto):
+    registros = list(generar_datos(500))
+    ruta = str(tmp_path / nombre)
+    assert escribir_estudiantes(ruta, iter(registros), {"total_estudiantes": 500}, compacto) == 500
+
+    # El archivo es JSON válido con el compresor que indica la extensión
+    with abrir(ruta, "rt", encoding="utf-8") as archivo:
+        assert json.load(archivo) == {"total_estudiantes": 500, "estudiantes": registros}
+
+    encabezado = {}
+    assert list(iterar_registros(ruta, encabezado)) == registros
+    assert encabezado == {"total_estudiantes": 500}
+
+
+def test_formato_sin_compactar_igual_a_json_dump(tmp_path):
+    registros = list(generar_datos(3))
+    ruta = str(tmp_path / "e.json")
+    escribir_estudiantes(ruta, registros, {"total_estudiantes": 3})
+    esperado = json.dumps({"total_estudiantes": 3, "estudiantes": registros}, indent=4, ensure_ascii=False)
+    with open(ruta, encoding="utf-8") as archivo:
+        assert archivo.read() == esperado
+
+
+def test_lista_vacia(tmp_path):
+    ruta = str(tmp_path / "e.json.gz")
+    escribir_estudiantes(ruta, [], {"total_estudiantes": 0})
+    assert list(iterar_registros(ruta)) == []
+
+
+def test_un_error_no_deja_el_archivo_a_medias(tmp_path):
+    ruta = str(tmp_path / "e.json")
+    escribir_estudiantes(ruta, generar_datos(10), {"total_estudiantes": 10})
+
+    def registros():
+        yield from generar_datos(5)
+        raise RuntimeError("falla a mitad")
+
+    with pytest.raises(RuntimeError):
+        escribir_estudiantes(ruta, registros(), {"total_estudiantes": 5})
+    assert len(list(iterar_registros(ruta))) == 10
+    assert not (tmp_path / "e.json.tmp").exists()
+
+
+def test_codec_por_extension():
+    assert codec_de("A/B.JSON.GZ") == "gzip"
+    assert codec_de("b.json.xz") == "lzma"
+    assert codec_de("b.json") == codec_de("b.txt") == "ninguno"
+
+
+@pytest.mark.parametrize("nombre", ["e.json", "e.json.gz", "e.json.xz"])
+def test_gestor_guarda_y_carga_comprimido(tmp_path, gestor, nombre):
+    gestor.archivo_json = str(tmp_path / nombre)
+    assert gestor.guardar_en_json(compacto=True)
+    cargado = GestorEstudiantes(gestor.archivo_json)
+    assert foto(cargado) == foto(gestor)
+
+
+def test_guardar_escribe_una_sola_vez(tmp_path, gestor, monkeypatch):
+    llamadas = []
+    original = modulo_gestor.escribir_estudiantes
+
+    def contar(*argumentos, **opciones):
+        llamadas.append(argumentos[2])
+        return original(*argumentos, **opciones)
+
+    monkeypatch.setattr(modulo_gestor, "escribir_estudiantes", contar)
+    # Un contador desfasado se corrige sin reescribir el archivo
+    gestor.total_estudiantes += 1
+    assert gestor.guardar_en_json()
+    assert len(llamadas) == 1
+    assert gestor.total_estudiantes == 300
+    assert len(list(iterar_registros(gestor.archivo_json))) == 300
@@ -0,0 +1,59 @@
+import pytest
+
+from Logica.Estudiante import Estudiante
+from utilidades import foto
+
+
+def test_extraer_rango(gestor):
+    antes = foto(gestor)
+    esperado = [e for e in antes if 100 <= e["id_estudiante"] <= 400]
+    extraido = gestor.extraer_rango(100, 400)
+
+    assert foto(extraido) == esperado
+    assert extraido.total_estudiantes == len(esperado)
+    assert gestor.total_estudiantes == len(antes) - len(esperado)
+    assert foto(gestor) == [e for e in antes if e not in esperado]
+    assert gestor.buscar_estudiante(esperado[0]["id_estudiante"]) is None
+    assert gestor.eliminar_rango(100, 400) == 0
+
+
+def test_el_rango_no_se_recorre(gestor, monkeypatch):
+    antes = gestor.total_estudiantes
+    # Sin índices ni filtro: extraer no debe visitar a los estudiantes
+    monkeypatch.setattr(Estudiante, "to_dict", lambda self: pytest.fail("se recorrió el rango"))
+    assert gestor.eliminar_rango(0, 500) > 0
+    gestor.deshacer()
+    assert gestor.total_estudiantes == antes
+
+
+def test_deshacer_y_rehacer_una_extraccion(gestor):
+    gestor.obtener_indice("edad")
+    antes = foto(gestor)
+    extraido = gestor.extraer_rango(50, 300)
+    despues = foto(gestor)
+    extraidos = foto(extraido)
+
+    assert gestor.deshacer()
+    assert foto(gestor) == antes
+    assert extraido.total_estudiantes == 0
+    assert len(gestor.top_k("edad", 1000)) == len(antes)
+
+    assert gestor.rehacer()
+    assert foto(gestor) == despues
+    assert foto(extraido) == extraidos
+    assert len(gestor.top_k("edad", 1000)) == len(despues)
+
+
+def test_deshacer_con_el_rango_ocupado_fusiona(gestor):
+    antes = foto(gestor)
+    extraido = gestor.extraer_rango(50, 300)
+    # Un ID nuevo dentro del rango, aquí y en el extraído
+    gestor.agregar_estudiante(Estudiante("Nuevo Aquí", 20, "Arte", 1, 51))
+    extraido.agregar_estudiante(Estudiante("Nuevo Allá", 20, "Arte", 1, 10**6))
+    gestor.historial.deshacer.pop()  # sin deshacer el alta de 51
+
+    assert gestor.deshacer()
+    ids = [e["id_estudiante"] for e in foto(gestor)]
+    assert ids == sorted(set(e["id_estudiante"] for e in antes) | {51, 10**6})
+    assert gestor.total_estudiantes == len(ids)
+    assert extraido.total_estudiantes == 0
@@ -0,0 +1,99 @@
+# Pruebas del registro de conjuntos de datos (módulo Registro)
+
+import json
+
+from Logica.Estudiante import Estudiante
+from Logica.Registro import BYTES_POR_CADENA, RegistroConjuntos
+from utilidades import escribir, registro
+
+
+def sedes(tmp_path, cantidad, por_sede=10):
+    """Archivos de varias sedes; los nombres se repiten solo dentro de cada sede."""
+    archivos = {}
+    for numero in range(cantidad):
+        archivos[f"sede{numero}"] = escribir(tmp_path / f"sede{numero}.json", [
+            registro(i, nombre=f"Persona Sede{numero} N{i % 3}") for i in range(1, por_sede + 1)])
+    return archivos
+
+
+def nuevo_registro(tmp_path, cantidad, presupuesto, **opciones):
+    conjuntos = RegistroConjuntos(presupuesto_bytes=presupuesto,
+                                  estimar=lambda gestor: gestor.total_estudiantes * 100, **opciones)
+    for nombre, archivo in sedes(tmp_path, cantidad).items():
+        conjuntos.registrar(nombre, archivo)
+    return conjuntos
+
+
+def test_desalojo_respeta_el_presupuesto_y_guarda(tmp_path):
+    # Entran dos sedes de 10 estudiantes (más el pool con la carrera)
+    conjuntos = nuevo_registro(tmp_path, 4, 2000 + 2 * BYTES_POR_CADENA)
+    conjuntos.obtener("sede0").agregar_estudiante(Estudiante("Luis Gómez", 30, "Arte", 2, 99))
+    conjuntos.obtener("sede1")
+    assert conjuntos.abiertos() == ["sede0", "sede1"]
+
+    # sede0 creció: al pedir sede2 se descartan las menos usadas hasta entrar
+    conjuntos.obtener("sede2")
+    assert conjuntos.abiertos() == ["sede1", "sede2"]
+    assert conjuntos.bytes_en_memoria() <= conjuntos.presupuesto_bytes
+    assert conjuntos.desalojos == 1 and conjuntos.guardados == 1
+    with open(conjuntos.archivos["sede0"], encoding="utf-8") as f:
+        assert 99 in [est["id_estudiante"] for est in json.load(f)["estudiantes"]]
+
+    # Un acierto mueve la sede al final de la cola LRU
+    conjuntos.obtener("sede1")
+    conjuntos.obtener("sede3")
+    assert conjuntos.abiertos() == ["sede1", "sede3"]
+    # Las sedes sin cambios se descartan sin reescribir su archivo
+    assert conjuntos.guardados == 1
+
+    estadisticas = conjuntos.estadisticas()
+    assert estadisticas["aciertos"] == 1 and estadisticas["fallos"] == 4
+    assert estadisticas["en_memoria"] == {"sede1": 1000, "sede3": 1000}
+    assert estadisticas["bytes_en_memoria"] == 2000 + estadisticas["bytes_pool"]
+
+
+def test_la_suma_se_actualiza_en_cada_pedido(tmp_path):
+    conjuntos = nuevo_registro(tmp_path, 2, 1 << 20)
+    gestor = conjuntos.obtener("sede0")
+    conjuntos.obtener("sede1")
+    gestor.eliminar_estudiante(1)
+    # La estimación de sede0 es la de su último pedido
+    assert conjuntos.estadisticas()["en_memoria"]["sede0"] == 1000
+    conjuntos.obtener("sede0")
+    assert conjuntos.estadisticas()["en_memoria"]["sede0"] == 900
+    assert conjuntos.bytes_en_memoria() == 1900 + conjuntos.bytes_pool()
+
+    conjuntos.desalojar("sede1")
+    assert conjuntos.bytes_en_memoria() == 900 + conjuntos.bytes_pool()
+
+
+def test_guardado_fallido_deja_la_sede_abierta(tmp_path):
+    conjuntos = nuevo_registro(tmp_path, 2, 1 << 20)
+    gestor = conjuntos.obtener("sede0")
+    gestor.eliminar_estudiante(1)
+    gestor.archivo_json = str(tmp_path / "no_existe" / "sede0.json")
+    assert not conjuntos.desalojar("sede0")
+    assert conjuntos.abiertos() == ["sede0"]
+    assert conjuntos.bytes_en_memoria() == 1000 + conjuntos.bytes_pool()
+
+
+def test_nombres_de_sedes_descartadas_salen_del_pool(tmp_path):
+    conjuntos = nuevo_registro(tmp_path, 2, 1 << 20, internar_nombres=True)
+    conjuntos.obtener("sede0")
+    conjuntos.obtener("sede1")
+    # Tres nombres por sede más la carrera compartida
+    assert len(conjuntos.pool) == 7
+    assert conjuntos.bytes_pool() == 7 * BYTES_POR_CADENA
+
+    conjuntos.obtener("sede1").agregar_estudiante(Estudiante("Nombre Nuevo", 30, "Arte", 2, 99))
+    conjuntos.desalojar("sede1")
+    # Quedan los nombres de sede0 y las carreras (sus códigos siguen en uso)
+    assert len(conjuntos.pool) == 5
+    assert conjuntos.pool.codigo("Arte") is not None
+
+    # Al volver a cargarla, sus nombres se comparten de nuevo
+    gestor = conjuntos.obtener("sede1")
+    assert gestor.buscar_estudiante(1).nombre is conjuntos.pool.internar("Persona Sede1 N1")
+    conjuntos.cerrar()
+    assert conjuntos.abiertos() == []
+    assert len(conjuntos.pool) == 2
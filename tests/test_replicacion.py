@@ -0,0 +1,110 @@
+# Pruebas del registro de mutaciones y las réplicas (módulo Replicacion)
+
+import os
+
+from Logica import Replicacion
+from Logica.Estudiante import Estudiante
+from Logica.Replicacion import (Replica, publicar_mutaciones, ruta_registro_de,
+                                ruta_rotada_de, ultima_secuencia_de)
+from utilidades import foto
+
+
+def mutar(gestor, desde):
+    gestor.agregar_estudiante(Estudiante("Nueva Persona", 22, "Arte", 3, desde))
+    gestor.agregar_estudiante(Estudiante("Otra Persona", 30, "Derecho", 5, desde + 1))
+    gestor.actualizar_estudiante(4, edad=33, carrera="Arte")
+    gestor.eliminar_estudiante(7)
+    gestor.eliminar_rango(100, 120)
+
+
+def test_replica_igual_al_principal_tras_aplicar_el_registro(gestor):
+    publicar_mutaciones(gestor)
+    gestor.guardar_en_json()
+    replica = Replica(gestor.archivo_json)
+    assert foto(replica.gestor) == foto(gestor)
+
+    mutar(gestor, 1000)
+    gestor.publicador.vaciar()
+    assert replica.retraso()["operaciones"] == 5
+    replica.aplicar_pendientes()
+
+    assert foto(replica.gestor) == foto(gestor)
+    assert replica.secuencia == gestor.publicador.secuencia
+    assert replica.retraso() == {"operaciones": 0, "segundos": 0.0}
+
+    # Releer el registro desde el principio no cambia el resultado
+    replica.secuencia = 0
+    replica._registro.seek(0)
+    replica.aplicar_pendientes()
+    assert foto(replica.gestor) == foto(gestor)
+    replica.cerrar()
+    gestor.publicador.cerrar()
+
+
+def test_guardar_rota_el_registro(gestor):
+    publicar_mutaciones(gestor)
+    registro = ruta_registro_de(gestor.archivo_json)
+    gestor.guardar_en_json()
+    replica = Replica(gestor.archivo_json)
+
+    mutar(gestor, 1000)
+    gestor.publicador.vaciar()
+    # La réplica lee una parte del registro antes de que el principal guarde
+    replica.aplicar_pendientes()
+    gestor.eliminar_estudiante(10)
+    secuencia = gestor.publicador.secuencia
+    gestor.guardar_en_json()
+
+    assert os.path.getsize(registro) == 0
+    assert ultima_secuencia_de(ruta_rotada_de(registro)) == secuencia
+
+    gestor.actualizar_estudiante(13, semestre=8)
+    gestor.publicador.vaciar()
+    replica.aplicar_pendientes()
+    assert foto(replica.gestor) == foto(gestor)
+    assert replica.secuencia == secuencia + 1
+    replica.cerrar()
+
+    # Un principal que arranca con el registro recién rotado sigue la numeración
+    gestor.guardar_en_json()
+    gestor.publicador.cerrar()
+    assert publicar_mutaciones(gestor).secuencia == secuencia + 1
+    gestor.publicador.cerrar()
+
+
+def test_replica_atrasada_varias_rotaciones_recarga_el_archivo(gestor):
+    publicar_mutaciones(gestor)
+    gestor.guardar_en_json()
+    replica = Replica(gestor.archivo_json)
+
+    for desde in (1000, 2000, 3000):
+        mutar(gestor, desde)
+        gestor.guardar_en_json()
+    gestor.agregar_estudiante(Estudiante("Última Persona", 25, "Arte", 1, 4000))
+    gestor.publicador.vaciar()
+
+    replica.aplicar_pendientes()
+    assert foto(replica.gestor) == foto(gestor)
+    assert replica.secuencia == gestor.publicador.secuencia
+    replica.cerrar()
+    gestor.publicador.cerrar()
+
+
+def test_ultima_secuencia_leyendo_desde_el_final(tmp_path, monkeypatch):
+    # Bloques chicos para que las líneas queden cortadas entre bloques
+    monkeypatch.setattr(Replicacion, "TAMANO_BLOQUE_FINAL", 16)
+    ruta = str(tmp_path / "registro.log")
+    assert ultima_secuencia_de(ruta) is None
+
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        for secuencia in range(1, 51):
+            archivo.write('{"seq": %d, "op": "eliminar", "id_estudiante": %d}\n' % (secuencia, secuencia))
+    assert ultima_secuencia_de(ruta) == 50
+
+    # Una línea a medio escribir al final se ignora
+    with open(ruta, "a", encoding="utf-8") as archivo:
+        archivo.write('{"seq": 51, "op": "elim')
+    assert ultima_secuencia_de(ruta) == 50
+
+    open(ruta, "w").close()
+    assert ultima_secuencia_de(ruta) is None
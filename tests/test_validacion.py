@@ -0,0 +1,81 @@
+import pytest
+
+from Logica.Gestor import GestorEstudiantes
+from Logica.Validacion import (validar_registro, validar_campo, validar_registros,
+                               ERROR_FALTANTES, ERROR_TIPO, ERROR_EDAD, ERROR_DUPLICADO)
+from utilidades import registro, escribir, foto
+
+
+def test_registro_valido_normaliza_texto_y_numeros():
+    estudiante, error = validar_registro(registro("7", nombre="  Luis  ", edad="21"))
+    assert error is None
+    assert (estudiante.id_estudiante, estudiante.nombre, estudiante.edad) == (7, "Luis", 21)
+
+
+@pytest.mark.parametrize("datos", [
+    "no es un objeto",
+    {"id_estudiante": 1, "nombre": "Ana"},
+    registro(1, edad=True),
+    registro(1, edad="veinte"),
+    registro(1, nombre="   "),
+    registro(1, edad=14),
+    registro(1, semestre=13),
+])
+def test_registro_invalido(datos):
+    estudiante, error = validar_registro(datos)
+    assert estudiante is None
+    assert error
+
+
+@pytest.mark.parametrize("campo, valor, esperado", [
+    ("nombre", " Zoe ", "Zoe"),
+    ("edad", "30", 30),
+    ("semestre", 12, 12),
+])
+def test_validar_campo_valido(campo, valor, esperado):
+    assert validar_campo(campo, valor) == (esperado, None)
+
+
+@pytest.mark.parametrize("campo, valor", [
+    ("nombre", ""), ("carrera", None), ("edad", 101), ("semestre", 0), ("edad", "x"),
+])
+def test_validar_campo_invalido(campo, valor):
+    normalizado, error = validar_campo(campo, valor)
+    assert normalizado is None
+    assert error
+
+
+def test_validar_registros_reporte():
+    registros = [registro(3), registro(1), {"id_estudiante": 2}, registro(4, edad="x"),
+                 registro(5, edad=200), registro(1, nombre="Repetido"), registro(3)]
+    estudiantes, reporte = validar_registros(registros, max_ejemplos=1)
+
+    assert [e.id_estudiante for e in estudiantes] == [1, 3]
+    # Entre repetidos se conserva la primera aparición
+    assert estudiantes[0].nombre == "Ana Pérez"
+    assert (reporte["total"], reporte["validos"], reporte["invalidos"], reporte["duplicados"]) == (7, 2, 3, 2)
+    errores = reporte["errores"]
+    assert {clase: error["cantidad"] for clase, error in errores.items()} == {
+        ERROR_FALTANTES: 1, ERROR_TIPO: 1, ERROR_EDAD: 1, ERROR_DUPLICADO: 2}
+    assert len(errores[ERROR_DUPLICADO]["ejemplos"]) == 1
+    assert errores[ERROR_FALTANTES]["ejemplos"][0] == {
+        "posicion": 2, "mensaje": "Faltan campos: nombre, edad, carrera, semestre", "id_estudiante": 2}
+
+
+def test_cargar_devuelve_el_reporte_sin_imprimir(tmp_path, capsys):
+    archivo = escribir(tmp_path / "e.json", [registro(2), registro(1, semestre=0), registro(2, nombre="Otra")])
+    gestor = GestorEstudiantes(archivo, cargar_automatico=False)
+    exito, reporte = gestor.cargar_desde_json(devolver_reporte=True)
+    assert exito
+    assert (reporte["total"], reporte["validos"], reporte["invalidos"], reporte["duplicados"]) == (3, 1, 1, 1)
+    assert gestor.total_estudiantes == 1
+    assert capsys.readouterr().out == ""
+
+
+def test_una_carga_fallida_no_toca_los_datos(tmp_path, gestor):
+    antes = foto(gestor)
+    (tmp_path / "roto.json").write_text('{"estudiantes": [{"id_estudiante": 1,', encoding="utf-8")
+    gestor.archivo_json = str(tmp_path / "roto.json")
+    exito, reporte = gestor.cargar_desde_json(devolver_reporte=True)
+    assert not exito and reporte["error"]
+    assert foto(gestor) == antes
@@ -0,0 +1,101 @@
+import io
+import json
+import sys
+
+import pytest
+
+from Logica.Arboles import NodoAVL, construir_desde_ordenados
+from Logica.Estudiante import Estudiante
+from Visual.VisorArbol import lineas_arbol, renderizar_arbol, exportar_dot, exportar_json, OCULTO
+
+
+def estudiante(id_estudiante):
+    return Estudiante(f"Alumno {id_estudiante}", 20, "Medicina", 1, id_estudiante)
+
+
+def arbol(ids):
+    return construir_desde_ordenados([estudiante(i) for i in ids])
+
+
+def cadena(cantidad):
+    """Arbol degenerado (todos hijos derechos), mas profundo que el limite de recursion."""
+    raiz = nodo = NodoAVL(estudiante(0))
+    for id_estudiante in range(1, cantidad):
+        hijo = NodoAVL(estudiante(id_estudiante))
+        hijo.padre = nodo
+        nodo.hijos[1] = hijo
+        nodo = hijo
+    return raiz
+
+
+def ids_en(lineas):
+    return [int(linea.split("ID:")[1].split(" ")[0]) for linea in lineas if "ID:" in linea]
+
+
+def test_profundidad_maxima():
+    raiz = arbol(range(1, 16))  # perfecto, 4 niveles
+    assert len(ids_en(lineas_arbol(raiz, color=False))) == 15
+
+    lineas = list(lineas_arbol(raiz, profundidad_max=1, color=False))
+    assert sorted(ids_en(lineas)) == [4, 8, 12]
+    # Cada hijo con descendientes ocultos lo indica
+    assert sum(OCULTO in linea for linea in lineas) == 2
+
+    assert ids_en(lineas_arbol(raiz, profundidad_max=0, color=False)) == [8]
+
+
+def test_desde_la_raiz_de_un_subarbol(gestor):
+    ids = [e.id_estudiante for e in gestor.iterar_estudiantes()]
+    nodo = gestor.buscar_nodo(gestor.raiz.hijos[0].valor.id_estudiante)
+    mostrados = ids_en(lineas_arbol(nodo, color=False))
+    assert mostrados[0] == nodo.valor.id_estudiante
+    assert sorted(mostrados) == [i for i in ids if i < gestor.raiz.valor.id_estudiante]
+    assert gestor.buscar_nodo(-1) is None
+
+
+def test_renderizar_sin_color():
+    texto = renderizar_arbol(arbol([1, 2, 3]), color=False)
+    assert texto.splitlines()[0] == "ID:2 (Alumno 2) [FB:0]"
+    assert "\033" not in texto
+
+
+def test_arbol_mas_profundo_que_el_limite_de_recursion():
+    cantidad = sys.getrecursionlimit() * 3
+    raiz = cadena(cantidad)
+
+    assert len(ids_en(lineas_arbol(raiz, color=False))) == cantidad
+
+    dot = io.StringIO()
+    assert exportar_dot(raiz, dot) == cantidad
+    assert dot.getvalue().count(" -> ") == cantidad - 1
+
+    salida = io.StringIO()
+    assert exportar_json(raiz, salida) == cantidad
+    texto = salida.getvalue()
+    assert texto.count('"id_estudiante"') == cantidad
+    assert texto.rstrip().endswith("}" * cantidad)
+
+
+def test_exportar_json_respeta_la_profundidad(tmp_path):
+    archivo = tmp_path / "arbol.json"
+    assert exportar_json(arbol(range(1, 8)), str(archivo), profundidad_max=1) == 3
+    datos = json.loads(archivo.read_text(encoding="utf-8"))
+    assert datos["id_estudiante"] == 4
+    assert [datos["izquierdo"]["id_estudiante"], datos["derecho"]["id_estudiante"]] == [2, 6]
+    assert "izquierdo" not in datos["izquierdo"]
+
+
+def test_exportar_json_arbol_vacio():
+    salida = io.StringIO()
+    assert exportar_json(None, salida) == 0
+    assert json.loads(salida.getvalue()) is None
+
+
+def test_exportar_dot_con_ids_negativos():
+    raiz = arbol([-5, 0, 7])
+    salida = io.StringIO()
+    exportar_dot(raiz, salida)
+    texto = salida.getvalue()
+    assert '"n-5" [label=' in texto
+    assert '"n0" -> "n-5"' in texto
+    assert " n-5" not in texto
@@ -0,0 +1,20 @@
+# Funciones auxiliares de las pruebas
+
+import json
+
+
+def registro(id_estudiante, nombre="Ana Pérez", edad=20, carrera="Medicina", semestre=1):
+    return {"id_estudiante": id_estudiante, "nombre": nombre, "edad": edad,
+            "carrera": carrera, "semestre": semestre}
+
+
+def escribir(archivo, registros):
+    """Escribe un archivo de estudiantes con el formato del gestor."""
+    with open(archivo, "w", encoding="utf-8") as f:
+        json.dump({"total_estudiantes": len(registros), "estudiantes": registros}, f)
+    return str(archivo)
+
+
+def foto(gestor):
+    """Contenido del gestor como lista de diccionarios, en orden de ID."""
+    return [estudiante.to_dict() for estudiante in gestor.iterar_estudiantes()]